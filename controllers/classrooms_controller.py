@@ -7,6 +7,13 @@ from PyQt6.QtWidgets import QWidget, QTableWidgetItem, QMenu, QMessageBox, QTabl
 from PyQt6.QtGui import QAction
 from views.classrooms_page import ClassroomsPageUI
 from views.student_details_dialog import StudentDetailsDialog
+from models import events
+from utils.qt_events import EventBridge
+from utils.task_runner import TaskRunner
+from utils.row_prefetcher import VisibleRowPrefetcher
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class ClassroomsController(QObject):
@@ -20,6 +27,10 @@ class ClassroomsController(QObject):
         # Create view
         self.view = ClassroomsPageUI()
 
+        # Background runner for model calls
+        self.tasks = TaskRunner(self)
+        self.tasks.loading_changed.connect(self.view.set_loading)
+
         # Current state
         self.current_classroom_data = None
         self.current_section_id = None
@@ -30,6 +41,17 @@ class ClassroomsController(QObject):
         # Setup context menu
         self._setup_context_menu()
 
+        # Keep the payment column current as payments are posted or changed
+        self.events = EventBridge([
+            events.PAYMENT_POSTED, events.PAYMENT_REVERSED, events.PAYMENT_STATUS_CHANGED
+        ], self)
+        self.events.received.connect(self._on_payment_event)
+
+        # Warm the details of the students on screen so double-click opens at once
+        if hasattr(self.view, 'students_table'):
+            self.prefetcher = VisibleRowPrefetcher(self.view.students_table, self._student_id_at,
+                                                   self.db.profiles.prefetch, self)
+
         # Connect signals
         self._connect_signals()
 
@@ -39,13 +61,13 @@ class ClassroomsController(QObject):
     def _ensure_table_access(self):
         """Try to find the students table if attribute is missing"""
         if not hasattr(self.view, 'students_table'):
-            print("⚠️ 'students_table' attribute missing. Attempting to find QTableWidget...")
+            logger.warning("⚠️ 'students_table' attribute missing. Attempting to find QTableWidget...")
             tables = self.view.findChildren(QTableWidget)
             if tables:
-                print(f"✅ Found table widget: {tables[0]}")
+                logger.debug("✅ Found table widget: %s", tables[0])
                 self.view.students_table = tables[0]
             else:
-                print("❌ CRITICAL: No QTableWidget found in ClassroomsPageUI!")
+                logger.error("❌ CRITICAL: No QTableWidget found in ClassroomsPageUI!")
 
     def _setup_context_menu(self):
         """Enable right-click menu on the students table"""
@@ -56,6 +78,11 @@ class ClassroomsController(QObject):
             # NEW: Enable double-click to view details
             self.view.students_table.cellDoubleClicked.connect(self.handle_view_student_details)
 
+    def _student_id_at(self, row: int):
+        """Student id stored on the name cell of a students table row"""
+        item = self.view.students_table.item(row, 0)
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
     def _connect_signals(self):
         """Connect UI signals to controller methods"""
         if hasattr(self.view, 'view_buttons'):
@@ -85,30 +112,18 @@ class ClassroomsController(QObject):
                 self._populate_current_students()
 
     def refresh_classrooms(self):
-        """Load classroom data using Section Model"""
-        try:
-            sections = self.db.sections.get_all_sections()
-
-            self.current_classroom_data = []
-            for section in sections:
-                self.current_classroom_data.append({
-                    'id': section.id,
-                    'section': section.section_name,
-                    'strand': section.strand,
-                    'adviser_name': section.adviser_name or 'Not assigned',
-                    'adviser_email': section.adviser_email or '',
-                    'room_number': section.room_number or 'TBA',
-                    'capacity': section.capacity,
-                    'student_count': section.student_count,
-                    'available': section.available_slots
-                })
+        """Load classroom data in the background using Section Model"""
+        self.tasks.submit("sections", self.db.sections.get_all_sections,
+                          on_result=self._apply_sections)
 
+    def _apply_sections(self, sections):
+        """Show loaded sections (SectionData rows, shared with the cache) in the classrooms table"""
+        try:
+            self.current_classroom_data = sections
             self.populate_classrooms_table(self.current_classroom_data)
 
         except Exception as e:
-            print(f"Error loading classrooms: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error loading classrooms: %s", e)
 
     def populate_classrooms_table(self, classrooms):
         """Populate the classrooms table"""
@@ -122,23 +137,24 @@ class ClassroomsController(QObject):
             for row, classroom in enumerate(classrooms):
                 table.insertRow(row)
 
-                section_item = QTableWidgetItem(classroom['section'])
-                section_item.setData(Qt.ItemDataRole.UserRole, classroom['id'])
+                section_item = QTableWidgetItem(classroom.section_name)
+                section_item.setData(Qt.ItemDataRole.UserRole, classroom.id)
                 table.setItem(row, 0, section_item)
 
-                table.setItem(row, 1, QTableWidgetItem(classroom['strand']))
-                table.setItem(row, 2, QTableWidgetItem(classroom['adviser_name']))
-                table.setItem(row, 3, QTableWidgetItem(classroom['room_number']))
-                table.setItem(row, 4, QTableWidgetItem(str(classroom['student_count'])))
-                table.setItem(row, 5, QTableWidgetItem(str(classroom['capacity'])))
+                table.setItem(row, 1, QTableWidgetItem(classroom.strand))
+                table.setItem(row, 2, QTableWidgetItem(classroom.adviser_name or 'Not assigned'))
+                table.setItem(row, 3, QTableWidgetItem(classroom.room_number or 'TBA'))
+                table.setItem(row, 4, QTableWidgetItem(str(classroom.student_count)))
+                table.setItem(row, 5, QTableWidgetItem(str(classroom.capacity)))
 
-                available_item = QTableWidgetItem(str(classroom['available']))
-                if classroom['available'] <= 0:
+                available = classroom.available_slots
+                available_item = QTableWidgetItem(str(available))
+                if available <= 0:
                     available_item.setForeground(Qt.GlobalColor.red)
                 table.setItem(row, 6, available_item)
 
         except Exception as e:
-            print(f"Error populating classrooms table: {e}")
+            logger.error("Error populating classrooms table: %s", e)
 
     def filter_classrooms(self):
         """Filter the displayed classrooms"""
@@ -152,11 +168,11 @@ class ClassroomsController(QObject):
 
         filtered = []
         for c in self.current_classroom_data:
-            if strand != "All" and c['strand'] != strand:
+            if strand != "All" and c.strand != strand:
                 continue
 
             if search:
-                text = f"{c['section']} {c['adviser_name']}".lower()
+                text = f"{c.section_name} {c.adviser_name or 'Not assigned'}".lower()
                 if search not in text:
                     continue
 
@@ -164,36 +180,50 @@ class ClassroomsController(QObject):
 
         self.populate_classrooms_table(filtered)
 
+    def _load_section_students(self, section_id: int):
+        """Fetch a section and its students (runs on a worker thread)"""
+        section = self.db.sections.get_section_by_id(section_id)
+        students = self.db.students.get_students_by_section(section_id)
+        return section, students
+
     def load_classroom_students(self, section_id: int, section_name: str):
         """Load students for the selected classroom"""
+        self.current_section_id = section_id
+        self.tasks.submit(
+            "students", self._load_section_students, section_id,
+            on_result=lambda data: self._show_classroom_students(section_name, data)
+        )
+
+    def _show_classroom_students(self, section_name: str, data: tuple):
+        """Show the selected classroom once its students are loaded"""
         try:
-            self.current_section_id = section_id
-            section = self.db.sections.get_section_by_id(section_id)
+            section, students = data
 
             if hasattr(self.view, 'info_badge'):
-                student_count = len(self.db.students.get_students_by_section(section_id))
                 self.view.info_badge.setText(
-                    f"Selected: {section_name} - {student_count} students (Click 'Student Details' to view)"
+                    f"Selected: {section_name} - {len(students)} students (Click 'Student Details' to view)"
                 )
 
             if hasattr(self.view, 'view_buttons') and len(self.view.view_buttons) > 1:
                 if self.view.view_buttons[1].isChecked():
-                    self._populate_current_students()
+                    self._fill_students_table(section, students)
 
         except Exception as e:
-            print(f"Error loading students: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error loading students: %s", e)
 
     def _populate_current_students(self):
         """Helper method to populate students for current selection"""
-        try:
-            if not self.current_section_id:
-                return
+        if not self.current_section_id:
+            return
 
-            section = self.db.sections.get_section_by_id(self.current_section_id)
-            students = self.db.students.get_students_by_section(self.current_section_id)
+        self.tasks.submit(
+            "students", self._load_section_students, self.current_section_id,
+            on_result=lambda data: self._fill_students_table(*data)
+        )
 
+    def _fill_students_table(self, section, students):
+        """Populate the students table for the current selection"""
+        try:
             if section and hasattr(self.view, 'teacher_info_card'):
                 if section.adviser_name:
                     self.view.teacher_name_label.setText(f"👨‍🏫 Adviser: {section.adviser_name}")
@@ -220,12 +250,7 @@ class ClassroomsController(QObject):
                     item_strand.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                     table.setItem(row, 2, item_strand)
 
-                    payment_text = student['payment_status'] if student['payment_status'] else 'Pending'
-                    item_pay = QTableWidgetItem(payment_text)
-                    item_pay.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    if payment_text == 'Paid':
-                        item_pay.setForeground(Qt.GlobalColor.darkGreen)
-                    table.setItem(row, 3, item_pay)
+                    table.setItem(row, 3, self._payment_item(student['payment_status']))
 
                     item_date = QTableWidgetItem(str(student['date']))
                     item_date.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -235,9 +260,27 @@ class ClassroomsController(QObject):
                 self.view.info_badge.setText(f"{section.section_name} - {len(students)} students")
 
         except Exception as e:
-            print(f"Error populating students: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error populating students: %s", e)
+
+    def _payment_item(self, payment_status) -> QTableWidgetItem:
+        """Payment column cell for payment_status"""
+        payment_text = payment_status if payment_status else 'Pending'
+        item_pay = QTableWidgetItem(payment_text)
+        item_pay.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        if payment_text == 'Paid':
+            item_pay.setForeground(Qt.GlobalColor.darkGreen)
+        return item_pay
+
+    def _on_payment_event(self, topic: str, payload: dict):
+        """Show a student's new payment status in the students table"""
+        if not hasattr(self.view, 'students_table'):
+            return
+
+        table = self.view.students_table
+        for row in range(table.rowCount()):
+            if self._student_id_at(row) == payload['student_id']:
+                table.setItem(row, 3, self._payment_item(payload['payment_status']))
+                return
 
     def handle_view_student_details(self, row: int, column: int):
         """Handle double-click on student row to view details"""
@@ -251,11 +294,17 @@ class ClassroomsController(QObject):
                 self.show_student_details(student_id)
 
     def show_student_details(self, student_id: int):
+        """Load the student's profile in the background, then show the details dialog"""
+        self.tasks.submit(
+            "student_details", self.db.profiles.get_profile, student_id,
+            on_result=self._show_student_profile,
+            on_error=self._show_profile_error
+        )
+
+    def _show_student_profile(self, profile):
         """Show detailed student information dialog"""
         try:
-            student = self.db.students.get_student_by_id(student_id)
-
-            if not student:
+            if not profile:
                 QMessageBox.warning(
                     self.view,
                     "Error",
@@ -263,41 +312,39 @@ class ClassroomsController(QObject):
                 )
                 return
 
-            student_data = student.to_dict()
-            dialog = StudentDetailsDialog(student_data, self.view)
+            dialog = StudentDetailsDialog(profile.student, self.view, profile=profile)
             dialog.payment_updated.connect(self.handle_payment_update)
             dialog.exec()
 
         except Exception as e:
-            print(f"Error showing student details: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self.view,
-                "Error",
-                f"Failed to load student details:\n{str(e)}"
-            )
+            self._show_profile_error(e)
+
+    def _show_profile_error(self, error: Exception):
+        logger.error("Error showing student details: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Error",
+            f"Failed to load student details:\n{str(error)}"
+        )
 
     def handle_payment_update(self, student_id: int, new_status: str):
         """Handle payment status update from details dialog"""
-        try:
-            success = self.db.students.update_payment_status(student_id, new_status)
-
-            if success:
-                print(f"✅ Payment status updated: Student {student_id} -> {new_status}")
-                # Refresh the current view
-                self._populate_current_students()
-            else:
-                QMessageBox.critical(
-                    self.view,
-                    "Update Failed",
-                    "Failed to update payment status in database."
-                )
-
-        except Exception as e:
-            print(f"Error updating payment: {e}")
-            import traceback
-            traceback.print_exc()
+        self.tasks.submit_write(
+            "payment_status", self.db.students.update_payment_status, student_id, new_status,
+            on_result=lambda success: self._payment_status_updated(student_id, new_status, success),
+            on_error=lambda e: logger.error("Error updating payment: %s", e)
+        )
+
+    def _payment_status_updated(self, student_id: int, new_status: str, success: bool):
+        if success:
+            # The students table is updated by the PAYMENT_STATUS_CHANGED event
+            logger.debug("✅ Payment status updated: Student %s -> %s", student_id, new_status)
+        else:
+            QMessageBox.critical(
+                self.view,
+                "Update Failed",
+                "Failed to update payment status in database."
+            )
 
     def show_context_menu(self, position):
         """Show context menu with View Details option"""
@@ -338,35 +385,28 @@ class ClassroomsController(QObject):
             self.update_student_payment(row, "Pending")
 
     def update_student_payment(self, row, new_status):
-        """Update payment status in database and UI using Student Model"""
-        try:
-            students = self.db.students.get_students_by_section(self.current_section_id)
-
-            if row < len(students):
-                student_id = students[row]['id']
-                student_name = students[row]['name']
-
-                success = self.db.students.update_payment_status(student_id, new_status)
-
-                if success:
-                    payment_item = QTableWidgetItem(new_status)
-                    payment_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    if new_status == 'Paid':
-                        payment_item.setForeground(Qt.GlobalColor.darkGreen)
-                    else:
-                        payment_item.setForeground(Qt.GlobalColor.black)
-
-                    if hasattr(self.view, 'students_table'):
-                        self.view.students_table.setItem(row, 3, payment_item)
-
-                    QMessageBox.information(
-                        self.view,
-                        "Success",
-                        f"Payment status for {student_name} updated to {new_status}."
-                    )
-                else:
-                    QMessageBox.warning(self.view, "Error", "Failed to update payment status.")
+        """Update payment status in database using Student Model; the event updates the UI"""
+        student_id = self._student_id_at(row)
+        if not student_id:
+            return
+        student_name = self.view.students_table.item(row, 0).text()
 
-        except Exception as e:
-            print(f"Error updating payment: {e}")
-            QMessageBox.critical(self.view, "Error", f"An error occurred: {str(e)}")
\ No newline at end of file
+        self.tasks.submit_write(
+            "payment_status", self.db.students.update_payment_status, student_id, new_status,
+            on_result=lambda success: self._student_payment_updated(student_name, new_status, success),
+            on_error=self._show_payment_error
+        )
+
+    def _student_payment_updated(self, student_name: str, new_status: str, success: bool):
+        if success:
+            QMessageBox.information(
+                self.view,
+                "Success",
+                f"Payment status for {student_name} updated to {new_status}."
+            )
+        else:
+            QMessageBox.warning(self.view, "Error", "Failed to update payment status.")
+
+    def _show_payment_error(self, error: Exception):
+        logger.error("Error updating payment: %s", error)
+        QMessageBox.critical(self.view, "Error", f"An error occurred: {str(error)}")
\ No newline at end of file
@@ -2,14 +2,25 @@
 Dashboard Controller - Uses Student Model directly
 UPDATED: Added student details view functionality with better error handling
 """
+import copy
+import logging
+from datetime import datetime
 from PyQt6.QtCore import QObject
-from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
-                             QMessageBox, QTableWidgetItem)
+from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel,
+                             QMessageBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from views.dashboard_page import DashboardPageUI
 from views.student_details_dialog import StudentDetailsDialog
 from views.edit_student_dialog import EditStudentDialog
+from models import events
+from models.student import StudentListRow
+from utils.task_runner import TaskRunner
+from utils.qt_events import EventBridge
+from utils.row_prefetcher import VisibleRowPrefetcher
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class DashboardController(QObject):
@@ -22,12 +33,39 @@ class DashboardController(QObject):
         # Create view
         self.view = DashboardPageUI()
 
+        # Background runner for model calls
+        self.tasks = TaskRunner(self)
+        self.tasks.loading_changed.connect(self.view.set_loading)
+
+        # Last loaded stats and strand count labels, patched by model events
+        self._stats = None
+        self._strand_labels = {}
+        self._showing_recent = False
+
+        # Apply model writes as they commit instead of reloading everything
+        self.events = EventBridge([
+            events.STUDENT_ADDED, events.STUDENT_UPDATED,
+            events.STUDENT_DELETED, events.STUDENTS_IMPORTED, events.YEAR_ROLLED_OVER
+        ], self)
+        self.events.received.connect(self._on_model_event)
+
+        # Warm the details of the visible activity rows so opening one is instant
+        self.prefetcher = VisibleRowPrefetcher(
+            self.view.activity_table,
+            lambda row: self.view.activity_model.row_data(row).get('id'),
+            self.db.profiles.prefetch, self
+        )
+
         # Connect signals
         self._connect_signals()
 
         # Load initial data
         self.refresh_data()
 
+        # Build the typeahead directory once; student events keep it current
+        if not self.db.directory.loaded:
+            self.tasks.submit("directory", self.db.directory.load)
+
     def get_view(self) -> QWidget:
         return self.view
 
@@ -37,6 +75,12 @@ class DashboardController(QObject):
         if hasattr(self.view, 'search_requested'):
             self.view.search_requested.connect(self.handle_search)
 
+        if hasattr(self.view, 'typeahead_requested'):
+            self.view.typeahead_requested.connect(self.handle_typeahead)
+
+        if hasattr(self.view, 'suggestion_selected'):
+            self.view.suggestion_selected.connect(self.show_student_details)
+
         if hasattr(self.view, 'clear_search_requested'):
             self.view.clear_search_requested.connect(self.refresh_data)
 
@@ -50,70 +94,73 @@ class DashboardController(QObject):
         if hasattr(self.view, 'delete_requested'):
             self.view.delete_requested.connect(self.handle_delete_student)
 
+        if hasattr(self.view, 'view_requested'):
+            self.view.view_requested.connect(self.show_student_details)
+
         # NEW: Double-click to view details
         if hasattr(self.view, 'activity_table'):
-            self.view.activity_table.cellDoubleClicked.connect(self.handle_view_student_details)
+            self.view.activity_table.doubleClicked.connect(self.handle_view_student_details)
 
     def handle_advanced_search(self, filters: dict):
         """Handle advanced search request"""
-        try:
-            print(f"\n=== ADVANCED SEARCH ===")
-            print(f"Filters: {filters}")
+        logger.debug("Filters: %s", filters)
 
-            # Use advanced_search method from Student model
-            results = self.db.students.advanced_search(filters)
-            print(f"Found {len(results)} results")
-
-            # Display results in table
-            self.view.activity_table.setRowCount(0)
-
-            for row, data in enumerate(results):
-                student_id = data.get('id')
-                if not student_id:
-                    continue
-
-                self.view.activity_table.insertRow(row)
-
-                # Name with ID
-                name_item = QTableWidgetItem(data['full_name'])
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                name_item.setData(Qt.ItemDataRole.UserRole, student_id)
-                self.view.activity_table.setItem(row, 0, name_item)
+        # Load the first page; later pages are fetched as the table scrolls
+        self.tasks.submit(
+            "activity", self.db.students.get_students_page, filters,
+            on_result=lambda page: self._show_advanced_search_results(filters, page),
+            on_error=self._show_search_error
+        )
 
-                # Strand
-                strand_item = QTableWidgetItem(data['strand'])
-                strand_item.setFlags(strand_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                strand_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.view.activity_table.setItem(row, 1, strand_item)
+    def _next_search_page(self, filters: dict, page):
+        """Loader for the page after page, or None on the last page"""
+        if not page.has_more:
+            return None
+        return lambda: self.tasks.submit(
+            "activity", self.db.students.get_students_page, filters,
+            token=page.next_token,
+            on_result=lambda next_page: self._append_search_page(filters, next_page),
+            on_error=self._show_search_error
+        )
 
-                # Date
-                date_item = QTableWidgetItem(data['date'])
-                date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.view.activity_table.setItem(row, 2, date_item)
+    def _append_search_page(self, filters: dict, page):
+        """Add a further page of advanced search results to the table"""
+        model = self.view.activity_model
+        model.append_rows(page.rows, self._next_search_page(filters, page))
+        self.view.set_search_results_mode(model.total_rows(), model.has_more_pages())
+
+    def _show_search_error(self, error: Exception):
+        """Report a failed background search"""
+        logger.error("Error in advanced search: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Search Error",
+            f"An error occurred during search:\n{str(error)}"
+        )
 
-                # Actions
-                action_widget = self._create_action_buttons(student_id, data['full_name'])
-                self.view.activity_table.setCellWidget(row, 3, action_widget)
+    def _show_advanced_search_results(self, filters: dict, page):
+        """Display the first page of advanced search results"""
+        try:
+            logger.debug("Found %s results (more: %s)", len(page.rows), page.has_more)
 
-                self.view.activity_table.setRowHeight(row, 50)
+            # Display results in table
+            self.view.activity_model.set_rows(page.rows, self._next_search_page(filters, page))
+            self._showing_recent = False
 
             # Update header
             if hasattr(self.view, 'set_search_results_mode'):
-                self.view.set_search_results_mode(len(results))
+                self.view.set_search_results_mode(len(page.rows), page.has_more)
 
-            QMessageBox.information(
-                self.view,
-                "Search Complete",
-                f"Found {len(results)} student(s) matching your criteria"
-            )
+            if page.has_more:
+                message = (f"Showing the {len(page.rows)} newest students matching your criteria.\n"
+                           f"Scroll down to load more.")
+            else:
+                message = f"Found {len(page.rows)} student(s) matching your criteria"
+            QMessageBox.information(self.view, "Search Complete", message)
 
-            print("=== ADVANCED SEARCH COMPLETE ===\n")
 
         except Exception as e:
-            print(f"Error in advanced search: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in advanced search: %s", e)
             QMessageBox.critical(
                 self.view,
                 "Search Error",
@@ -130,41 +177,117 @@ class DashboardController(QObject):
             dialog.exec()
 
         except Exception as e:
-            print(f"Error showing advanced search: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error showing advanced search: %s", e)
 
     def refresh_data(self):
-        """Fetch latest data and update UI using Student Model"""
-        try:
-            print("\n=== DASHBOARD REFRESH DEBUG ===")
+        """Fetch latest data in the background and update UI using Student Model"""
 
-            # Get stats from Student Model
-            stats = self.db.students.get_enrollment_stats()
-            print(f"Stats retrieved: {stats}")
+        # Get stats and recent enrollments from Student Model
+        self.tasks.submit("stats", self.db.students.get_enrollment_stats,
+                          on_result=self._apply_stats)
+        self.tasks.submit("activity", self.db.students.get_recent_enrollments, 10,
+                          on_result=self._apply_recent_enrollments)
+
+    def _apply_recent_enrollments(self, enrollments: list):
+        """Show recent enrollments once loaded"""
+        self._update_activity_table(enrollments)
+        self._showing_recent = True
+
+        # Set to recent mode
+        if hasattr(self.view, 'set_recent_mode'):
+            self.view.set_recent_mode()
+
+    def _apply_stats(self, stats: dict):
+        """Update stat cards and strand grid once stats are loaded"""
+        try:
+            logger.debug("Stats retrieved: %s", stats)
+            # Own copy: stats is shared with the query cache and is patched by events
+            self._stats = copy.deepcopy(stats)
 
             # Update stat cards
-            self._update_stat_card("total_students", str(stats.get('total_enrolled', 0)))
-            available = stats.get('available_slots', 0)
-            total = stats.get('total_slots', 500)
-            self._update_stat_card("available_slots", f"{available} / {total}")
+            self._show_totals()
 
             # Update Strand Grid
             self._update_strand_grid(stats.get('by_strand', []))
 
-            # Update Activity Table
-            self._update_activity_table()
 
-            # Set to recent mode
-            if hasattr(self.view, 'set_recent_mode'):
-                self.view.set_recent_mode()
+        except Exception as e:
+            logger.exception("Error refreshing dashboard: %s", e)
 
-            print("=== DASHBOARD REFRESH COMPLETE ===\n")
+    def _show_totals(self):
+        """Show the total enrolled and available slot cards from the last stats"""
+        self._update_stat_card("total_students", str(self._stats.get('total_enrolled', 0)))
+        available = self._stats.get('available_slots', 0)
+        total = self._stats.get('total_slots', 500)
+        self._update_stat_card("available_slots", f"{available} / {total}")
 
-        except Exception as e:
-            print(f"Error refreshing dashboard: {e}")
-            import traceback
-            traceback.print_exc()
+    def _on_model_event(self, topic: str, payload: dict):
+        """Apply a committed student write to the cards and activity table"""
+        model = self.view.activity_model
+
+        # The directory only marked what changed; re-read it off the GUI thread
+        self._sync_directory()
+
+        if topic == events.YEAR_ROLLED_OVER:
+            # Grades, sections and counts changed for most students
+            self.refresh_data()
+            return
+
+        if topic == events.STUDENT_ADDED:
+            self._add_enrolled(payload['strand'], 1)
+            if self._showing_recent:
+                model.prepend_row(StudentListRow(
+                    id=payload['student_id'],
+                    full_name=payload['full_name'],
+                    strand=payload['strand'],
+                    date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                    status='Enrolled'
+                ), limit=10)
+
+        elif topic == events.STUDENT_UPDATED:
+            before, after = payload['enrolled_before'], payload['enrolled_after']
+            if before != after:
+                if before:
+                    self._add_enrolled(before[0], -1)
+                if after:
+                    self._add_enrolled(after[0], 1)
+            if self._showing_recent and payload['status'] != 'Enrolled':
+                model.remove_row(payload['student_id'])
+            else:
+                model.update_row(payload['student_id'], {
+                    'full_name': payload['full_name'],
+                    'strand': payload['strand'],
+                    'status': payload['status']
+                })
+
+        elif topic == events.STUDENT_DELETED:
+            if payload['enrolled_before']:
+                self._add_enrolled(payload['enrolled_before'][0], -1)
+            model.remove_row(payload['student_id'])
+
+        elif topic == events.STUDENTS_IMPORTED:
+            for strand, count in payload['by_strand'].items():
+                self._add_enrolled(strand, count)
+            if self._showing_recent:
+                self.tasks.submit("activity", self.db.students.get_recent_enrollments, 10,
+                                  on_result=self._apply_recent_enrollments)
+
+    def _add_enrolled(self, strand: str, delta: int):
+        """Move the enrolled counts shown for strand by delta"""
+        if not self._stats:
+            return
+
+        for row in self._stats.get('by_strand', []):
+            if row['name'] == strand:
+                row['enrolled'] += delta
+                label = self._strand_labels.get(strand)
+                if label:
+                    label.setText(f"{row['enrolled']} Students")
+                break
+
+        self._stats['total_enrolled'] = self._stats.get('total_enrolled', 0) + delta
+        self._stats['available_slots'] = self._stats.get('available_slots', 0) - delta
+        self._show_totals()
 
     def _update_stat_card(self, card_name: str, value: str):
         """Update a stat card value"""
@@ -181,11 +304,12 @@ class DashboardController(QObject):
             if value_label:
                 value_label.setText(value)
         except Exception as e:
-            print(f"Error updating stat card: {e}")
+            logger.error("Error updating stat card: %s", e)
 
     def _update_strand_grid(self, strand_data):
         """Populate the strand distribution grid"""
         # Clear existing widgets
+        self._strand_labels = {}
         while self.view.strand_grid.count():
             item = self.view.strand_grid.takeAt(0)
             if item.widget():
@@ -244,182 +368,68 @@ class DashboardController(QObject):
         count = QLabel(f"{strand['count']} Students")
         count.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
         count.setStyleSheet("color: #2C3E50; border: none; background: transparent;")
+        self._strand_labels[strand['name']] = count
 
         layout.addLayout(header)
         layout.addWidget(count)
         return widget
 
-    def _update_activity_table(self):
-        """Load recent enrollments from Student Model"""
+    def _update_activity_table(self, enrollments: list):
+        """Show recent enrollments loaded from Student Model"""
         try:
-            print("\n=== ACTIVITY TABLE UPDATE DEBUG ===")
-
-            # Get recent enrollments from Student Model
-            enrollments = self.db.students.get_recent_enrollments(10)
-            print(f"Found {len(enrollments)} recent enrollments")
-
-            # Clear and set row count
-            self.view.activity_table.setRowCount(0)
-
-            for row, data in enumerate(enrollments):
-                print(f"Row {row}: ID={data.get('id')}, Name={data.get('full_name')}")
+            logger.debug("Found %s recent enrollments", len(enrollments))
 
-                # VERIFY student_id exists
-                student_id = data.get('id')
-                if not student_id:
-                    print(f"⚠️ WARNING: Student at row {row} has no ID! Data: {data}")
-                    continue
+            self.view.activity_model.set_rows(enrollments)
 
-                self.view.activity_table.insertRow(row)
-
-                # Name - STORE ID IN USEROLE
-                name_item = QTableWidgetItem(data['full_name'])
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                name_item.setData(Qt.ItemDataRole.UserRole, student_id)  # Store ID here
-                self.view.activity_table.setItem(row, 0, name_item)
-
-                # VERIFY the ID was stored
-                stored_id = name_item.data(Qt.ItemDataRole.UserRole)
-                print(f"  → Stored ID in UserRole: {stored_id}")
-
-                # Strand
-                strand_item = QTableWidgetItem(data['strand'])
-                strand_item.setFlags(strand_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                strand_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.view.activity_table.setItem(row, 1, strand_item)
-
-                # Date
-                date_str = str(data['date']) if data['date'] else 'N/A'
-                date_item = QTableWidgetItem(date_str)
-                date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.view.activity_table.setItem(row, 2, date_item)
-
-                # Action buttons
-                action_widget = self._create_action_buttons(student_id, data['full_name'])
-                self.view.activity_table.setCellWidget(row, 3, action_widget)
-
-                # Set row height for better visibility
-                self.view.activity_table.setRowHeight(row, 50)
-
-            print(f"Activity table now has {self.view.activity_table.rowCount()} rows")
-            print("=== ACTIVITY TABLE UPDATE COMPLETE ===\n")
+            logger.debug("Activity table now has %s rows", self.view.activity_model.total_rows())
 
         except Exception as e:
-            print(f"❌ Error updating activity table: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error updating activity table: %s", e)
 
-    def _create_action_buttons(self, student_id, student_name):
-        """Create action buttons with View Details button"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-
-        # NEW: View Details button
-        view_btn = QPushButton("View")
-        view_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        view_btn.setStyleSheet("background-color: #16A085; color: white; border-radius: 4px; padding: 4px 8px;")
-        view_btn.clicked.connect(lambda: self.show_student_details(student_id))
-
-        edit_btn = QPushButton("Edit")
-        edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        edit_btn.setStyleSheet("background-color: #3498DB; color: white; border-radius: 4px; padding: 4px 8px;")
-        edit_btn.clicked.connect(lambda: self._safe_emit(self.view.edit_requested, student_id, student_name))
-
-        delete_btn = QPushButton("Delete")
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.setStyleSheet("background-color: #E74C3C; color: white; border-radius: 4px; padding: 4px 8px;")
-        delete_btn.clicked.connect(lambda: self._safe_emit(self.view.delete_requested, student_id, student_name))
-
-        layout.addWidget(view_btn)
-        layout.addWidget(edit_btn)
-        layout.addWidget(delete_btn)
-        layout.addStretch()
-        return widget
+    def handle_view_student_details(self, index):
+        """Handle double-click on table row to view student details"""
+        logger.debug("Row clicked: %s, Column: %s", index.row(), index.column())
 
-    def _safe_emit(self, signal, *args):
-        """Helper to emit signals only if they exist"""
-        try:
-            signal.emit(*args)
-        except AttributeError:
-            print("Signal not found in View")
+        # Get student ID from the row's UserRole data
+        student_id = index.data(Qt.ItemDataRole.UserRole)
+        logger.debug("Retrieved student_id from UserRole: %s", student_id)
 
-    def handle_view_student_details(self, row: int, column: int):
-        """Handle double-click on table row to view student details"""
-        print(f"\n=== DOUBLE-CLICK DEBUG ===")
-        print(f"Row clicked: {row}, Column: {column}")
-
-        # Get student ID from the first column's UserRole data
-        item = self.view.activity_table.item(row, 0)
-        if item:
-            student_id = item.data(Qt.ItemDataRole.UserRole)
-            print(f"Retrieved student_id from UserRole: {student_id}")
-            print(f"Student_id type: {type(student_id)}")
-
-            if student_id:
-                self.show_student_details(student_id)
-            else:
-                print("❌ ERROR: No student_id found in UserRole!")
-                QMessageBox.warning(
-                    self.view,
-                    "Error",
-                    "Could not retrieve student ID from table.\nPlease try refreshing the dashboard."
-                )
+        if student_id:
+            self.show_student_details(student_id)
         else:
-            print("❌ ERROR: No item found at row 0!")
+            logger.error("❌ ERROR: No student_id found in UserRole!")
+            QMessageBox.warning(
+                self.view,
+                "Error",
+                "Could not retrieve student ID from table.\nPlease try refreshing the dashboard."
+            )
 
-        print("=== DOUBLE-CLICK DEBUG END ===\n")
 
     def show_student_details(self, student_id: int):
-        """Show detailed student information dialog"""
-        print(f"\n=== SHOW STUDENT DETAILS DEBUG ===")
-        print(f"Attempting to fetch student with ID: {student_id}")
-        print(f"Student ID type: {type(student_id)}")
-
+        """Load the student's profile in the background, then show the details dialog"""
+        logger.debug("Loading profile of student %s", student_id)
+        self.tasks.submit(
+            "student_details", self.db.profiles.get_profile, student_id,
+            on_result=lambda profile: self._show_student_profile(student_id, profile),
+            on_error=self._show_profile_error
+        )
 
+    def _show_student_profile(self, student_id: int, profile):
+        """Show detailed student information dialog"""
         try:
-            # Verify database connection
-            if not self.db or not self.db.test_connection():
-                print("❌ ERROR: Database connection lost!")
-                QMessageBox.critical(
-                    self.view,
-                    "Database Error",
-                    "Lost connection to database. Please restart the application."
+            if not profile:
+                # Only check the connection once something has gone wrong
+                self.tasks.submit(
+                    "student_details", self._diagnose_missing_student, student_id,
+                    on_result=lambda connected: self._show_student_missing(student_id, connected),
+                    on_error=self._show_profile_error
                 )
                 return
 
-            # Get complete student data
-            print("Calling db.students.get_student_by_id()...")
-            student = self.db.students.get_student_by_id(student_id)
-            print(f"Result: {student}")
-
-            if not student:
-                print(f"❌ ERROR: Student with ID {student_id} not found in database!")
-
-                # Double-check if student exists at all
-                all_students = self.db.students.get_all_students()
-                student_ids = [s.id for s in all_students]
-                print(f"Available student IDs in database: {student_ids}")
-
-                QMessageBox.warning(
-                    self.view,
-                    "Student Not Found",
-                    f"Student with ID {student_id} was not found in the database.\n\n"
-                    f"This may happen if the student was recently deleted.\n"
-                    f"Please refresh the dashboard and try again."
-                )
-                return
-
-            print(f"✅ Student found: {student.full_name}")
-
-            # Convert to dictionary for dialog
-            student_data = student.to_dict()
-            print(f"Student data keys: {student_data.keys()}")
+            logger.debug("✅ Student found: %s", profile.student.full_name)
 
             # Create and show dialog
-            dialog = StudentDetailsDialog(student_data, self.view)
+            dialog = StudentDetailsDialog(profile.student, self.view, profile=profile)
 
             # Connect signals
             dialog.payment_updated.connect(self.handle_payment_update)
@@ -427,12 +437,9 @@ class DashboardController(QObject):
 
             dialog.exec()
 
-            print("=== SHOW STUDENT DETAILS COMPLETE ===\n")
 
         except Exception as e:
-            print(f"❌ EXCEPTION in show_student_details: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ EXCEPTION in show_student_details: %s", e)
             QMessageBox.critical(
                 self.view,
                 "Error",
@@ -441,39 +448,74 @@ class DashboardController(QObject):
                 f"Please check the console for more details."
             )
 
+    def _diagnose_missing_student(self, student_id: int) -> bool:
+        """Check the connection and log the ids present (runs on a worker thread)"""
+        if not self.db.test_connection():
+            return False
+
+        # Double-check if student exists at all (loads every student)
+        if logger.isEnabledFor(logging.DEBUG):
+            student_ids = [s.id for s in self.db.students.get_all_students()]
+            logger.debug("Available student IDs in database: %s", student_ids)
+        return True
+
+    def _show_student_missing(self, student_id: int, connected: bool):
+        if not connected:
+            logger.error("❌ ERROR: Database connection lost!")
+            QMessageBox.critical(
+                self.view,
+                "Database Error",
+                "Lost connection to database. Please restart the application."
+            )
+            return
+
+        logger.error("❌ ERROR: Student with ID %s not found in database!", student_id)
+        QMessageBox.warning(
+            self.view,
+            "Student Not Found",
+            f"Student with ID {student_id} was not found in the database.\n\n"
+            f"This may happen if the student was recently deleted.\n"
+            f"Please refresh the dashboard and try again."
+        )
+
+    def _show_profile_error(self, error: Exception):
+        logger.error("Error loading student profile: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Error",
+            f"Failed to load student details:\n\n{str(error)}"
+        )
+
     def handle_record_payment(self, student_id: int):
         """Handle payment recording request"""
+        # Student and payment summary; cached since the details dialog loaded them
+        self.tasks.submit(
+            "record_payment", self.db.profiles.get_profile, student_id,
+            on_result=self._show_record_payment,
+            on_error=self._show_profile_error
+        )
+
+    def _show_record_payment(self, profile):
+        """Show the payment dialog for a loaded profile"""
         try:
             from views.record_payment_dialog import RecordPaymentDialog
-            from models.payment import PaymentData
 
-            # Get student data
-            student = self.db.students.get_student_by_id(student_id)
-            if not student:
+            if not profile:
                 QMessageBox.warning(self.view, "Error", "Student not found")
                 return
 
-            student_data = student.to_dict()
-
-            # Get payment summary
-            payment_summary = self.db.payments.get_payment_summary(student_id)
-
             # Show payment dialog
-            payment_dialog = RecordPaymentDialog(student_data, payment_summary, self.view)
+            payment_dialog = RecordPaymentDialog(profile.student, profile.payment_summary, self.view)
             payment_dialog.payment_recorded.connect(self.process_payment)
             payment_dialog.exec()
 
         except Exception as e:
-            print(f"Error showing payment dialog: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error showing payment dialog: %s", e)
 
     def process_payment(self, student_id: int, payment_data: dict):
         """Process and save payment, then generate receipt"""
         try:
             from models.payment import PaymentData
-            from utils.receipt_generator import generate_payment_receipt
-            import os
 
             # Create PaymentData object
             payment = PaymentData(
@@ -490,194 +532,207 @@ class DashboardController(QObject):
             user_id = 1
 
             # Save payment to database
-            success, message, payment_id = self.db.payments.add_payment(payment, user_id)
-
-            if not success:
-                QMessageBox.critical(
-                    self.view,
-                    "Payment Failed",
-                    f"Failed to record payment:\n{message}"
-                )
-                return
-
-            # Get complete payment data for receipt
-            payments = self.db.payments.get_student_payments(student_id)
-            if not payments:
-                QMessageBox.warning(self.view, "Error", "Could not retrieve payment data")
-                return
-
-            payment_record = payments[0]  # Most recent
-
-            # Get student data
-            student = self.db.students.get_student_by_id(student_id)
-            student_data = student.to_dict()
-
-            # Generate receipt PDF
-            receipt_path = generate_payment_receipt(payment_record, student_data)
-
-            if receipt_path:
-                reply = QMessageBox.information(
-                    self.view,
-                    "✅ Payment Recorded Successfully",
-                    f"<b>Payment has been recorded successfully!</b><br><br>"
-                    f"<b>Receipt Number:</b> {message.split(': ')[1]}<br>"
-                    f"<b>Amount:</b> ₱{payment.amount:,.2f}<br><br>"
-                    f"Receipt saved to: {receipt_path}<br><br>"
-                    f"Would you like to open the receipt now?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-
-                if reply == QMessageBox.StandardButton.Yes:
-                    # Open PDF
-                    if os.name == 'nt':  # Windows
-                        os.startfile(receipt_path)
-                    elif os.name == 'posix':  # macOS/Linux
-                        import subprocess
-                        subprocess.call(('open' if os.uname().sysname == 'Darwin' else 'xdg-open', receipt_path))
-
-            # Refresh dashboard
-            self.refresh_data()
+            self.tasks.submit_write(
+                "payment", self._save_payment, student_id, payment, user_id,
+                on_result=lambda result: self._payment_saved(result, payment.amount),
+                on_error=self._show_payment_error
+            )
 
         except Exception as e:
-            print(f"Error processing payment: {e}")
-            import traceback
-            traceback.print_exc()
+            self._show_payment_error(e)
+
+    def _save_payment(self, student_id: int, payment, user_id: int):
+        """
+        Record payment and load the saved row and student for its receipt.
+        Runs on a worker thread; returns (success, message, payment_record, student).
+        """
+        success, message, payment_id = self.db.payments.add_payment(payment, user_id)
+        if not success:
+            return False, message, None, None
+
+        # Payments are listed by payment date, so pick the new one by id
+        profile = self.db.profiles.get_profile(student_id)
+        payment_record = next((p for p in profile.payments if p['id'] == payment_id), None) if profile else None
+        return True, message, payment_record, profile.student if profile else None
+
+    def _payment_saved(self, result, amount: float):
+        """Report a failed payment, or render the receipt of a recorded one"""
+        from utils.receipt_generator import generate_payment_receipt
+
+        success, message, payment_record, student = result
+        if not success:
             QMessageBox.critical(
                 self.view,
-                "Error",
-                f"Failed to process payment:\n{str(e)}"
+                "Payment Failed",
+                f"Failed to record payment:\n{message}"
             )
+            return
+
+        if not payment_record:
+            QMessageBox.warning(self.view, "Error", "Could not retrieve payment data")
+            return
+
+        # Render the receipt in the background; reportlab can take a moment
+        receipt_number = payment_record['receipt_number']
+        self.tasks.submit(
+            f"receipt:{payment_record['id']}", generate_payment_receipt, payment_record, student,
+            on_result=lambda path: self._show_payment_receipt(path, receipt_number, amount),
+            on_error=self._show_receipt_error
+        )
+
+    def _show_payment_error(self, error: Exception):
+        logger.error("Error processing payment: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Error",
+            f"Failed to process payment:\n{str(error)}"
+        )
+
+    def _show_payment_receipt(self, receipt_path, receipt_number: str, amount: float):
+        """Tell the cashier the payment went through and offer to open the receipt"""
+        if not receipt_path:
+            QMessageBox.warning(
+                self.view,
+                "Receipt Not Generated",
+                f"Payment {receipt_number} was recorded, but its receipt could not be generated."
+            )
+            return
+
+        reply = QMessageBox.information(
+            self.view,
+            "✅ Payment Recorded Successfully",
+            f"<b>Payment has been recorded successfully!</b><br><br>"
+            f"<b>Receipt Number:</b> {receipt_number}<br>"
+            f"<b>Amount:</b> ₱{amount:,.2f}<br><br>"
+            f"Receipt saved to: {receipt_path}<br><br>"
+            f"Would you like to open the receipt now?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            # Open PDF
+            import os
+            if os.name == 'nt':  # Windows
+                os.startfile(receipt_path)
+            elif os.name == 'posix':  # macOS/Linux
+                import subprocess
+                subprocess.call(('open' if os.uname().sysname == 'Darwin' else 'xdg-open', receipt_path))
+
+    def _show_receipt_error(self, error: Exception):
+        logger.error("Error generating receipt: %s", error)
+        QMessageBox.warning(self.view, "Receipt Not Generated", f"Failed to generate receipt:\n{error}")
 
     def handle_payment_update(self, student_id: int, new_status: str):
         """Handle payment status update from details dialog"""
-        try:
-            success = self.db.students.update_payment_status(student_id, new_status)
-
-            if success:
-                print(f"✅ Payment status updated: Student {student_id} -> {new_status}")
-                # Refresh the table to show updated data
-                self.refresh_data()
-            else:
-                QMessageBox.critical(
-                    self.view,
-                    "Update Failed",
-                    "Failed to update payment status in database."
-                )
+        self.tasks.submit_write(
+            "payment_status", self.db.students.update_payment_status, student_id, new_status,
+            on_result=lambda success: self._payment_status_updated(student_id, new_status, success),
+            on_error=lambda e: logger.error("Error updating payment: %s", e)
+        )
 
-        except Exception as e:
-            print(f"Error updating payment: {e}")
-            import traceback
-            traceback.print_exc()
+    def _payment_status_updated(self, student_id: int, new_status: str, success: bool):
+        if success:
+            logger.debug("✅ Payment status updated: Student %s -> %s", student_id, new_status)
+        else:
+            QMessageBox.critical(
+                self.view,
+                "Update Failed",
+                "Failed to update payment status in database."
+            )
 
     def handle_search(self, query: str):
         """Handle search requests using Student Model"""
+        logger.debug("Search query: '%s'", query)
+
+        # Search using Student Model
+        self.tasks.submit("activity", self.db.students.search_students, query,
+                          on_result=self._show_search_results)
+
+    def _sync_directory(self):
+        if self.db.directory.is_stale:
+            self.tasks.submit("directory", self.db.directory.sync)
+
+    def handle_typeahead(self, query: str):
+        """Suggest students from the in-memory directory while typing"""
+        if not self.db.directory.loaded:
+            return
+        self._sync_directory()
+
+        entries = self.db.directory.search(query, limit=10)
+        self.view.show_suggestions([
+            (entry.id, f"{entry.full_name} · {entry.lrn} · {entry.strand}")
+            for entry in entries
+        ])
+
+    def _show_search_results(self, results: list):
+        """Display quick search results"""
         try:
-            print(f"\n=== SEARCH DEBUG ===")
-            print(f"Search query: '{query}'")
-
-            # Search using Student Model
-            results = self.db.students.search_students(query)
-            print(f"Found {len(results)} search results")
+            logger.debug("Found %s search results", len(results))
 
             # Update table with search results
-            self.view.activity_table.setRowCount(0)
-            for row, data in enumerate(results):
-                print(f"Search result {row}: ID={data.get('id')}, Name={data.get('full_name')}")
-
-                student_id = data.get('id')
-                if not student_id:
-                    print(f"⚠️ WARNING: Search result at row {row} has no ID!")
-                    continue
-
-                self.view.activity_table.insertRow(row)
-
-                # Name - STORE ID
-                name_item = QTableWidgetItem(data['full_name'])
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                name_item.setData(Qt.ItemDataRole.UserRole, student_id)
-                self.view.activity_table.setItem(row, 0, name_item)
-
-                # Strand
-                strand_item = QTableWidgetItem(data['strand'])
-                strand_item.setFlags(strand_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                strand_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.view.activity_table.setItem(row, 1, strand_item)
-
-                # Date
-                date_str = str(data['date']) if data['date'] else 'N/A'
-                date_item = QTableWidgetItem(date_str)
-                date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.view.activity_table.setItem(row, 2, date_item)
-
-                action_widget = self._create_action_buttons(student_id, data['full_name'])
-                self.view.activity_table.setCellWidget(row, 3, action_widget)
-
-                # Set row height
-                self.view.activity_table.setRowHeight(row, 50)
-
+            self.view.activity_model.set_rows(results)
+            self._showing_recent = False
 
             # Update header
             if hasattr(self.view, 'set_search_results_mode'):
                 self.view.set_search_results_mode(len(results))
 
-            print("=== SEARCH COMPLETE ===\n")
 
         except Exception as e:
-            print(f"❌ Error searching students: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error searching students: %s", e)
 
     def handle_edit_student(self, student_id, current_name):
         """Handle edit student request"""
+        self.tasks.submit(
+            "edit_student", self._load_edit_data, student_id,
+            on_result=lambda data: self._show_edit_dialog(*data),
+            on_error=lambda e: logger.error("Error in handle_edit_student: %s", e)
+        )
+
+    def _load_edit_data(self, student_id: int):
+        """The student and the sections to choose from (runs on a worker thread)"""
+        return self.db.students.get_student_by_id(student_id), self.db.sections.get_all_sections()
+
+    def _show_edit_dialog(self, student, sections):
+        """Show the edit dialog for a loaded student"""
         try:
-            # Get student data
-            student = self.db.students.get_student_by_id(student_id)
             if not student:
                 QMessageBox.warning(self.view, "Error", "Student not found")
                 return
 
-            # Get available sections
-            sections = self.db.sections.get_all_sections()
-            sections_list = [s.to_dict() for s in sections]
-
             # Show edit dialog
-
-            dialog = EditStudentDialog(student.to_dict(), sections_list, self.view)
+            dialog = EditStudentDialog(student, sections, self.view)
             dialog.student_updated.connect(self.handle_student_update)
             dialog.exec()
 
         except Exception as e:
-            print(f"Error in handle_edit_student: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in handle_edit_student: %s", e)
 
     def handle_student_update(self, student_id: int, updated_data: dict):
         """Handle student update from edit dialog"""
-        try:
-            # Get current user ID (you may need to pass this from main_controller)
-            user_id = 1  # TODO: Get from session
+        # Get current user ID (you may need to pass this from main_controller)
+        user_id = 1  # TODO: Get from session
 
-            success, message = self.db.students.update_student(student_id, updated_data, user_id)
-
-            if success:
-                QMessageBox.information(
-                    self.view,
-                    "✅ Success",
-                    "Student information updated successfully!"
-                )
-                self.refresh_data()
-            else:
-                QMessageBox.critical(
-                    self.view,
-                    "Error",
-                    f"Failed to update student:\n{message}"
-                )
+        self.tasks.submit_write(
+            "update_student", self.db.students.update_student, student_id, updated_data, user_id,
+            on_result=self._student_updated,
+            on_error=lambda e: logger.error("Error updating student: %s", e)
+        )
 
-        except Exception as e:
-            print(f"Error updating student: {e}")
-            import traceback
-            traceback.print_exc()
+    def _student_updated(self, result):
+        success, message = result
+        if success:
+            QMessageBox.information(
+                self.view,
+                "✅ Success",
+                "Student information updated successfully!"
+            )
+        else:
+            QMessageBox.critical(
+                self.view,
+                "Error",
+                f"Failed to update student:\n{message}"
+            )
 
     def handle_delete_student(self, student_id, student_name):
         """Handle delete student request"""
@@ -688,8 +743,14 @@ class DashboardController(QObject):
         )
         if reply == QMessageBox.StandardButton.Yes:
             # Use Student Model to delete
-            if self.db.students.delete_student(student_id):
-                self.refresh_data()
-                QMessageBox.information(self.view, "Success", "Student deleted successfully.")
-            else:
-                QMessageBox.critical(self.view, "Error", "Failed to delete student.")
\ No newline at end of file
+            self.tasks.submit_write(
+                "delete_student", self.db.students.delete_student, student_id,
+                on_result=self._student_deleted,
+                on_error=lambda e: self._student_deleted(False)
+            )
+
+    def _student_deleted(self, success: bool):
+        if success:
+            QMessageBox.information(self.view, "Success", "Student deleted successfully.")
+        else:
+            QMessageBox.critical(self.view, "Error", "Failed to delete student.")
\ No newline at end of file
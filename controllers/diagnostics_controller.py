@@ -0,0 +1,102 @@
+"""
+Diagnostics Controller - Shows the query timings recorded by the pool
+"""
+from datetime import datetime
+from PyQt6.QtCore import QObject, Qt
+from PyQt6.QtWidgets import QWidget, QTableWidgetItem, QMessageBox
+
+from database.cache import query_cache
+from database.query_stats import query_stats
+from views.diagnostics_page import DiagnosticsPageUI
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class DiagnosticsController(QObject):
+
+    def __init__(self, database):
+        super().__init__()
+
+        # Store database reference
+        self.db = database
+
+        # Create VIEW
+        self.view = DiagnosticsPageUI()
+
+        # Connect signals
+        self.view.refresh_btn.clicked.connect(self.refresh_stats)
+        self.view.reset_btn.clicked.connect(self.reset_stats)
+
+        # Load initial data
+        self.refresh_stats()
+
+    def get_view(self) -> QWidget:
+        """Return the view widget"""
+        return self.view
+
+    def refresh_stats(self):
+        """Show the current totals"""
+        try:
+            pages = query_stats.pages()
+            statements = query_stats.statements()
+
+            self._fill(self.view.pages_table, [
+                [page['page'].capitalize(), page['visits'],
+                 page['switch_ms'] / page['visits'] if page['visits'] else 0,
+                 page['queries'], page['query_ms']]
+                for page in pages
+            ])
+            self._fill(self.view.statements_table, [
+                [row['caller'], row['statement'], row['count'], row['total_ms'],
+                 row['avg_ms'], row['max_ms'], row['rows']]
+                for row in statements
+            ])
+
+            since = datetime.fromtimestamp(query_stats.started_at).strftime("%Y-%m-%d %H:%M")
+            queries = sum(row['count'] for row in statements)
+            total_ms = sum(row['total_ms'] for row in statements)
+            self.view.summary_label.setText(
+                f"{queries} queries, {total_ms / 1000:.1f} s since {since}  •  "
+                f"cache {query_cache.hits} hits / {query_cache.misses} misses"
+            )
+            status = "" if query_stats.enabled else " (instrumentation is disabled in config)"
+            self.view.slow_log_label.setText(
+                f"Statements over {query_stats.slow_query_ms:g} ms are logged to "
+                f"{query_stats.slow_log_path}{status}"
+            )
+
+        except Exception as e:
+            logger.exception("Error refreshing diagnostics: %s", e)
+
+    def reset_stats(self):
+        """Clear the recorded totals"""
+        reply = QMessageBox.question(
+            self.view,
+            "Reset Diagnostics",
+            "Clear all recorded query timings?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            query_stats.reset()
+            self.refresh_stats()
+
+    def _fill(self, table, rows: list):
+        """Replace the table contents; numbers are right-aligned and sort numerically"""
+        table.setSortingEnabled(False)
+        table.setRowCount(len(rows))
+        for row_index, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                if isinstance(value, float):
+                    item.setData(Qt.ItemDataRole.DisplayRole, round(value, 1))
+                elif isinstance(value, int):
+                    item.setData(Qt.ItemDataRole.DisplayRole, value)
+                else:
+                    item.setText(str(value))
+                    item.setToolTip(str(value))
+                if isinstance(value, (int, float)):
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row_index, column, item)
+        table.setSortingEnabled(True)
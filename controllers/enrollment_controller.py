@@ -1,13 +1,16 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QMessageBox, QFileDialog
 from views.enrollment_page import EnrollmentPageUI
 from models.student import StudentData
 from models.section import SectionData
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
+from views.print_forms_dialog import PrintFormsDialog
+from utils.task_runner import TaskRunner
+from utils.registration_forms import render_registration_form, render_registration_forms
+from datetime import datetime
 import os
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class EnrollmentController(QObject):
@@ -22,6 +25,9 @@ class EnrollmentController(QObject):
         # Create view
         self.view = EnrollmentPageUI()
 
+        # Background runner for model calls
+        self.tasks = TaskRunner(self)
+
         # Last enrolled student
         self.last_enrolled_student = None
 
@@ -39,13 +45,22 @@ class EnrollmentController(QObject):
         self.view.enroll_btn.clicked.connect(self.enroll_student)
         self.view.clear_btn.clicked.connect(self.clear_form)
         self.view.print_btn.clicked.connect(self.print_registration_form)
+        self.view.import_btn.clicked.connect(self.import_students)
+        self.view.batch_print_btn.clicked.connect(self.show_batch_print_dialog)
 
     def update_limits_display(self):
         """Update enrollment limits display using Model data"""
-        try:
-            # Get stats from Student model
-            stats = self.db.students.get_enrollment_stats()
+        # Get stats from Student model
+        self.tasks.submit("limits", self.db.students.get_enrollment_stats,
+                          on_result=self._show_limits, on_error=self._show_limits_error)
 
+    def _show_limits_error(self, error: Exception):
+        logger.error("Error updating limits: %s", error)
+        self.view.limits_text.setText("<b>Enrollment Status:</b> Unable to load data")
+
+    def _show_limits(self, stats: dict):
+        """Show loaded enrollment stats"""
+        try:
             total_enrolled = stats['total_enrolled']
             total_slots = 500
             available = total_slots - total_enrolled
@@ -57,7 +72,7 @@ class EnrollmentController(QObject):
                 f"{available} slots remaining</span>"
             )
         except Exception as e:
-            print(f"Error updating limits: {e}")
+            logger.error("Error updating limits: %s", e)
             self.view.limits_text.setText("<b>Enrollment Status:</b> Unable to load data")
 
     def enroll_student(self):
@@ -103,6 +118,7 @@ class EnrollmentController(QObject):
                 guardian_contact=guardian_contact if guardian_contact else None,
                 strand=strand,
                 track='Academic' if strand in ['STEM', 'ABM', 'HUMSS', 'GAS'] else 'TVL',
+                grade_level=grade_level,
                 payment_status=payment_mode,
                 payment_mode=payment_mode
             )
@@ -129,73 +145,130 @@ class EnrollmentController(QObject):
                 )
                 return
 
-            # 4. BUSINESS LOGIC: Find available section
-            section = self.db.sections.find_available_section(strand)
+            # 4. SAVE USING MODEL - the seat is reserved in the same transaction
+            self.view.enroll_btn.setEnabled(False)
+            self.tasks.submit_write(
+                "enroll", self._save_enrollment, student_data,
+                on_result=self._show_enrollment_result,
+                on_error=self._show_enrollment_error
+            )
 
-            if not section:
-                QMessageBox.warning(
-                    self.view,
-                    "No Available Section",
-                    f"Sorry, there are no available sections for {strand} strand.\n\n"
-                    "All sections are full or no sections have been created."
-                )
-                return
+        except Exception as e:
+            self._show_enrollment_error(e)
 
-            # Assign section to student
-            student_data.section_id = section.id
-            student_data.section_name = section.section_name
+    def _save_enrollment(self, student_data: StudentData):
+        """
+        Enroll student_data and load the section it was seated in.
+        Runs on a worker thread; returns (success, message, student_data, section).
+        """
+        success, message = self.db.students.add_student(student_data, require_section=True)
+        if not success:
+            return False, message, student_data, None
+        return True, message, student_data, self.db.sections.get_section_by_id(student_data.section_id)
 
-            # 5. SAVE USING MODEL
-            success, message = self.db.students.add_student(student_data)
+    def _show_enrollment_result(self, result):
+        """5. UPDATE VIEW WITH RESULT"""
+        self.view.enroll_btn.setEnabled(True)
+        success, message, student_data, section = result
 
-            # 6. UPDATE VIEW WITH RESULT
-            if success:
-                # Success - show confirmation
-                QMessageBox.information(
-                    self.view,
-                    "✅ Enrollment Successful",
-                    f"<b>Student enrolled successfully!</b><br><br>"
-                    f"<b>Name:</b> {student_data.full_name}<br>"
-                    f"<b>LRN:</b> {lrn}<br>"
-                    f"<b>Gender:</b> {gender}<br>"
-                    f"<b>Grade Level:</b> {grade_level}<br>"
-                    f"<b>Strand:</b> {strand}<br>"
-                    f"<b>Section:</b> {section.section_name}<br>"
-                    f"<b>Room:</b> {section.room_number or 'TBA'}<br>"
-                    f"<b>Available Slots:</b> {section.available_slots - 1}/{section.capacity}"
-                )
+        if not success:
+            QMessageBox.critical(
+                self.view,
+                "Enrollment Failed",
+                f"<b>Unable to enroll student:</b><br><br>{message}"
+            )
+            return
 
-                # Store for printing
-                self.last_enrolled_student = student_data
+        student_data.section_name = section.section_name
 
-                # Emit signal
-                self.student_enrolled.emit()
+        # Success - show confirmation
+        QMessageBox.information(
+            self.view,
+            "✅ Enrollment Successful",
+            f"<b>Student enrolled successfully!</b><br><br>"
+            f"<b>Name:</b> {student_data.full_name}<br>"
+            f"<b>LRN:</b> {student_data.lrn}<br>"
+            f"<b>Gender:</b> {student_data.gender}<br>"
+            f"<b>Grade Level:</b> {student_data.grade_level}<br>"
+            f"<b>Strand:</b> {student_data.strand}<br>"
+            f"<b>Section:</b> {section.section_name}<br>"
+            f"<b>Room:</b> {section.room_number or 'TBA'}<br>"
+            f"<b>Available Slots:</b> {section.available_slots}/{section.capacity}"
+        )
 
-                # Update limits
-                self.update_limits_display()
+        # Store for printing
+        self.last_enrolled_student = student_data
 
-                # Clear form
-                self.clear_form()
+        # Emit signal
+        self.student_enrolled.emit()
 
-                # Enable print button
-                self.view.print_btn.setEnabled(True)
-            else:
-                # Error
-                QMessageBox.critical(
-                    self.view,
-                    "Enrollment Failed",
-                    f"<b>Unable to enroll student:</b><br><br>{message}"
-                )
+        # Update limits
+        self.update_limits_display()
 
-        except Exception as e:
-            print(f"Error during enrollment: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self.view,
-                "System Error",
-                f"An unexpected error occurred:\n\n{str(e)}"
-            )
+        # Clear form
+        self.clear_form()
+
+        # Enable print button
+        self.view.print_btn.setEnabled(True)
+
+    def _show_enrollment_error(self, error: Exception):
+        self.view.enroll_btn.setEnabled(True)
+        logger.error("Error during enrollment: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "System Error",
+            f"An unexpected error occurred:\n\n{str(error)}"
+        )
+
+    def import_students(self):
+        """Enroll applicants in bulk from a CSV or Excel file"""
+        path, _ = QFileDialog.getOpenFileName(
+            self.view,
+            "Import Students",
+            "",
+            "Student files (*.csv *.xlsx);;CSV files (*.csv);;Excel files (*.xlsx)"
+        )
+        if not path:
+            return
+
+        self.view.import_btn.setEnabled(False)
+        self.view.import_btn.setText("Importing...")
+        self.tasks.submit("import", self.db.student_importer.import_file, path,
+                          on_result=self._show_import_result, on_error=self._show_import_error)
+
+    def _finish_import(self):
+        self.view.import_btn.setEnabled(True)
+        self.view.import_btn.setText("📥 Import")
+
+    def _show_import_result(self, result):
+        """Summarize a finished import"""
+        self._finish_import()
+
+        message = f"<b>{result.imported}</b> student(s) enrolled."
+        if result.unassigned:
+            message += f"<br>{result.unassigned} could not be given a section (all sections full)."
+        if result.failed:
+            message += f"<br><br><b>{result.failed}</b> row(s) were rejected."
+            if result.error_file:
+                message += f"<br>Details saved to:<br>{result.error_file}"
+
+        if result.failed:
+            QMessageBox.warning(self.view, "Import Finished", message)
+        else:
+            QMessageBox.information(self.view, "✅ Import Successful", message)
+
+        if result.imported:
+            self.student_enrolled.emit()
+            self.update_limits_display()
+
+    def _show_import_error(self, error: Exception):
+        self._finish_import()
+        logger.error("Error importing students: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Import Failed",
+            f"<b>Unable to import students:</b><br><br>{error}"
+        )
 
     def _show_validation_errors(self, student: StudentData):
         """Show specific validation errors"""
@@ -244,7 +317,7 @@ class EnrollmentController(QObject):
         self.view.print_btn.setEnabled(False)
 
     def print_registration_form(self):
-        """Generate PDF registration form"""
+        """Generate PDF registration form for the last enrolled student"""
         if not self.last_enrolled_student:
             QMessageBox.warning(
                 self.view,
@@ -253,97 +326,94 @@ class EnrollmentController(QObject):
             )
             return
 
-        try:
-            # Generate filename
-            lrn = self.last_enrolled_student.lrn
-            filename = f"Registration_{lrn}.pdf"
-
-            # Create PDF
-            doc = SimpleDocTemplate(filename, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-
-            # Title
-            title_style = styles['Title']
-            title_style.textColor = colors.HexColor('#2C3E50')
-            story.append(Paragraph("STUDENT ENROLLMENT FORM", title_style))
-            story.append(Spacer(1, 12))
-
-            # School info
-            subtitle_style = styles['Normal']
-            subtitle_style.alignment = 1  # Center
-            story.append(Paragraph("SmartEnroll System", subtitle_style))
-            story.append(Paragraph("Student Enrollment Management", subtitle_style))
-            story.append(Spacer(1, 20))
-
-            # Student information table
-            data = [
-                ['Field', 'Information'],
-                ['LRN', self.last_enrolled_student.lrn],
-                ['Full Name', self.last_enrolled_student.full_name],
-                ['Gender', self.last_enrolled_student.gender],
-                ['Date of Birth', str(self.last_enrolled_student.date_of_birth)],
-                ['Address', self.last_enrolled_student.address],
-                ['Contact Number', self.last_enrolled_student.contact_number],
-                ['Email Address', self.last_enrolled_student.email],
-                ['Guardian Name', self.last_enrolled_student.guardian_name or 'N/A'],
-                ['Guardian Contact', self.last_enrolled_student.guardian_contact or 'N/A'],
-                ['Strand', self.last_enrolled_student.strand],
-                ['Section', self.last_enrolled_student.section_name or 'TBA'],
-                ['Payment Mode', self.last_enrolled_student.payment_mode],
-            ]
-
-            # Create table
-            table = Table(data, colWidths=[150, 350])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#365486')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ]))
-
-            story.append(table)
-            story.append(Spacer(1, 30))
-
-            # Footer
-            story.append(Paragraph("This is an official enrollment document.", styles['Normal']))
-            story.append(Spacer(1, 10))
-
-            from datetime import datetime
-            date_str = datetime.now().strftime("%B %d, %Y at %I:%M:%S %p")
-            story.append(Paragraph(f"Generated on: {date_str}", styles['Normal']))
-
-            # Build PDF
-            doc.build(story)
-
-            # Success message
-            QMessageBox.information(
-                self.view,
-                "✅ PDF Generated",
-                f"Registration form saved successfully!\n\nFile: {filename}"
-            )
+        self.view.print_btn.setEnabled(False)
+        self.tasks.submit(
+            "print_form", render_registration_form, self.last_enrolled_student,
+            on_result=self._show_form_printed, on_error=self._show_form_error
+        )
 
-            # Try to open the PDF
-            if os.name == 'nt':  # Windows
-                os.startfile(filename)
-            elif os.name == 'posix':  # macOS/Linux
-                import subprocess
-                subprocess.call(('open' if os.uname().sysname == 'Darwin' else 'xdg-open', filename))
+    def _show_form_printed(self, filename: str):
+        self.view.print_btn.setEnabled(True)
+        QMessageBox.information(
+            self.view,
+            "✅ PDF Generated",
+            f"Registration form saved successfully!\n\nFile: {filename}"
+        )
+        self._open_file(filename)
 
-        except Exception as e:
-            print(f"Error printing registration: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self.view,
-                "Print Error",
-                f"Failed to generate PDF:\n\n{str(e)}"
-            )
\ No newline at end of file
+    def _show_form_error(self, error: Exception):
+        self.view.print_btn.setEnabled(True)
+        logger.error("Error printing registration: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Print Error",
+            f"Failed to generate PDF:\n\n{str(error)}"
+        )
+
+    def show_batch_print_dialog(self):
+        """Load the sections, then ask which section or date range to print forms for"""
+        self.tasks.submit("sections", self.db.sections.get_all_sections,
+                          on_result=self._show_batch_print_dialog,
+                          on_error=self._show_forms_error)
+
+    def _show_batch_print_dialog(self, sections: list):
+        dialog = PrintFormsDialog(sections, self.view)
+        dialog.print_requested.connect(self.print_registration_forms)
+        dialog.exec()
+
+    def print_registration_forms(self, selection: dict):
+        """Render the forms for a section and/or date range into one file in the background"""
+        path, _ = QFileDialog.getSaveFileName(
+            self.view,
+            "Save Registration Forms",
+            f"Registration_Forms_{datetime.now().strftime('%Y%m%d')}.pdf",
+            "PDF Files (*.pdf)"
+        )
+        if not path:
+            return
+        if not path.lower().endswith('.pdf'):
+            path += ".pdf"
+
+        self.view.batch_print_btn.setEnabled(False)
+        self.view.set_forms_progress(0, 0)
+        self.tasks.submit(
+            "print_forms", self._render_forms, selection, path,
+            on_progress=lambda value: self.view.set_forms_progress(*value),
+            on_result=self._show_forms_printed,
+            on_error=self._show_forms_error
+        )
+
+    def _render_forms(self, selection: dict, path: str, progress=None):
+        """Load the students and render their forms (runs on a worker thread)"""
+        students = self.db.students.get_registration_form_rows(**selection)
+        return len(students), render_registration_forms(students, path, progress=progress)
+
+    def _show_forms_printed(self, result):
+        count, path = result
+        self.view.batch_print_btn.setEnabled(True)
+        self.view.hide_forms_progress()
+        QMessageBox.information(
+            self.view,
+            "✅ Forms Generated",
+            f"{count} registration form(s) saved to:\n{path}"
+        )
+        if path.lower().endswith('.pdf'):
+            self._open_file(path)
+
+    def _show_forms_error(self, error: Exception):
+        self.view.batch_print_btn.setEnabled(True)
+        self.view.hide_forms_progress()
+        logger.error("Error printing registration forms: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Print Error",
+            f"Failed to generate registration forms:\n\n{str(error)}"
+        )
+
+    def _open_file(self, filename: str):
+        """Open a generated file with the system viewer"""
+        if os.name == 'nt':  # Windows
+            os.startfile(filename)
+        elif os.name == 'posix':  # macOS/Linux
+            import subprocess
+            subprocess.call(('open' if os.uname().sysname == 'Darwin' else 'xdg-open', filename))
\ No newline at end of file
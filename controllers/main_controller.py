@@ -1,15 +1,19 @@
 """
 Main Controller - Initializes MVC Architecture
 Creates Database instance which initializes all Models,
-then creates Controllers with Database reference
+then creates page Controllers with Database reference. Pages are built on
+first visit, and the rest are pre-warmed one at a time once the app is idle.
 """
 import sys
+import time
 from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QStackedWidget, QMessageBox
-from PyQt6.QtCore import QObject, Qt
+from PyQt6.QtCore import QObject, Qt, QTimer
 from PyQt6.QtGui import QIcon
 
 # Import centralized Database
 from models.database import Database
+from database.config import UI_CONFIG
+from database.query_stats import query_stats
 
 # Import Controllers
 from controllers.login_controller import LoginController
@@ -20,19 +24,35 @@ from controllers.classrooms_controller import ClassroomsController
 from controllers.reports_controller import ReportsController
 from controllers.management_controller import ManagementController
 from controllers.users_controller import UsersController
+from controllers.diagnostics_controller import DiagnosticsController
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class MainController(QObject):
 
+    # Page name -> (controller attribute, controller class, refresh method)
+    PAGES = {
+        "dashboard": ("dashboard_controller", DashboardController, "refresh_data"),
+        "enrollment": ("enrollment_controller", EnrollmentController, None),
+        "reports": ("reports_controller", ReportsController, "refresh_data"),
+        "classrooms": ("classrooms_controller", ClassroomsController, "refresh_classrooms"),
+        "management": ("management_controller", ManagementController, "refresh_all_data"),
+        "users": ("users_controller", UsersController, "refresh_users"),
+        "diagnostics": ("diagnostics_controller", DiagnosticsController, "refresh_stats"),
+    }
+
+    # Pages only admins may open
+    ADMIN_PAGES = ("users", "diagnostics")
+
     def __init__(self):
         super().__init__()
 
-        print("=" * 60)
-        print("Initializing SmartEnroll - MVC Architecture")
-        print("=" * 60)
+        logger.info("Initializing SmartEnroll - MVC Architecture")
 
         # ✨ STEP 1: Initialize centralized Database
-        print("\n📦 Initializing Database...")
+        logger.info("📦 Initializing Database...")
         self.database = Database()
 
         # Test connection
@@ -47,19 +67,26 @@ class MainController(QObject):
             )
             sys.exit(1)
 
-        print("✅ Database initialized successfully!")
+        logger.info("✅ Database initialized successfully!")
 
-        # Initialize tables
-        print("\n🔧 Initializing database tables...")
-        self.database.initialize_tables()
+        # Apply pending schema migrations
+        logger.info("🔧 Checking database schema...")
+        if not self.database.migrate_schema():
+            QMessageBox.critical(
+                None,
+                "Database Error",
+                "The database schema could not be updated.\n\n"
+                "See the console output for details."
+            )
+            sys.exit(1)
 
         # ✨ STEP 2: Create login controller (doesn't need database yet)
-        print("\n🔐 Creating login controller...")
+        logger.debug("🔐 Creating login controller...")
         self.login_controller = LoginController(self.database)
         self.login_controller.login_successful.connect(self.on_login_success)
 
         # Show login window
-        print("📱 Showing login window...")
+        logger.debug("📱 Showing login window...")
         self.login_controller.get_view().show()
 
         # Main window will be created after successful login
@@ -71,11 +98,15 @@ class MainController(QObject):
         self.classrooms_controller = None
         self.management_controller = None
         self.users_controller = None
+        self.diagnostics_controller = None
         self.current_user = None
 
+        # Milliseconds each page took to construct, for startup tuning
+        self.page_build_times = {}
+
     def on_login_success(self, user_info: dict):
         """Handle successful login"""
-        print(f"\n✅ Login successful: {user_info['username']} (Role: {user_info['role']})")
+        logger.info("✅ Login successful: %s (Role: %s)", user_info['username'], user_info['role'])
 
         # Store current user
         self.current_user = user_info
@@ -83,13 +114,15 @@ class MainController(QObject):
         # Hide login window
         self.login_controller.get_view().hide()
 
-        # Create main window with all controllers
+        # Create main window; pages are built as they are opened
         self.create_main_window(user_info)
 
     def create_main_window(self, user_info: dict):
         """Create main application window"""
         try:
-            print("\n🏗️  Building main window UI...")
+            logger.info("🏗️  Building main window UI...")
+            started = time.perf_counter()
+            self.page_build_times = {}
 
             # Create main window
             self.main_window = QMainWindow()
@@ -116,52 +149,17 @@ class MainController(QObject):
             main_layout.setSpacing(0)
 
             # ✨ STEP 3: Create sidebar controller
-            print("📊 Creating sidebar...")
+            logger.debug("📊 Creating sidebar...")
             self.sidebar_controller = SidebarController(user_info)
             self.sidebar_controller.page_changed.connect(self.change_page)
             self.sidebar_controller.sign_out_requested.connect(self.handle_logout)
             main_layout.addWidget(self.sidebar_controller.get_view())
 
             # ✨ STEP 4: Create stacked widget for pages
-            print("📚 Creating page stack...")
+            logger.debug("📚 Creating page stack...")
             self.stacked_widget = QStackedWidget()
 
-            # ✨ STEP 5: Create all page controllers with Database reference
-            print("\n🎯 Creating page controllers with Database...")
-
-            print("   → Dashboard controller...")
-            self.dashboard_controller = DashboardController(self.database)
-
-            print("   → Enrollment controller...")
-            self.enrollment_controller = EnrollmentController(self.database)
-
-            print("   → Reports controller...")
-            self.reports_controller = ReportsController(self.database)
-
-            print("   → Classrooms controller...")
-            self.classrooms_controller = ClassroomsController(self.database)
-
-            print("   → Management controller...")
-            self.management_controller = ManagementController(self.database)
-
-            # Connect enrollment signal to dashboard refresh
-            self.enrollment_controller.student_enrolled.connect(
-                self.dashboard_controller.refresh_data
-            )
-
-            # Add pages to stacked widget
-            self.stacked_widget.addWidget(self.dashboard_controller.get_view())  # 0
-            self.stacked_widget.addWidget(self.enrollment_controller.get_view())  # 1
-            self.stacked_widget.addWidget(self.reports_controller.get_view())  # 2
-            self.stacked_widget.addWidget(self.classrooms_controller.get_view())  # 3
-            self.stacked_widget.addWidget(self.management_controller.get_view())  # 4
-
-            # Create Users page ONLY for admins
-            if user_info['role'].lower() == 'admin':
-                print("   → Users controller (admin access)...")
-                self.users_controller = UsersController(self.database)
-                self.stacked_widget.addWidget(self.users_controller.get_view())  # 5
-                print("   ✅ Users page added")
+            # ✨ STEP 5: Page controllers are built on first visit (see _get_page)
 
             # Set user role (show/hide admin features)
             self.sidebar_controller.set_user_role(user_info['role'])
@@ -173,59 +171,96 @@ class MainController(QObject):
 
             # Show main window
             self.main_window.show()
-            print("\n✅ Main window displayed successfully!")
-            print("=" * 60)
+            logger.info("✅ Main window displayed in %.0f ms", (time.perf_counter() - started) * 1000)
+
+            # Build the remaining pages while the user looks at the dashboard
+            if UI_CONFIG.get('prewarm_pages'):
+                QTimer.singleShot(UI_CONFIG.get('prewarm_delay', 1500), self._prewarm_next_page)
 
         except Exception as e:
-            print(f"❌ Error creating main window: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error creating main window: %s", e)
             QMessageBox.critical(
                 None,
                 "Error",
                 f"Failed to create main window:\n{str(e)}"
             )
 
+    def _can_open(self, page_name: str) -> bool:
+        """Users and Diagnostics pages are for admins only"""
+        if page_name in self.ADMIN_PAGES:
+            return bool(self.current_user) and self.current_user['role'].lower() == 'admin'
+        return True
+
+    def _get_page(self, page_name: str):
+        """
+        Controller for page_name, building it and adding its view to the
+        page stack on first use. Returns (controller, built_now).
+        """
+        attribute, controller_class, _ = self.PAGES[page_name]
+        controller = getattr(self, attribute)
+        if controller is not None:
+            return controller, False
+
+        started = time.perf_counter()
+        controller = controller_class(self.database)
+        self.stacked_widget.addWidget(controller.get_view())
+        elapsed = (time.perf_counter() - started) * 1000
+
+        setattr(self, attribute, controller)
+        self.page_build_times[page_name] = elapsed
+        logger.info("%s page built in %.0f ms", page_name.capitalize(), elapsed)
+        return controller, True
+
+    def _prewarm_next_page(self):
+        """Build one unvisited page, then yield to the event loop before the next"""
+        if self.main_window is None:
+            return  # Signed out meanwhile
+
+        for page_name, (attribute, _, _) in self.PAGES.items():
+            if getattr(self, attribute) is None and self._can_open(page_name):
+                current_page, query_stats.page = query_stats.page, page_name
+                try:
+                    self._get_page(page_name)
+                finally:
+                    query_stats.page = current_page
+                QTimer.singleShot(0, self._prewarm_next_page)
+                return
+
+        total = sum(self.page_build_times.values())
+        logger.info("✅ All pages ready (%.0f ms of page construction): %s", total,
+                    ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.page_build_times.items()))
+
     def change_page(self, page_name: str):
         """Change the current displayed page"""
         try:
-            page_map = {
-                "dashboard": 0,
-                "enrollment": 1,
-                "reports": 2,
-                "classrooms": 3,
-                "management": 4,
-                "users": 5
-            }
-
-            # Check access for users page
-            if page_name == "users" and not self.users_controller:
+            if page_name not in self.PAGES:
+                page_name = "dashboard"
+
+            # Check access for admin pages
+            if not self._can_open(page_name):
                 QMessageBox.warning(
                     self.main_window,
                     "Access Denied",
-                    "You do not have permission to access the Users page."
+                    f"You do not have permission to access the {page_name.capitalize()} page."
                 )
                 return
 
-            index = page_map.get(page_name, 0)
-            self.stacked_widget.setCurrentIndex(index)
-
-            # Refresh page data
-            if page_name == "dashboard":
-                self.dashboard_controller.refresh_data()
-            elif page_name == "reports":
-                self.reports_controller.refresh_data()
-            elif page_name == "classrooms":
-                self.classrooms_controller.refresh_classrooms()
-            elif page_name == "management":
-                self.management_controller.refresh_all_data()
-            elif page_name == "users" and self.users_controller:
-                self.users_controller.refresh_users()
+            # Queries from here on are charged to this page
+            started = time.perf_counter()
+            query_stats.page = page_name
+
+            controller, built_now = self._get_page(page_name)
+            self.stacked_widget.setCurrentWidget(controller.get_view())
+
+            # Refresh page data; a page that was just built has loaded it already
+            refresh = self.PAGES[page_name][2]
+            if refresh and not built_now:
+                getattr(controller, refresh)()
+
+            query_stats.record_page_switch(page_name, (time.perf_counter() - started) * 1000)
 
         except Exception as e:
-            print(f"❌ Error changing page: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error changing page: %s", e)
 
     def handle_logout(self):
         """Handle user logout"""
@@ -239,7 +274,7 @@ class MainController(QObject):
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                print(f"\n🚪 User {self.current_user['username']} logging out...")
+                logger.info("🚪 User %s logging out...", self.current_user['username'])
 
                 # Close main window
                 if self.main_window:
@@ -254,15 +289,15 @@ class MainController(QObject):
                 self.classrooms_controller = None
                 self.management_controller = None
                 self.users_controller = None
+                self.diagnostics_controller = None
                 self.current_user = None
+                query_stats.page = None
 
                 # Show login window
                 self.login_controller.get_view().clear_fields()
                 self.login_controller.get_view().show()
 
-                print("✅ Logged out successfully\n")
+                logger.info("✅ Logged out successfully")
 
         except Exception as e:
-            print(f"❌ Error during logout: {e}")
-            import traceback
-            traceback.print_exc()
\ No newline at end of file
+            logger.exception("❌ Error during logout: %s", e)
\ No newline at end of file
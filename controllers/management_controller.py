@@ -5,6 +5,10 @@ FIXED: Room saving issue and added department display
 from PyQt6.QtCore import QObject, Qt
 from PyQt6.QtWidgets import QWidget, QMessageBox, QPushButton, QHBoxLayout, QTableWidgetItem
 from views.management_page import ManagementPageUI
+from utils.task_runner import TaskRunner
+from utils.log import get_logger, TRACE
+
+logger = get_logger(__name__)
 
 
 class ManagementController(QObject):
@@ -19,6 +23,9 @@ class ManagementController(QObject):
         # Create view
         self.view = ManagementPageUI()
 
+        # Background runner for long model calls
+        self.tasks = TaskRunner(self)
+
         # Connect signals
         self._connect_signals()
 
@@ -35,6 +42,7 @@ class ManagementController(QObject):
 
         # Section signals
         self.view.add_section_requested.connect(self.add_section)
+        self.view.rollover_requested.connect(self.rollover_year)
 
         # Tab change signal
         self.view.tab_widget.currentChanged.connect(self.on_tab_changed)
@@ -125,9 +133,7 @@ class ManagementController(QObject):
                 self.view.teachers_table.setRowHeight(row, 50)
 
         except Exception as e:
-            print(f"Error refreshing teachers: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error refreshing teachers: %s", e)
 
     def add_teacher(self, data: dict):
         """Add a new teacher using Teacher Model"""
@@ -176,9 +182,7 @@ class ManagementController(QObject):
                 )
 
         except Exception as e:
-            print(f"Error adding teacher: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding teacher: %s", e)
             QMessageBox.critical(
                 self.view,
                 "Error",
@@ -216,9 +220,7 @@ class ManagementController(QObject):
                     )
 
         except Exception as e:
-            print(f"Error deleting teacher: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error deleting teacher: %s", e)
 
     # ==================== ROOM METHODS ====================
 
@@ -257,9 +259,7 @@ class ManagementController(QObject):
                 self.view.rooms_table.setRowHeight(row, 50)
 
         except Exception as e:
-            print(f"Error refreshing rooms: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error refreshing rooms: %s", e)
 
     def add_room(self, data: dict):
         """Add a new room using Room Model"""
@@ -310,9 +310,7 @@ class ManagementController(QObject):
                 )
 
         except Exception as e:
-            print(f"Error adding room: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding room: %s", e)
             QMessageBox.critical(
                 self.view,
                 "Error",
@@ -350,23 +348,22 @@ class ManagementController(QObject):
                     )
 
         except Exception as e:
-            print(f"Error deleting room: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error deleting room: %s", e)
 
     # ==================== SECTION METHODS ====================
 
     def refresh_sections(self):
         """Refresh sections table - FIXED to show room properly"""
         try:
-            print("DEBUG: Refreshing sections table...")
+            logger.debug("Refreshing sections table...")
             sections = self.db.sections.get_all_sections()
-            print(f"DEBUG: Found {len(sections)} sections")
+            logger.debug("Found %s sections", len(sections))
 
             self.view.sections_table.setRowCount(0)
 
             for row, section in enumerate(sections):
-                print(f"DEBUG: Section {row}: {section.section_name}, Room: {section.room_number}")
+                logger.log(TRACE, "Section %s: %s, Room: %s",
+                           row, section.section_name, section.room_number)
                 self.view.sections_table.insertRow(row)
 
                 # ID
@@ -375,8 +372,8 @@ class ManagementController(QObject):
                 # Section Name
                 self.view.sections_table.setItem(row, 1, self._create_table_item(section.section_name))
 
-                # Strand
-                item = self._create_table_item(section.strand)
+                # Strand and grade
+                item = self._create_table_item(f"{section.strand} - G{section.grade_level}")
                 item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                 self.view.sections_table.setItem(row, 2, item)
 
@@ -388,7 +385,7 @@ class ManagementController(QObject):
 
                 # Room - FIXED: Show room properly
                 room_text = section.room_number if section.room_number else '-'
-                print(f"DEBUG: Displaying room: {room_text}")
+                logger.log(TRACE, "Displaying room: %s", room_text)
                 self.view.sections_table.setItem(row, 4, self._create_table_item(room_text))
 
                 # Teacher/Adviser
@@ -405,15 +402,13 @@ class ManagementController(QObject):
 
                 self.view.sections_table.setRowHeight(row, 50)
 
-            print(f"DEBUG: Sections table now has {self.view.sections_table.rowCount()} rows")
+            logger.debug("Sections table now has %s rows", self.view.sections_table.rowCount())
 
         except Exception as e:
-            print(f"Error refreshing sections: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error refreshing sections: %s", e)
 
     def refresh_section_dropdowns(self):
-        """Refresh room and teacher dropdowns"""
+        """Refresh room, teacher and academic year dropdowns"""
         try:
             # Refresh room dropdown with availability status
             self.view.section_room_combo.clear()
@@ -454,16 +449,29 @@ class ManagementController(QObject):
                 display = f"{teacher['full_name']} - {teacher['specialization']}"
                 self.view.section_teacher_combo.addItem(display, teacher['id'])
 
+            # Refresh academic year dropdowns; only inactive years can be rolled over to
+            self.view.section_year_combo.clear()
+            self.view.section_year_combo.addItem("Any Year", None)
+            self.view.rollover_year_combo.clear()
+
+            for year in self.db.academic_years.get_all_years():
+                display = f"{year['year_name']} (Active)" if year['is_active'] else year['year_name']
+                self.view.section_year_combo.addItem(display, year['id'])
+                if not year['is_active']:
+                    self.view.rollover_year_combo.addItem(year['year_name'], year['id'])
+
+            self.view.rollover_btn.setEnabled(
+                self.view.rollover_year_combo.count() > 0 and not self.tasks.is_busy()
+            )
+
         except Exception as e:
-            print(f"Error refreshing dropdowns: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error refreshing dropdowns: %s", e)
 
     def add_section(self, data: dict):
         """Add a new section with proper room handling - FIXED"""
         try:
-            print("DEBUG: add_section called")
-            print(f"DEBUG: Data received: {data}")
+            logger.debug("add_section called")
+            logger.debug("Data received: %s", data)
 
             # Validate inputs
             if not all([data['section_name'], data['strand'], data['capacity']]):
@@ -493,7 +501,7 @@ class ManagementController(QObject):
             room_capacity = None
 
             if room_id:
-                print(f"DEBUG: room_id type: {type(room_id)}, value: {room_id}")
+                logger.debug("room_id type: %s, value: %s", type(room_id), room_id)
 
                 # Check if occupied
                 if isinstance(room_id, str) and room_id.startswith("occupied_"):
@@ -510,7 +518,8 @@ class ManagementController(QObject):
                     actual_room_id = room_id['id']
                     room_number = room_id['room_number']
                     room_capacity = room_id['capacity']
-                    print(f"DEBUG: Extracted - ID: {actual_room_id}, Number: {room_number}, Capacity: {room_capacity}")
+                    logger.debug("Extracted - ID: %s, Number: %s, Capacity: %s",
+                                 actual_room_id, room_number, room_capacity)
 
                     # Validate capacity
                     if section_capacity > room_capacity:
@@ -540,6 +549,8 @@ class ManagementController(QObject):
             section_data = SectionData(
                 section_name=data['section_name'],
                 strand=data['strand'],
+                grade_level=data['grade_level'],
+                academic_year_id=data['academic_year_id'],
                 track=track,
                 capacity=section_capacity,
                 room_number=room_number,  # FIXED: Now properly set
@@ -547,17 +558,18 @@ class ManagementController(QObject):
                 adviser_id=data['teacher_id']
             )
 
-            print(f"DEBUG: Section data - room_number: {section_data.room_number}")
-            print("DEBUG: Calling db.sections.add_section...")
+            logger.debug("Section data - room_number: %s", section_data.room_number)
+            logger.debug("Calling db.sections.add_section...")
 
             # Add section
             success, message = self.db.sections.add_section(section_data)
-            print(f"DEBUG: add_section returned: success={success}, message={message}")
+            logger.debug("add_section returned: success=%s, message=%s", success, message)
 
             if success:
                 success_msg = (
                     f"<b>Section '{data['section_name']}' added successfully!</b><br><br>"
                     f"<b>Strand:</b> {data['strand']}<br>"
+                    f"<b>Grade:</b> {data['grade_level']}<br>"
                     f"<b>Capacity:</b> {section_capacity} students<br>"
                     f"<b>Room:</b> {room_number if room_number else 'No room assigned'}"
                 )
@@ -573,10 +585,10 @@ class ManagementController(QObject):
 
                 # Clear and refresh
                 self.view.clear_section_form()
-                print("DEBUG: Refreshing sections after add...")
+                logger.debug("Refreshing sections after add...")
                 self.refresh_sections()
                 self.refresh_section_dropdowns()
-                print("DEBUG: Section add completed successfully")
+                logger.debug("Section add completed successfully")
             else:
                 QMessageBox.critical(
                     self.view,
@@ -585,15 +597,49 @@ class ManagementController(QObject):
                 )
 
         except Exception as e:
-            print(f"Error adding section: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding section: %s", e)
             QMessageBox.critical(
                 self.view,
                 "Error",
                 f"An error occurred: {str(e)}"
             )
 
+    def rollover_year(self, year_id: int, year_name: str):
+        """Confirm, then roll the active year over to year_id in the background"""
+        reply = QMessageBox.question(
+            self.view,
+            "Confirm Rollover",
+            f"Make <b>{year_name}</b> the active academic year?<br><br>"
+            f"Every enrolled Grade 11 student will be promoted to Grade 12 and placed "
+            f"in an open Grade 12 section of their strand. This cannot be undone.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        # TODO: Get actual user_id from session
+        self.view.rollover_btn.setEnabled(False)
+        self.tasks.submit_write(
+            "rollover", self.db.academic_years.rollover, year_id,
+            on_result=self._rollover_done,
+            on_error=self._rollover_failed
+        )
+
+    def _rollover_done(self, result):
+        success, message = result
+        if success:
+            QMessageBox.information(self.view, "✅ Rollover Complete", message)
+        else:
+            QMessageBox.critical(self.view, "Rollover Failed", message)
+        self.refresh_sections()
+        self.refresh_section_dropdowns()
+
+    def _rollover_failed(self, error: Exception):
+        logger.error("Error rolling over academic year: %s", error)
+        QMessageBox.critical(self.view, "Rollover Failed", f"Failed to roll over academic year:\n{error}")
+        self.refresh_section_dropdowns()
+
     def delete_section(self, section_id: int, section_name: str):
         """Delete a section using Section Model"""
         try:
@@ -625,9 +671,7 @@ class ManagementController(QObject):
                     )
 
         except Exception as e:
-            print(f"Error deleting section: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error deleting section: %s", e)
 
     # ==================== HELPER METHODS ====================
 
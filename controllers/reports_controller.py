@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from views.reports_page import ReportsPageUI
+from utils.task_runner import TaskRunner
+from utils.receipt_generator import generate_receipt_batch
 
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib import colors
@@ -13,6 +15,9 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class ReportsController(QObject):
@@ -26,6 +31,10 @@ class ReportsController(QObject):
         # Create view
         self.view = ReportsPageUI()
 
+        # Background runner for model calls
+        self.tasks = TaskRunner(self)
+        self.tasks.loading_changed.connect(self.view.set_loading)
+
         # Controller state
         self.selected_report = None
         self.report_generated = False
@@ -45,6 +54,8 @@ class ReportsController(QObject):
 
         self.view.generate_btn.clicked.connect(self.generate_report)
         self.view.export_btn.clicked.connect(self.export_to_pdf)
+        self.view.roster_btn.clicked.connect(self.export_roster)
+        self.view.receipts_btn.clicked.connect(self.export_receipts)
         self.view.date_combo.currentTextChanged.connect(self.on_date_range_changed)
 
     def get_view(self) -> QWidget:
@@ -66,10 +77,10 @@ class ReportsController(QObject):
 
     def on_date_range_changed(self, date_range: str):
         """Handle date range change - FIXED"""
-        print(f"DEBUG: Date range changed to: {date_range}")
+        logger.debug("Date range changed to: %s", date_range)
         self.current_date_range = date_range
         if self.report_generated and self.selected_report:
-            print("DEBUG: Auto-regenerating report with new date range")
+            logger.debug("Auto-regenerating report with new date range")
             self.generate_report()
 
     def generate_report(self):
@@ -77,32 +88,152 @@ class ReportsController(QObject):
         if not self.selected_report:
             return
 
-        try:
-            self.current_date_range = self.view.date_combo.currentText()
-            print(f"DEBUG: Generating report for date range: {self.current_date_range}")
-            self.view.date_range_badge.setText(f"{self.current_date_range}")
+        self.current_date_range = self.view.date_combo.currentText()
+        logger.debug("Generating report for date range: %s", self.current_date_range)
+        self.view.date_range_badge.setText(f"{self.current_date_range}")
+
+        report_type = self.selected_report
+        self.tasks.submit(
+            "report", self._load_report_data, report_type, self._get_date_filter(),
+            on_result=lambda data: self._show_report(report_type, data),
+            on_error=self._show_report_error
+        )
+
+    def _load_report_data(self, report_type: str, date_filter):
+        """Fetch report data from Student Model (runs on a worker thread)"""
+        if report_type in ("total", "strand"):
+            return self.db.students.get_enrollment_stats(date_filter=date_filter)
 
+        if date_filter:
+            logger.debug("Fetching enrollments since: %s", date_filter)
+            return self.db.students.get_enrollments_by_date(date_filter, limit=50)
+
+        logger.debug("Fetching recent enrollments (no date filter)")
+        return self.db.students.get_recent_enrollments(50)
+
+    def _show_report(self, report_type: str, data):
+        """Render a report once its data has been loaded"""
+        try:
             self._clear_report_display()
 
-            if self.selected_report == "total":
-                self._generate_total_report()
-            elif self.selected_report == "strand":
-                self._generate_strand_report()
-            elif self.selected_report == "recent":
-                self._generate_recent_report()
+            if report_type == "total":
+                self._generate_total_report(data)
+            elif report_type == "strand":
+                self._generate_strand_report(data)
+            elif report_type == "recent":
+                self._generate_recent_report(data)
 
             self.report_generated = True
             self.view.export_btn.setEnabled(True)
 
         except Exception as e:
-            print(f"Error generating report: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self.view,
-                "Error",
-                f"Failed to generate report:\n{str(e)}"
-            )
+            self._show_report_error(e)
+
+    def _show_report_error(self, error: Exception):
+        """Report a failed report generation"""
+        logger.error("Error generating report: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Error",
+            f"Failed to generate report:\n{str(error)}"
+        )
+
+    def export_roster(self):
+        """Export the student master list to CSV or Excel in the background"""
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self.view,
+            "Export Student Roster",
+            f"Student_Roster_{datetime.now().strftime('%Y%m%d')}.csv",
+            "CSV Files (*.csv);;Excel Files (*.xlsx)"
+        )
+        if not path:
+            return
+        if not path.lower().endswith(('.csv', '.xlsx')):
+            path += ".xlsx" if "xlsx" in selected_filter else ".csv"
+
+        self.view.roster_btn.setEnabled(False)
+        self.view.set_export_progress(0, 0)
+        self.tasks.submit(
+            "roster", self.db.students.export_roster, path,
+            on_progress=lambda value: self.view.set_export_progress(*value),
+            on_result=lambda count: self._show_roster_exported(path, count),
+            on_error=self._show_roster_error
+        )
+
+    def _show_roster_exported(self, path: str, count: int):
+        self.view.roster_btn.setEnabled(True)
+        self.view.hide_export_progress()
+        QMessageBox.information(
+            self.view,
+            "Export Successful",
+            f"{count} student(s) exported to:\n{path}"
+        )
+
+    def _show_roster_error(self, error: Exception):
+        self.view.roster_btn.setEnabled(True)
+        self.view.hide_export_progress()
+        logger.error("Error exporting roster: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Export Error",
+            f"Failed to export roster:\n{str(error)}"
+        )
+
+    def export_receipts(self):
+        """Render the receipts of the payments in the selected date range into one PDF in the background"""
+        path, _ = QFileDialog.getSaveFileName(
+            self.view,
+            "Export Receipts",
+            f"Receipts_{datetime.now().strftime('%Y%m%d')}.pdf",
+            "PDF Files (*.pdf)"
+        )
+        if not path:
+            return
+        if not path.lower().endswith('.pdf'):
+            path += ".pdf"
+
+        date_filter = self._get_date_filter()
+        self.view.receipts_btn.setEnabled(False)
+        self.view.set_export_progress(0, 0, "Rendering receipts")
+        self.tasks.submit(
+            "receipts", self._render_receipts, date_filter.date() if date_filter else None, path,
+            on_progress=lambda value: self.view.set_export_progress(*value, "Rendering receipts"),
+            on_result=self._show_receipts_exported,
+            on_error=self._show_receipts_error
+        )
+
+    def _render_receipts(self, date_from, path: str, progress=None):
+        """Load the payments and render their receipts (runs on a worker thread)"""
+        rows = self.db.payments.get_receipt_rows(date_from)
+        if not rows:
+            return 0, None
+        output = generate_receipt_batch([(row, row) for row in rows], path, progress=progress)
+        if not output:
+            raise RuntimeError("The receipts could not be rendered; see the log for details")
+        return len(rows), output
+
+    def _show_receipts_exported(self, result):
+        count, path = result
+        self.view.receipts_btn.setEnabled(True)
+        self.view.hide_export_progress()
+        if not count:
+            QMessageBox.information(self.view, "No Payments", f"No payments were found for: {self.current_date_range}")
+            return
+        QMessageBox.information(
+            self.view,
+            "Export Successful",
+            f"{count} receipt(s) saved to:\n{path}"
+        )
+
+    def _show_receipts_error(self, error: Exception):
+        self.view.receipts_btn.setEnabled(True)
+        self.view.hide_export_progress()
+        logger.error("Error exporting receipts: %s", error)
+        QMessageBox.critical(
+            self.view,
+            "Export Error",
+            f"Failed to export receipts:\n{str(error)}"
+        )
 
     def _clear_report_display(self):
         while self.view.report_layout.count() > 0:
@@ -130,26 +261,24 @@ class ReportsController(QObject):
 
         if self.current_date_range == "Today":
             start_date = today.replace(hour=0, minute=0, second=0, microsecond=0)
-            print(f"DEBUG: Date filter - Today: {start_date}")
+            logger.debug("Date filter - Today: %s", start_date)
             return start_date
         elif self.current_date_range == "Last 7 Days":
             start_date = today - timedelta(days=7)
-            print(f"DEBUG: Date filter - Last 7 Days: {start_date}")
+            logger.debug("Date filter - Last 7 Days: %s", start_date)
             return start_date
         elif self.current_date_range == "Last 30 Days":
             start_date = today - timedelta(days=30)
-            print(f"DEBUG: Date filter - Last 30 Days: {start_date}")
+            logger.debug("Date filter - Last 30 Days: %s", start_date)
             return start_date
         else:  # All Time
-            print("DEBUG: Date filter - All Time (None)")
+            logger.debug("Date filter - All Time (None)")
             return None
 
-    def _generate_total_report(self):
+    def _generate_total_report(self, stats: dict):
         """Generate total enrollment report - FIXED"""
-        print("DEBUG: Generating total report...")
-        date_filter = self._get_date_filter()
-        stats = self.db.students.get_enrollment_stats(date_filter=date_filter)
-        print(f"DEBUG: Stats retrieved: {stats}")
+        logger.debug("Generating total report...")
+        logger.debug("Stats retrieved: %s", stats)
         self.current_report_data = stats
 
         stats_grid = QGridLayout()
@@ -177,12 +306,10 @@ class ReportsController(QObject):
         table = self._create_strand_table(stats['by_strand'])
         self.view.report_layout.addWidget(table)
 
-    def _generate_strand_report(self):
+    def _generate_strand_report(self, stats: dict):
         """Generate strand report - FIXED"""
-        print("DEBUG: Generating strand report...")
-        date_filter = self._get_date_filter()
-        stats = self.db.students.get_enrollment_stats(date_filter=date_filter)
-        print(f"DEBUG: Stats retrieved: {stats}")
+        logger.debug("Generating strand report...")
+        logger.debug("Stats retrieved: %s", stats)
         self.current_report_data = stats['by_strand']
 
         info_label = QLabel(f"Showing data for: {self.current_date_range}")
@@ -192,19 +319,10 @@ class ReportsController(QObject):
         table = self._create_strand_table(stats['by_strand'], show_total=True)
         self.view.report_layout.addWidget(table)
 
-    def _generate_recent_report(self):
+    def _generate_recent_report(self, enrollments: list):
         """Generate recent enrollments report - FIXED"""
-        print("DEBUG: Generating recent report...")
-        date_filter = self._get_date_filter()
-
-        if date_filter:
-            print(f"DEBUG: Fetching enrollments since: {date_filter}")
-            enrollments = self.db.students.get_enrollments_by_date(date_filter, limit=50)
-        else:
-            print("DEBUG: Fetching recent enrollments (no date filter)")
-            enrollments = self.db.students.get_recent_enrollments(50)
-
-        print(f"DEBUG: Found {len(enrollments)} enrollments")
+        logger.debug("Generating recent report...")
+        logger.debug("Found %s enrollments", len(enrollments))
         self.current_report_data = enrollments
 
         count_label = QLabel(f"Showing {len(enrollments)} enrollments ({self.current_date_range})")
@@ -256,7 +374,7 @@ class ReportsController(QObject):
                 else:
                     formatted_date = str(date_str)
             except Exception as e:
-                print(f"DEBUG: Date parsing error: {e}")
+                logger.debug("Date parsing error: %s", e)
                 formatted_date = str(date_str)
 
             table.setItem(row, 2, QTableWidgetItem(formatted_date))
@@ -364,7 +482,7 @@ class ReportsController(QObject):
     def refresh_data(self):
         """Refresh current report - FIXED"""
         if self.report_generated and self.selected_report:
-            print("DEBUG: Refreshing report data...")
+            logger.debug("Refreshing report data...")
             self.generate_report()
 
     def export_to_pdf(self):
@@ -403,7 +521,7 @@ class ReportsController(QObject):
                 f"Report exported successfully to:\n{file_path}"
             )
 
-            print(f"✅ PDF exported to: {file_path}")
+            logger.info("✅ PDF exported to: %s", file_path)
 
         except Exception as e:
             QMessageBox.critical(
@@ -411,9 +529,7 @@ class ReportsController(QObject):
                 "Export Failed",
                 f"Failed to export PDF report:\n{str(e)}"
             )
-            print(f"❌ Error exporting PDF: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error exporting PDF: %s", e)
 
     def _create_pdf_header(self, story, styles, title: str, subtitle: str = None):
         title_style = ParagraphStyle(
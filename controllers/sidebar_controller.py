@@ -1,6 +1,9 @@
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QPushButton
 from views.sidebar import SidebarUI
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class SidebarController(QObject):
 
@@ -47,6 +50,9 @@ class SidebarController(QObject):
         self.view.users_btn.clicked.connect(
             lambda: self.on_menu_click("users", self.view.users_btn)
         )
+        self.view.diagnostics_btn.clicked.connect(
+            lambda: self.on_menu_click("diagnostics", self.view.diagnostics_btn)
+        )
         self.view.signout_btn.clicked.connect(self.on_sign_out)
 
     def get_view(self) -> QWidget:
@@ -55,7 +61,7 @@ class SidebarController(QObject):
 
     def on_menu_click(self, page_name: str, button: QPushButton):
         """Handle menu button click"""
-        print(f"Menu clicked: {page_name}")
+        logger.debug("Menu clicked: %s", page_name)
         self.current_page = page_name
         self.set_active_button(button)
         self.page_changed.emit(page_name)
@@ -69,7 +75,8 @@ class SidebarController(QObject):
             self.view.reports_btn,
             self.view.classrooms_btn,
             self.view.management_btn,  # FIXED: Added management button
-            self.view.users_btn
+            self.view.users_btn,
+            self.view.diagnostics_btn
         ]
 
         # Deactivate all buttons
@@ -120,40 +127,12 @@ class SidebarController(QObject):
         """Show/hide features based on user role"""
         is_admin = (role.lower() == "admin")
 
-        print("\n" + "=" * 60)
-        print("SETTING USER ROLE")
-        print("=" * 60)
-        print(f"   Role: {role}")
-        print(f"   Is Admin: {is_admin}")
-        print(f"   Username: {self.user_info['username']}")
-        print("\nCHECKING VIEW COMPONENTS:")
-        print(f"   ✓ View exists: {self.view is not None}")
-        print(f"   ✓ Users button exists: {hasattr(self.view, 'users_btn')}")
-        print(f"   ✓ Admin separator exists: {hasattr(self.view, 'admin_separator')}")
-        print(f"   ✓ Admin label exists: {hasattr(self.view, 'admin_label')}")
-        print("\nVISIBILITY BEFORE:")
-        print(f"   Users button visible: {self.view.users_btn.isVisible()}")
-        print(f"   Admin separator visible: {self.view.admin_separator.isVisible()}")
-        print(f"   Admin label visible: {self.view.admin_label.isVisible()}")
+        logger.debug("Setting role %s for %s (admin: %s)", role, self.user_info['username'], is_admin)
 
         # Call the view method to show/hide admin features
-        print("\nCALLING show_admin_features()...")
         self.view.show_admin_features(is_admin)
 
-        print("\nVISIBILITY AFTER:")
-        print(f"   Users button visible: {self.view.users_btn.isVisible()}")
-        print(f"   Admin separator visible: {self.view.admin_separator.isVisible()}")
-        print(f"   Admin label visible: {self.view.admin_label.isVisible()}")
-
         if is_admin:
-            print("\n✅ ADMIN FEATURES ENABLED")
-            print(f"   User: {self.user_info['username']}")
-            print(f"   Available pages: Dashboard, Enrollment, Reports, Classrooms, Management, Users")
-            if not self.view.users_btn.isVisible():
-                print("\n⚠️ WARNING: Users button should be visible but it's not!")
-        else:
-            print("\n👤 STANDARD USER ACCESS")
-            print(f"   User: {self.user_info['username']}")
-            print(f"   Available pages: Dashboard, Enrollment, Reports, Classrooms, Management")
-
-        print("=" * 60 + "\n")
\ No newline at end of file
+            logger.info("✅ Admin features enabled for %s", self.user_info['username'])
+            if self.view.users_btn.isHidden():
+                logger.warning("⚠️ Users button should be visible but it's not!")
\ No newline at end of file
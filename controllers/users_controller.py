@@ -5,6 +5,9 @@ from PyQt6.QtCore import QObject
 from PyQt6.QtWidgets import QWidget, QMessageBox, QPushButton, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt
 from views.users_page import UsersPageUI
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class UsersController(QObject):
@@ -71,9 +74,7 @@ class UsersController(QObject):
                 self.view.users_table.setRowHeight(row, 60)
 
         except Exception as e:
-            print(f"Error refreshing users: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error refreshing users: %s", e)
 
     def _create_table_item(self, text: str):
         """Create a table item"""
@@ -191,9 +192,7 @@ class UsersController(QObject):
                 QMessageBox.critical(self.view, "Error", message)
 
         except Exception as e:
-            print(f"Error adding user: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding user: %s", e)
             QMessageBox.critical(self.view, "Error", f"Failed to add user: {str(e)}")
 
     def delete_user(self, user_id: int, username: str):
@@ -224,7 +223,5 @@ class UsersController(QObject):
                     QMessageBox.critical(self.view, "Error", message)
 
         except Exception as e:
-            print(f"Error deleting user: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error deleting user: %s", e)
             QMessageBox.critical(self.view, "Error", f"Failed to delete user: {str(e)}")
\ No newline at end of file
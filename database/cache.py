@@ -0,0 +1,203 @@
+"""
+Query Cache - Read-through cache for model queries
+Entries expire after a TTL, the least recently used entries are evicted
+first, and every entry is tagged with the tables it reads so that writes
+invalidate exactly the results they affect. Entries built from a single
+record can be tagged with that row instead of its table, so they survive
+writes to other records. Fallback results returned after a query error
+are not stored (see skip_cache).
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from database.config import CACHE_CONFIG
+
+
+class QueryCache:
+    """Thread-safe TTL + LRU cache with table-tag invalidation"""
+
+    def __init__(self, max_entries: int = None, ttl: float = None):
+        self.max_entries = max_entries or CACHE_CONFIG['max_entries']
+        self.ttl = ttl or CACHE_CONFIG['ttl']
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # key -> (expires_at, tags, value)
+        self._tag_keys = {}  # table -> keys of entries that read it
+        self._tag_generations = {}  # table -> number of invalidations so far
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Tuple[bool, Any]:
+        """Return (hit, value) for key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            expires_at, tags, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def __contains__(self, key) -> bool:
+        """Whether key has a live entry; unlike get(), not counted as a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] >= time.monotonic()
+
+    def generation(self, tags) -> tuple:
+        """Snapshot of the invalidation counters for tags"""
+        with self._lock:
+            return tuple(self._tag_generations.get(tag, 0) for tag in tags)
+
+    def set(self, key, value, tags, generation: tuple = None):
+        """
+        Store value under key.
+        If any tag was invalidated since generation was taken, the value may
+        already be stale and is not stored.
+        """
+        with self._lock:
+            if generation is not None:
+                current = tuple(self._tag_generations.get(tag, 0) for tag in tags)
+                if current != generation:
+                    return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, tags, value)
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate(self, *tags):
+        """Drop every entry that read any of the given tables"""
+        with self._lock:
+            for tag in tags:
+                self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+                for key in self._tag_keys.pop(tag, set()):
+                    self._remove(key)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            for tag in list(self._tag_keys):
+                self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+            self._entries.clear()
+            self._tag_keys.clear()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[1]:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+
+
+# Shared cache used by all models
+query_cache = QueryCache()
+
+# Per thread: whether the cached read running on it hit an error
+_call_state = threading.local()
+
+
+def skip_cache():
+    """Call from a cached read's error path so the fallback it returns is not stored"""
+    _call_state.failed = True
+
+
+def row_tag(table: str, key) -> tuple:
+    """Tag for the cached results that depend on one row of table"""
+    return (table, key)
+
+
+def invalidate_row(table: str, key):
+    """Drop every entry tagged with row_tag(table, key); call once a write to that row commits"""
+    query_cache.invalidate(row_tag(table, key))
+
+
+def cached(*tables, row: str = None):
+    """
+    Cache a model read method; tables lists every table the query reads.
+    With row, the method's first argument is a key of that table and the
+    entry is tagged with row_tag(row, key) rather than the whole table, so
+    only invalidate_row() for that key drops it.
+    Every caller gets the same cached objects: list and dict results are
+    handed out as shallow copies, but the rows inside them are shared and
+    must be treated as read-only.
+    """
+    def decorator(method):
+        def key_for(args, kwargs) -> tuple:
+            return method.__qualname__, args, tuple(sorted(kwargs.items()))
+
+        def tags_for(args) -> tuple:
+            return tables + (row_tag(row, args[0]),) if row else tables
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = key_for(args, kwargs)
+            tags = tags_for(args)
+            try:
+                hit, value = query_cache.get(key)
+            except TypeError:
+                # Unhashable arguments - skip the cache
+                return method(self, *args, **kwargs)
+            if hit:
+                return _copy(value)
+
+            generation = query_cache.generation(tags)
+            outer_failed = getattr(_call_state, 'failed', False)
+            _call_state.failed = False
+            try:
+                value = method(self, *args, **kwargs)
+                failed = _call_state.failed
+            finally:
+                # A failed inner read also spoils the outer result built from it
+                _call_state.failed = outer_failed or _call_state.failed
+            if not failed:
+                query_cache.set(key, value, tags, generation)
+            return _copy(value)
+
+        # For batch loaders that fill in the entries of many single calls at once
+        wrapper.is_cached = lambda *args: key_for(args, {}) in query_cache
+        wrapper.generation = lambda *args: query_cache.generation(tags_for(args))
+        wrapper.store = lambda value, *args, generation=None: query_cache.set(
+            key_for(args, {}), value, tags_for(args), generation)
+        return wrapper
+    return decorator
+
+
+def _copy(value):
+    """Shallow copy of a cached list or dict, so callers cannot reshape the entry"""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def invalidates(*tables):
+    """Invalidate cached reads of tables after a model write method runs"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                query_cache.invalidate(*tables)
+        return wrapper
+    return decorator
@@ -1,4 +1,3 @@
-
 # MySQL Database Configuration for XAMPP
 DB_CONFIG = {
     'host': 'localhost',
@@ -7,4 +6,42 @@ DB_CONFIG = {
     'database': 'smartenroll'
 }
 
-ACTIVE_CONFIG = DB_CONFIG
\ No newline at end of file
+ACTIVE_CONFIG = DB_CONFIG
+
+# Connection pool settings
+POOL_CONFIG = {
+    'pool_size': 5,              # Connections kept open and reused
+    'acquire_timeout': 10,       # Seconds to wait for a free connection
+    'health_check_interval': 30  # Ping connections idle longer than this (seconds)
+}
+
+# Query cache settings
+CACHE_CONFIG = {
+    'max_entries': 256,  # Least recently used entries are evicted beyond this
+    'ttl': 30            # Seconds before a cached result is re-read
+}
+
+# Main window settings
+UI_CONFIG = {
+    'prewarm_pages': True,  # Build the other pages while idle after the dashboard shows
+    'prewarm_delay': 1500   # Milliseconds to wait before pre-warming starts
+}
+
+# Query instrumentation settings
+QUERY_STATS_CONFIG = {
+    'enabled': True,                             # Time every statement the models run
+    'slow_query_ms': 200,                        # Statements slower than this are logged
+    'slow_log_file': 'logs/slow_queries.log',
+    'slow_log_max_bytes': 1024 * 1024,           # Rotate the log at this size
+    'slow_log_backups': 3                        # Rotated logs kept
+}
+
+# Application log settings
+LOG_CONFIG = {
+    'level': 'INFO',                  # TRACE, DEBUG, INFO, WARNING or ERROR
+    'console_level': 'INFO',          # Console shows this level and above
+    'file': 'logs/smartenroll.log',
+    'max_bytes': 5 * 1024 * 1024,     # Rotate the log at this size
+    'backups': 5,                     # Rotated logs kept
+    'trace_sample_rate': 100          # Keep 1 in N TRACE records per call site
+}
\ No newline at end of file
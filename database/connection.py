@@ -1,28 +1,213 @@
+"""
+Connection Pool - Hands out pooled MySQL connections to the models
+Each model call checks out its own connection, so a long report query
+no longer blocks enrollment writes or dashboard refreshes.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+
 import mysql.connector
 from mysql.connector import Error
-from database.config import ACTIVE_CONFIG
+from database.config import ACTIVE_CONFIG, POOL_CONFIG
+from database.query_stats import InstrumentedCursor, query_stats
+
+
+class PoolExhaustedError(Error):
+    """Raised when no connection becomes free within the acquire timeout"""
+
+
+class PooledConnection:
+    """A MySQL connection owned by the pool"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.last_used = time.monotonic()
+        self.in_transaction = False
+        self.rollback_only = False
+
+    def cursor(self, *args, **kwargs):
+        cursor = self.raw.cursor(*args, **kwargs)
+        if query_stats.enabled:
+            return InstrumentedCursor(cursor, query_stats)
+        return cursor
+
+    def commit(self):
+        """Commit, unless an outer transaction() owns this connection"""
+        if not self.in_transaction:
+            self.raw.commit()
+
+    def rollback(self):
+        """Roll back; inside transaction() the whole unit is rolled back on exit"""
+        if self.in_transaction:
+            self.rollback_only = True
+        else:
+            self.raw.rollback()
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
+class ConnectionPool:
+    """Thread-safe pool of MySQL connections with health checks"""
+
+    def __init__(self, config: dict = None, pool_size: int = None,
+                 acquire_timeout: float = None, health_check_interval: float = None):
+        self.config = config or ACTIVE_CONFIG
+        self.pool_size = pool_size or POOL_CONFIG['pool_size']
+        self.acquire_timeout = acquire_timeout or POOL_CONFIG['acquire_timeout']
+        self.health_check_interval = health_check_interval or POOL_CONFIG['health_check_interval']
+
+        self._idle = LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _open(self) -> PooledConnection:
+        """Open a new raw connection"""
+        raw = mysql.connector.connect(
+            host=self.config['host'],
+            user=self.config['user'],
+            password=self.config['password'],
+            database=self.config['database'],
+            autocommit=True
+        )
+        return PooledConnection(raw)
+
+    def _open_counted(self) -> PooledConnection:
+        """Open a connection that counts towards the pool size"""
+        try:
+            return self._open()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _discard(self, conn: PooledConnection):
+        """Close a broken connection and free its slot"""
+        try:
+            conn.raw.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def _acquire(self) -> PooledConnection:
+        """Take an idle connection, open a new one, or wait for one"""
+        try:
+            conn = self._idle.get_nowait()
+        except Empty:
+            with self._lock:
+                can_open = self._created < self.pool_size
+                if can_open:
+                    self._created += 1
+            if can_open:
+                return self._open_counted()
+
+            try:
+                conn = self._idle.get(timeout=self.acquire_timeout)
+            except Empty:
+                raise PoolExhaustedError(
+                    msg=f"No database connection available after {self.acquire_timeout}s"
+                )
+
+        return self._check_health(conn)
+
+    def _check_health(self, conn: PooledConnection) -> PooledConnection:
+        """Ping connections that sat idle too long, replacing dead ones"""
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return conn
+
+        try:
+            conn.raw.ping(reconnect=True, attempts=2, delay=1)
+            return conn
+        except Error:
+            self._discard(conn)
+            with self._lock:
+                self._created += 1
+            return self._open_counted()
+
+    def _release(self, conn: PooledConnection):
+        """Return a connection to the pool"""
+        try:
+            if not conn.raw.is_connected():
+                self._discard(conn)
+                return
+            conn.raw.consume_results()
+        except Exception:
+            self._discard(conn)
+            return
+
+        conn.in_transaction = False
+        conn.rollback_only = False
+        conn.last_used = time.monotonic()
+        self._idle.put(conn)
 
-class DatabaseConnection:
-    def __init__(self):
-        self.config = ACTIVE_CONFIG
+    @contextmanager
+    def connection(self):
+        """
+        Check out a connection for the duration of the block.
+        Nested calls on the same thread share the outer connection.
+        """
+        current = getattr(self._local, 'conn', None)
+        if current is not None:
+            yield current
+            return
 
-    def get_connection(self):
-        """Returns a raw MySQL connection"""
+        conn = self._acquire()
+        self._local.conn = conn
         try:
-            return mysql.connector.connect(
-                host=self.config['host'],
-                user=self.config['user'],
-                password=self.config['password'],
-                database=self.config['database']
-            )
-        except Error as e:
-            print(f"Database Connection Error: {e}")
-            return None
-
-    def test_connection(self):
+            yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the block as one atomic unit of work.
+        Nested transactions join the outer one.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.raw.start_transaction()
+            conn.in_transaction = True
+            conn.rollback_only = False
+            try:
+                yield conn
+            except BaseException:
+                conn.in_transaction = False
+                conn.raw.rollback()
+                raise
+
+            conn.in_transaction = False
+            if conn.rollback_only:
+                conn.raw.rollback()
+                raise Error(msg="Transaction rolled back by a nested operation")
+            conn.raw.commit()
+
+    def warm_up(self):
+        """Open the first connection so configuration errors surface at startup"""
+        with self.connection():
+            pass
+
+    def test_connection(self) -> bool:
         """Test if the database is accessible"""
-        conn = self.get_connection()
-        if conn:
-            conn.close()
-            return True
-        return False
\ No newline at end of file
+        try:
+            with self.connection() as conn:
+                return conn.raw.is_connected()
+        except Error:
+            return False
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(conn)
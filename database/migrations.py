@@ -0,0 +1,244 @@
+"""
+Schema Migrations - Versioned changes applied on top of the base schema
+The base schema is the one in "smartenroll (1).sql". Every later change is
+a numbered migration; the schema_version table records which have run, so
+startup costs a single version check once the database is current.
+Migrations are written to be repeatable, because databases upgraded by
+older releases may already contain some of their objects.
+"""
+from mysql.connector import Error, errorcode
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Tables the application cannot run without; they come from the SQL dump
+BASE_TABLES = (
+    'users', 'teachers', 'rooms', 'sections', 'students', 'academic_years',
+    'payment_transactions', 'student_status_history', 'section_assignments',
+)
+
+
+class MigrationError(Error):
+    """Raised when the database cannot be brought to the current schema"""
+
+
+def table_exists(cursor, table: str) -> bool:
+    cursor.execute("""
+                   SELECT COUNT(*)
+                   FROM information_schema.tables
+                   WHERE table_schema = DATABASE()
+                     AND table_name = %s
+                   """, (table,))
+    return cursor.fetchone()[0] > 0
+
+
+def ensure_index(cursor, table: str, index_name: str, definition: str) -> bool:
+    """Add an index to an existing table if it is missing; returns True if added"""
+    cursor.execute("""
+                   SELECT COUNT(*)
+                   FROM information_schema.statistics
+                   WHERE table_schema = DATABASE()
+                     AND table_name = %s
+                     AND index_name = %s
+                   """, (table, index_name))
+    if cursor.fetchone()[0] > 0:
+        return False
+    cursor.execute(f"ALTER TABLE {table} ADD {definition}")
+    return True
+
+
+def drop_index(cursor, table: str, index_name: str) -> bool:
+    """Drop an index if it exists; returns True if dropped"""
+    cursor.execute("""
+                   SELECT COUNT(*)
+                   FROM information_schema.statistics
+                   WHERE table_schema = DATABASE()
+                     AND table_name = %s
+                     AND index_name = %s
+                   """, (table, index_name))
+    if cursor.fetchone()[0] == 0:
+        return False
+    cursor.execute(f"ALTER TABLE {table} DROP INDEX {index_name}")
+    return True
+
+
+def ensure_column(cursor, table: str, column: str, definition: str) -> bool:
+    """Add a column to an existing table if it is missing; returns True if added"""
+    cursor.execute("""
+                   SELECT COUNT(*)
+                   FROM information_schema.columns
+                   WHERE table_schema = DATABASE()
+                     AND table_name = %s
+                     AND column_name = %s
+                   """, (table, column))
+    if cursor.fetchone()[0] > 0:
+        return False
+    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {definition}")
+    return True
+
+
+# --- Migrations ------------------------------------------------------------
+# Each takes (cursor, database) where database is the models.Database.
+
+def _check_base_schema(cursor, database):
+    missing = [table for table in BASE_TABLES if not table_exists(cursor, table)]
+    if missing:
+        raise MigrationError(
+            msg=f"Missing tables: {', '.join(missing)}. "
+                "Import smartenroll (1).sql into the database first."
+        )
+
+
+def _create_enrollment_counters(cursor, database):
+    # Enrolled counts per strand/section/year, kept current by the Student model
+    cursor.execute("""
+                   CREATE TABLE IF NOT EXISTS enrollment_counters
+                   (
+                       strand VARCHAR(100) NOT NULL,
+                       section_id INT NOT NULL DEFAULT 0,
+                       academic_year_id INT NOT NULL DEFAULT 0,
+                       enrolled INT NOT NULL DEFAULT 0,
+                       PRIMARY KEY (strand, section_id, academic_year_id)
+                   )
+                   """)
+    cursor.execute("SELECT COUNT(*) FROM enrollment_counters")
+    if cursor.fetchone()[0] == 0 and not database.students.rebuild_enrollment_counters():
+        raise MigrationError(msg="Could not fill enrollment_counters from the students table")
+
+
+def _add_student_search_index(cursor, database):
+    # Full-text index behind the student search box
+    ensure_index(cursor, 'students', 'ft_student_search',
+                 "FULLTEXT INDEX ft_student_search (full_name, email)")
+
+
+def _add_status_enrolled_index(cursor, database):
+    # Keyset pagination of student listings, newest first
+    ensure_index(cursor, 'students', 'idx_status_enrolled',
+                 "INDEX idx_status_enrolled (status, enrollment_date)")
+
+
+def _create_receipt_sequences(cursor, database):
+    # Last receipt number issued per day
+    if table_exists(cursor, 'receipt_sequences'):
+        return
+    cursor.execute("""
+                   CREATE TABLE receipt_sequences
+                   (
+                       seq_date DATE PRIMARY KEY,
+                       last_number INT NOT NULL DEFAULT 0
+                   )
+                   """)
+    # Continue from receipts issued before the sequence existed
+    cursor.execute("""
+                   INSERT INTO receipt_sequences (seq_date, last_number)
+                   SELECT STR_TO_DATE(SUBSTRING(receipt_number, 5, 8), '%Y%m%d'),
+                          MAX(CAST(SUBSTRING(receipt_number, 14) AS UNSIGNED))
+                   FROM payment_transactions
+                   WHERE receipt_number LIKE 'REC-________-%'
+                   GROUP BY SUBSTRING(receipt_number, 5, 8)
+                   """)
+
+
+def _add_section_enrolled_count(cursor, database):
+    # Seats taken per section, reserved atomically on enrollment
+    ensure_column(cursor, 'sections', 'enrolled_count', "enrolled_count INT NOT NULL DEFAULT 0")
+    # Recount even when the column exists, so a run that failed here is finished on retry
+    if not database.sections.rebuild_enrolled_counts():
+        raise MigrationError(msg="Could not count the students enrolled in each section")
+
+
+# Composite indexes for the model queries: (table, name, columns, what uses it)
+COMPOSITE_INDEXES = [
+    ('students', 'idx_strand_status_date', 'strand, status, enrollment_date',
+     "strand-filtered listings, newest first"),
+    ('students', 'idx_status_strand_section', 'status, strand, section_id, academic_year_id',
+     "per-strand/section enrollment counts (covering)"),
+    ('students', 'idx_section_status', 'section_id, status',
+     "students of a section, section seat recounts"),
+    ('payment_transactions', 'idx_student_date', 'student_id, payment_date, created_at',
+     "a student's payment history, newest first"),
+    ('sections', 'idx_strand_status', 'strand, status, section_name',
+     "open sections of a strand, seat reservation"),
+]
+
+# Single-column indexes that are now a leading prefix of a composite one
+SUPERSEDED_INDEXES = [
+    ('students', 'idx_strand'),
+    ('students', 'idx_section'),
+    ('payment_transactions', 'idx_student'),
+]
+
+
+def _add_composite_indexes(cursor, database):
+    for table, name, columns, _ in COMPOSITE_INDEXES:
+        ensure_index(cursor, table, name, f"INDEX {name} ({columns})")
+    # Dropped after the composites exist, so foreign keys always keep an index
+    for table, name in SUPERSEDED_INDEXES:
+        drop_index(cursor, table, name)
+
+
+# (version, description, function) in the order they must run. Append new
+# migrations at the end with the next version number; never renumber.
+MIGRATIONS = [
+    (1, "Check base schema", _check_base_schema),
+    (2, "Enrollment counters summary table", _create_enrollment_counters),
+    (3, "Student search full-text index", _add_student_search_index),
+    (4, "Student status/enrollment date index", _add_status_enrolled_index),
+    (5, "Daily receipt number sequences", _create_receipt_sequences),
+    (6, "Section enrolled seat counts", _add_section_enrolled_count),
+    (7, "Composite indexes for model queries", _add_composite_indexes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+class MigrationRunner:
+    """Applies pending migrations and records them in schema_version"""
+
+    def __init__(self, database):
+        self.database = database
+        self.pool = database.pool
+
+    def current_version(self, cursor) -> int:
+        """Highest applied version; 0 when schema_version does not exist yet"""
+        try:
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            return cursor.fetchone()[0]
+        except Error as e:
+            if e.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+            cursor.execute("""
+                           CREATE TABLE schema_version
+                           (
+                               version INT PRIMARY KEY,
+                               description VARCHAR(200) NOT NULL,
+                               applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                           )
+                           """)
+            return 0
+
+    def migrate(self) -> int:
+        """Run every migration newer than the database; returns how many ran"""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                version = self.current_version(cursor)
+                if version >= LATEST_VERSION:
+                    return 0
+
+                applied = 0
+                for number, description, migration in MIGRATIONS:
+                    if number <= version:
+                        continue
+                    logger.info("🔧 Migration %s: %s", number, description)
+                    migration(cursor, self.database)
+                    cursor.execute(
+                        "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                        (number, description)
+                    )
+                    conn.commit()
+                    applied += 1
+                return applied
+            finally:
+                cursor.close()
\ No newline at end of file
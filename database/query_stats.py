@@ -0,0 +1,240 @@
+"""
+Query Stats - Per-statement timing for every query the models run
+Pooled connections hand out instrumented cursors that record each
+statement's latency (execute plus fetching its rows), the rows it returned
+or changed, and the model method that issued it. Totals are also kept per
+page, so a page switch can be traced to the queries it caused. Statements
+slower than the configured threshold go to a rotating slow-query log.
+"""
+import functools
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+from database.config import QUERY_STATS_CONFIG
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Frames in these directories are the model methods that issue SQL
+_MODELS_DIR = os.path.normcase(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+)
+
+# "IN (%s, %s, %s)" lists vary in length; count them as one statement
+_PLACEHOLDER_LIST = re.compile(r"%s(?:\s*,\s*%s)+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Statement text with whitespace collapsed and IN lists folded"""
+    return _PLACEHOLDER_LIST.sub("%s, ...", " ".join(str(statement).split()))
+
+
+@functools.lru_cache(maxsize=None)
+def _is_model_file(filename: str) -> bool:
+    return os.path.normcase(os.path.dirname(os.path.abspath(filename))) == _MODELS_DIR
+
+
+def calling_method() -> str:
+    """'Class.method' of the nearest model frame on the stack"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if _is_model_file(code.co_filename):
+            return getattr(code, 'co_qualname', code.co_name)
+        frame = frame.f_back
+    return "(outside models)"
+
+
+class QueryStats:
+    """Thread-safe aggregates of statement timings"""
+
+    def __init__(self, slow_query_ms: float = None, enabled: bool = None):
+        config = QUERY_STATS_CONFIG
+        self.enabled = config['enabled'] if enabled is None else enabled
+        self.slow_query_ms = slow_query_ms or config['slow_query_ms']
+
+        self.page = None  # Page on screen; queries are charged to it
+        self.started_at = time.time()
+
+        self._statements = {}  # (caller, statement) -> totals
+        self._pages = {}  # page -> totals
+        self._lock = threading.Lock()
+        self._slow_log = None
+
+    def record(self, caller: str, statement: str, elapsed_ms: float, rows: int):
+        """Add one executed statement"""
+        statement = normalize_statement(statement)
+        page = self.page
+        with self._lock:
+            totals = self._statements.get((caller, statement))
+            if totals is None:
+                totals = self._statements[(caller, statement)] = {
+                    'caller': caller, 'statement': statement,
+                    'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0,
+                }
+            totals['count'] += 1
+            totals['total_ms'] += elapsed_ms
+            totals['max_ms'] = max(totals['max_ms'], elapsed_ms)
+            totals['rows'] += rows
+
+            if page is not None:
+                page_totals = self._page_totals(page)
+                page_totals['queries'] += 1
+                page_totals['query_ms'] += elapsed_ms
+
+        if elapsed_ms >= self.slow_query_ms:
+            self._log_slow(caller, statement, elapsed_ms, rows, page)
+
+    def record_page_switch(self, page: str, elapsed_ms: float):
+        """Add the time a switch to page took on the GUI thread"""
+        with self._lock:
+            page_totals = self._page_totals(page)
+            page_totals['visits'] += 1
+            page_totals['switch_ms'] += elapsed_ms
+
+    def _page_totals(self, page: str) -> dict:
+        totals = self._pages.get(page)
+        if totals is None:
+            totals = self._pages[page] = {
+                'page': page, 'visits': 0, 'switch_ms': 0.0, 'queries': 0, 'query_ms': 0.0,
+            }
+        return totals
+
+    def statements(self) -> list:
+        """Copies of the per-statement totals, most total time first"""
+        with self._lock:
+            rows = [dict(totals) for totals in self._statements.values()]
+        for row in rows:
+            row['avg_ms'] = row['total_ms'] / row['count']
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def pages(self) -> list:
+        """Copies of the per-page totals, most query time first"""
+        with self._lock:
+            rows = [dict(totals) for totals in self._pages.values()]
+        return sorted(rows, key=lambda row: row['query_ms'], reverse=True)
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._statements.clear()
+            self._pages.clear()
+            self.started_at = time.time()
+
+    @property
+    def slow_log_path(self) -> str:
+        return QUERY_STATS_CONFIG['slow_log_file']
+
+    def _log_slow(self, caller, statement, elapsed_ms, rows, page):
+        # Parameters are left out: they carry student details
+        try:
+            if self._slow_log is None:
+                self._slow_log = self._open_slow_log()
+            self._slow_log.warning("%.1f ms | %d rows | %s | page=%s | %s",
+                                   elapsed_ms, rows, caller, page or "-", statement)
+        except Exception as e:
+            logger.warning("⚠️ Could not write slow query log: %s", e)
+
+    def _open_slow_log(self) -> logging.Logger:
+        with self._lock:
+            if self._slow_log is not None:
+                return self._slow_log
+            path = self.slow_log_path
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(path,
+                                          maxBytes=QUERY_STATS_CONFIG['slow_log_max_bytes'],
+                                          backupCount=QUERY_STATS_CONFIG['slow_log_backups'],
+                                          encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger = logging.getLogger("smartenroll.slow_queries")
+            logger.addHandler(handler)
+            logger.setLevel(logging.WARNING)
+            logger.propagate = False
+            return logger
+
+
+class InstrumentedCursor:
+    """
+    Cursor proxy that times each statement until its rows are read.
+    A statement is recorded when the next one starts, when its last row
+    has been fetched, or when the cursor is closed.
+    """
+
+    def __init__(self, cursor, stats: QueryStats):
+        self._cursor = cursor
+        self._stats = stats
+        self._pending = None  # [caller, statement, elapsed_ms, rows fetched or None]
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._flush()
+        caller = calling_method()
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            self._pending = [caller, operation, (time.perf_counter() - started) * 1000, None]
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        self._flush()
+        caller = calling_method()
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            self._pending = [caller, operation, (time.perf_counter() - started) * 1000, None]
+
+    def _fetched(self, started: float, rows: int, done: bool):
+        pending = self._pending
+        if pending is None:
+            return
+        pending[2] += (time.perf_counter() - started) * 1000
+        pending[3] = (pending[3] or 0) + rows
+        if done:
+            self._flush()
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(started, row is not None, row is None)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(started, len(rows), not rows)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(started, len(rows), True)
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        self._flush()
+        return self._cursor.close()
+
+    def _flush(self):
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        caller, statement, elapsed_ms, rows = pending
+        if rows is None:
+            # Nothing fetched: a write, or a read whose rows were not wanted
+            rows = max(getattr(self._cursor, 'rowcount', 0) or 0, 0)
+        self._stats.record(caller, statement, elapsed_ms, rows)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+# Shared stats for all pooled connections
+query_stats = QueryStats()
@@ -0,0 +1,43 @@
+"""
+Receipt Reservation - Hands a block of receipt numbers to an offline station
+A station that records payments without a connection prints receipts from
+a block reserved here beforehand, then posts each payment with its
+reserved number as PaymentData.receipt_number when it syncs:
+
+    python -m database.reserve_receipts count [YYYY-MM-DD] > block.txt
+
+Prints one receipt number per line. The numbers come from the same daily
+sequence as payments posted online, so the two never collide.
+"""
+import sys
+from datetime import datetime
+
+
+def main():
+    from models.database import Database
+
+    if len(sys.argv) < 2:
+        print("usage: python -m database.reserve_receipts count [YYYY-MM-DD]", file=sys.stderr)
+        sys.exit(2)
+
+    count = int(sys.argv[1])
+    day = datetime.strptime(sys.argv[2], "%Y-%m-%d").date() if len(sys.argv) > 2 else None
+
+    database = Database()
+    if not database.pool:
+        sys.exit(2)
+
+    ok, message, numbers = database.payments.reserve_receipt_numbers(count, day)
+    database.close()
+
+    if not ok:
+        print(f"❌ {message}", file=sys.stderr)
+        sys.exit(1)
+
+    print(message, file=sys.stderr)
+    for number in numbers:
+        print(number)
+
+
+if __name__ == "__main__":
+    main()
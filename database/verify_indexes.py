@@ -0,0 +1,213 @@
+"""
+Index Verifier - EXPLAINs the statements the models actually run
+Every read path of the models is called once while the SQL it issues is
+recorded; each recorded statement is then EXPLAINed and any full table
+scan of a large table is reported. Run against a production-sized copy:
+
+    python -m database.verify_indexes [min_rows]
+
+Exits with status 1 when a statement scans a large table, unless the
+call is listed in EXPECTED_FULL_SCANS; those are reported but allowed.
+"""
+import re
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from database.cache import query_cache
+
+# Tables with fewer rows than this are cheap to scan and are not reported
+LARGE_TABLE_ROWS = 1000
+
+# Calls that read whole tables by design -> why; reported without failing
+EXPECTED_FULL_SCANS = {
+    "students.get_all_students": "lists every enrolled student",
+    "payments.get_payment_stats": "totals every payment transaction",
+    "directory.load": "builds the typeahead index from every enrolled student",
+}
+
+# "FROM students s" / "JOIN sections AS sec" -> table and alias
+TABLE_ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|LEFT\b|INNER\b|JOIN\b|GROUP\b|ORDER\b|LIMIT\b|FOR\b)(\w+))?",
+                         re.IGNORECASE)
+
+
+class _RecordingCursor:
+    """Cursor proxy that records every statement it executes"""
+
+    def __init__(self, cursor, statements: list):
+        self._cursor = cursor
+        self._statements = statements
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._statements.append((operation, params))
+        return self._cursor.execute(operation, params, *args, **kwargs)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        seq_params = list(seq_params)
+        if seq_params:
+            self._statements.append((operation, seq_params[0]))
+        return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+@contextmanager
+def record_statements(pool):
+    """Record the statements models run on this thread inside the block"""
+    statements = []
+    # Model calls on this thread reuse the outer pooled connection
+    with pool.connection() as conn:
+        original = conn.cursor
+        conn.cursor = lambda *args, **kwargs: _RecordingCursor(original(*args, **kwargs), statements)
+        try:
+            yield statements
+        finally:
+            del conn.cursor
+
+
+def _model_calls(database, sample: dict) -> list:
+    """(name, callable) for every model read path, with sample arguments"""
+    students, sections, payments = database.students, database.sections, database.payments
+    week_ago = datetime.now() - timedelta(days=7)
+    strand = sample['strand']
+    return [
+        ("students.get_all_students", lambda: students.get_all_students()),
+        ("students.get_student_by_id", lambda: students.get_student_by_id(sample['student_id'])),
+        ("students.get_students_by_section", lambda: students.get_students_by_section(sample['section_id'])),
+        ("students.get_recent_enrollments", lambda: students.get_recent_enrollments(10)),
+        ("students.get_enrollments_by_date", lambda: students.get_enrollments_by_date(week_ago)),
+        ("students.get_students_page", lambda: students.get_students_page({})),
+        ("students.get_students_page(strand)", lambda: students.get_students_page({'strand': strand})),
+        ("students.get_enrollment_stats", lambda: students.get_enrollment_stats()),
+        ("students.get_enrollment_stats(date)", lambda: students.get_enrollment_stats(date_filter=week_ago)),
+        ("students.search_students(name)", lambda: students.search_students(sample['name'])),
+        ("students.search_students(lrn)", lambda: students.search_students(sample['lrn'][:6])),
+        ("students.advanced_search", lambda: students.advanced_search({'strand': strand, 'status': 'Enrolled'})),
+        ("students.get_registration_form_rows", lambda: students.get_registration_form_rows(sample['section_id'])),
+        ("sections.get_all_sections", lambda: sections.get_all_sections()),
+        ("sections.get_section_by_id", lambda: sections.get_section_by_id(sample['section_id'])),
+        ("sections.get_sections_by_strand", lambda: sections.get_sections_by_strand(strand)),
+        ("profiles.get_profile", lambda: database.profiles.get_profile(sample['student_id'])),
+        ("payments.get_student_payments", lambda: payments.get_student_payments(sample['student_id'])),
+        ("payments.get_payment_summary", lambda: payments.get_payment_summary(sample['student_id'])),
+        ("payments.get_payments_page", lambda: payments.get_payments_page()),
+        ("payments.get_payments_page(dates)", lambda: payments.get_payments_page(week_ago.date(), datetime.now().date())),
+        ("payments.get_payment_stats", lambda: payments.get_payment_stats()),
+        ("academic_years.get_year_stats", lambda: database.academic_years.get_year_stats(sample['year_id'])),
+        ("teachers.get_all_teachers", lambda: database.teachers.get_all_teachers()),
+        ("rooms.get_all_rooms", lambda: database.rooms.get_all_rooms()),
+        ("users.get_all_users", lambda: database.users.get_all_users()),
+        ("directory.load", lambda: database.directory.load()),
+    ]
+
+
+def _sample_values(cursor) -> dict:
+    """Real ids and values to call the models with"""
+    cursor.execute("SELECT id, lrn, last_name, strand, COALESCE(section_id, 0) FROM students LIMIT 1")
+    row = cursor.fetchone() or (0, "000000000000", "a", "STEM", 0)
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM academic_years")
+    year_id = cursor.fetchone()[0]
+    return {'student_id': row[0], 'lrn': row[1], 'name': row[2], 'strand': row[3],
+            'section_id': row[4], 'year_id': year_id}
+
+
+def _table_sizes(cursor) -> dict:
+    cursor.execute("""
+                   SELECT table_name, table_rows
+                   FROM information_schema.tables
+                   WHERE table_schema = DATABASE()
+                   """)
+    return {name: rows or 0 for name, rows in cursor.fetchall()}
+
+
+def _full_scans(cursor, statement: str, params, sizes: dict, min_rows: int) -> list:
+    """(table, rows) of every large table the statement reads in full"""
+    # EXPLAIN names tables by their alias
+    aliases = {}
+    for table, alias in TABLE_ALIAS.findall(statement):
+        aliases[alias or table] = table
+
+    cursor.execute(f"EXPLAIN {statement}", params)
+    columns = [column[0] for column in cursor.description]
+    scans = []
+    for values in cursor.fetchall():
+        row = dict(zip(columns, values))
+        table = aliases.get(row.get('table'), row.get('table'))
+        # Derived tables have no size of their own; use the optimizer's estimate
+        rows = sizes.get(table, row.get('rows') or 0)
+        if row.get('type') == 'ALL' and rows >= min_rows:
+            scans.append((table, rows))
+    return scans
+
+
+def verify(database, min_rows: int = LARGE_TABLE_ROWS) -> list:
+    """
+    Run every model read path and EXPLAIN what it executed.
+    Returns (call name, statement, [(table, rows)]) for each full scan
+    of a table with at least min_rows rows.
+    """
+    pool = database.pool
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        sample = _sample_values(cursor)
+        sizes = _table_sizes(cursor)
+        cursor.close()
+
+    problems = []
+    for name, call in _model_calls(database, sample):
+        query_cache.clear()  # Cached results would skip the SQL
+        with record_statements(pool) as statements:
+            call()
+
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+            for statement, params in statements:
+                if not statement.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE')):
+                    continue
+                try:
+                    scans = _full_scans(cursor, statement, params, sizes, min_rows)
+                except Exception as e:
+                    print(f"⚠️ Could not EXPLAIN statement from {name}: {e}")
+                    continue
+                if scans:
+                    problems.append((name, " ".join(statement.split()), scans))
+            cursor.close()
+
+    return problems
+
+
+def main():
+    from models.database import Database
+
+    min_rows = int(sys.argv[1]) if len(sys.argv) > 1 else LARGE_TABLE_ROWS
+    database = Database()
+    if not database.pool:
+        sys.exit(2)
+
+    problems = verify(database, min_rows)
+    database.close()
+
+    expected = [problem for problem in problems if problem[0] in EXPECTED_FULL_SCANS]
+    problems = [problem for problem in problems if problem[0] not in EXPECTED_FULL_SCANS]
+
+    for name, statement, scans in expected:
+        tables = ", ".join(f"{table} (~{rows} rows)" for table, rows in scans)
+        print(f"ℹ️ Expected full scan in {name} ({EXPECTED_FULL_SCANS[name]}): {tables}")
+
+    if not problems:
+        print(f"✅ No unexpected full scans of tables with {min_rows}+ rows")
+        return
+
+    print(f"❌ {len(problems)} statement(s) scan a large table:")
+    for name, statement, scans in problems:
+        tables = ", ".join(f"{table} (~{rows} rows)" for table, rows in scans)
+        print(f"\n  {name}: {tables}\n    {statement[:300]}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -3,12 +3,15 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 from controllers.main_controller import MainController
+from utils.log import get_logger, setup_logging
+
+logger = get_logger(__name__)
 
 
 def main():
-    print("=" * 60)
-    print("SmartEnroll - Starting Application (MVC Architecture)")
-    print("=" * 60)
+    # Log through the background queue before anything else is created
+    setup_logging()
+    logger.info("SmartEnroll - Starting Application (MVC Architecture)")
 
     # ✅ CRITICAL: Enable High DPI scaling BEFORE creating QApplication
     QApplication.setHighDpiScaleFactorRoundingPolicy(
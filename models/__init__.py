@@ -1 +1 @@
-
+
@@ -4,10 +4,16 @@ Academic Year Model - Handles school year and semester management
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
 from datetime import date
+from database.cache import cached, invalidates, query_cache, skip_cache
+from models import events
+from models.rows import Row
+from utils.log import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
-class AcademicYearData:
+
+@dataclass(slots=True)
+class AcademicYearData(Row):
     """Academic year data blueprint"""
     id: Optional[int] = None
     year_name: str = ""
@@ -43,148 +49,210 @@ class AcademicYear:
     def __init__(self, db):
         self.db = db
 
+    @cached("academic_years")
     def get_all_years(self) -> List[dict]:
         """Get all academic years"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT id, year_name, start_date, end_date, semester, is_active
-                    FROM academic_years
-                    ORDER BY start_date DESC \
-                    """
-            cursor.execute(query)
-            years = cursor.fetchall()
-            cursor.close()
-            return years
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                        SELECT id, year_name, start_date, end_date, semester, is_active
+                        FROM academic_years
+                        ORDER BY start_date DESC \
+                        """
+                cursor.execute(query)
+                years = cursor.fetchall()
+                cursor.close()
+                return years
         except Exception as e:
-            print(f"Error getting academic years: {e}")
+            logger.error("Error getting academic years: %s", e)
+            skip_cache()
             return []
 
+    @cached("academic_years")
     def get_active_year(self) -> Optional[dict]:
         """Get the currently active academic year"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT id, year_name, start_date, end_date, semester, is_active
-                    FROM academic_years
-                    WHERE is_active = TRUE LIMIT 1 \
-                    """
-            cursor.execute(query)
-            year = cursor.fetchone()
-            cursor.close()
-            return year
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                        SELECT id, year_name, start_date, end_date, semester, is_active
+                        FROM academic_years
+                        WHERE is_active = TRUE LIMIT 1 \
+                        """
+                cursor.execute(query)
+                year = cursor.fetchone()
+                cursor.close()
+                return year
         except Exception as e:
-            print(f"Error getting active year: {e}")
+            logger.error("Error getting active year: %s", e)
+            skip_cache()
             return None
 
+    @invalidates("academic_years")
     def add_year(self, year_name: str, start_date: date, end_date: date,
                  semester: str = "Full Year") -> Tuple[bool, str]:
         """Add a new academic year"""
         try:
-            cursor = self.db.cursor()
-
-            # Check if year already exists
-            cursor.execute("SELECT id FROM academic_years WHERE year_name = %s", (year_name,))
-            if cursor.fetchone():
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                # Check if year already exists
+                cursor.execute("SELECT id FROM academic_years WHERE year_name = %s", (year_name,))
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, f"Academic year '{year_name}' already exists"
+
+                # Insert new year (inactive by default)
+                query = """
+                        INSERT INTO academic_years (year_name, start_date, end_date, semester, is_active)
+                        VALUES (%s, %s, %s, %s, FALSE) \
+                        """
+                cursor.execute(query, (year_name, start_date, end_date, semester))
+                conn.commit()
                 cursor.close()
-                return False, f"Academic year '{year_name}' already exists"
-
-            # Insert new year (inactive by default)
-            query = """
-                    INSERT INTO academic_years (year_name, start_date, end_date, semester, is_active)
-                    VALUES (%s, %s, %s, %s, FALSE) \
-                    """
-            cursor.execute(query, (year_name, start_date, end_date, semester))
-            self.db.commit()
-            cursor.close()
 
-            return True, "Academic year added successfully"
+                return True, "Academic year added successfully"
 
         except Exception as e:
-            print(f"Error adding academic year: {e}")
+            logger.error("Error adding academic year: %s", e)
             return False, f"Failed to add academic year: {str(e)}"
 
+    @invalidates("academic_years")
     def set_active_year(self, year_id: int) -> Tuple[bool, str]:
         """Set a year as active (deactivates all others)"""
         try:
-            cursor = self.db.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
 
-            # Deactivate all years
-            cursor.execute("UPDATE academic_years SET is_active = FALSE")
+                # Deactivate all years
+                cursor.execute("UPDATE academic_years SET is_active = FALSE")
 
-            # Activate selected year
-            cursor.execute("UPDATE academic_years SET is_active = TRUE WHERE id = %s", (year_id,))
+                # Activate selected year
+                cursor.execute("UPDATE academic_years SET is_active = TRUE WHERE id = %s", (year_id,))
 
-            self.db.commit()
-            cursor.close()
+                conn.commit()
+                cursor.close()
 
-            return True, "Active academic year updated"
+                return True, "Active academic year updated"
 
         except Exception as e:
-            print(f"Error setting active year: {e}")
+            logger.error("Error setting active year: %s", e)
             return False, f"Failed to set active year: {str(e)}"
 
-    def delete_year(self, year_id: int) -> Tuple[bool, str]:
-        """Delete an academic year"""
-        try:
-            cursor = self.db.cursor()
-
-            # Check if year has students
-            cursor.execute("SELECT COUNT(*) FROM students WHERE academic_year_id = %s", (year_id,))
-            student_count = cursor.fetchone()[0]
+    def rollover(self, to_year_id: int, user_id: int = None) -> Tuple[bool, str]:
+        """
+        Close the active year: promote its enrolled Grade 11 students to
+        Grade 12 sections of to_year_id, record their status history and
+        section assignments, and make to_year_id the active year, all in one
+        transaction.
+        """
+        from models.student import Student
 
-            if student_count > 0:
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Lock the year rows so two stations cannot roll over at once
+                cursor.execute("""
+                               SELECT id, year_name, is_active
+                               FROM academic_years
+                               WHERE is_active = TRUE OR id = %s
+                               FOR UPDATE
+                               """, (to_year_id,))
+                years = cursor.fetchall()
+                target = next((year for year in years if year[0] == to_year_id), None)
+                current = next((year for year in years if year[2]), None)
+
+                if target is None:
+                    cursor.close()
+                    return False, "Academic year not found"
+                if target[2]:
+                    cursor.close()
+                    return False, f"{target[1]} is already the active academic year"
+
+                promoted, unassigned = Student(self.db).promote_grade_11(
+                    cursor, current[0] if current else None, to_year_id,
+                    f"Promoted to Grade 12 for {target[1]}", user_id
+                )
+
+                cursor.execute("UPDATE academic_years SET is_active = (id = %s)", (to_year_id,))
                 cursor.close()
-                return False, f"Cannot delete: {student_count} students enrolled in this academic year"
 
-            # Check if it's the active year
-            cursor.execute("SELECT is_active FROM academic_years WHERE id = %s", (year_id,))
-            result = cursor.fetchone()
-            if result and result[0]:
+        except Exception as e:
+            logger.exception("Error rolling over academic year: %s", e)
+            return False, f"Failed to roll over academic year: {str(e)}"
+
+        finally:
+            # Nearly every cached student, section and counter result is now stale
+            query_cache.clear()
+
+        logger.info("Rolled over to %s: %s students promoted, %s without a section",
+                    target[1], promoted, unassigned)
+        events.publish(events.YEAR_ROLLED_OVER, year_id=to_year_id, year_name=target[1],
+                       promoted=promoted, unassigned=unassigned)
+        message = f"{target[1]} is now active. {promoted} students promoted to Grade 12"
+        if unassigned:
+            message += f"; {unassigned} could not be given a Grade 12 section"
+        return True, message
+
+    @invalidates("academic_years")
+    def delete_year(self, year_id: int) -> Tuple[bool, str]:
+        """Delete an academic year"""
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                # Check if year has students
+                cursor.execute("SELECT COUNT(*) FROM students WHERE academic_year_id = %s", (year_id,))
+                student_count = cursor.fetchone()[0]
+
+                if student_count > 0:
+                    cursor.close()
+                    return False, f"Cannot delete: {student_count} students enrolled in this academic year"
+
+                # Check if it's the active year
+                cursor.execute("SELECT is_active FROM academic_years WHERE id = %s", (year_id,))
+                result = cursor.fetchone()
+                if result and result[0]:
+                    cursor.close()
+                    return False, "Cannot delete the active academic year"
+
+                # Delete year
+                cursor.execute("DELETE FROM academic_years WHERE id = %s", (year_id,))
+                conn.commit()
                 cursor.close()
-                return False, "Cannot delete the active academic year"
 
-            # Delete year
-            cursor.execute("DELETE FROM academic_years WHERE id = %s", (year_id,))
-            self.db.commit()
-            cursor.close()
-
-            return True, "Academic year deleted successfully"
+                return True, "Academic year deleted successfully"
 
         except Exception as e:
-            print(f"Error deleting academic year: {e}")
+            logger.error("Error deleting academic year: %s", e)
             return False, f"Failed to delete academic year: {str(e)}"
 
+    @cached("enrollment_counters")
     def get_year_stats(self, year_id: int) -> dict:
         """Get statistics for a specific academic year"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-
-            # Total students
-            cursor.execute("""
-                           SELECT COUNT(*) as total_students
-                           FROM students
-                           WHERE academic_year_id = %s
-                             AND status = 'Enrolled'
-                           """, (year_id,))
-            stats = cursor.fetchone()
-
-            # By strand
-            cursor.execute("""
-                           SELECT strand, COUNT(*) as count
-                           FROM students
-                           WHERE academic_year_id = %s AND status = 'Enrolled'
-                           GROUP BY strand
-                           """, (year_id,))
-            by_strand = cursor.fetchall()
-
-            cursor.close()
-
-            return {
-                'total_students': stats['total_students'],
-                'by_strand': by_strand
-            }
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+
+                # By strand, from the maintained enrollment counters
+                cursor.execute("""
+                               SELECT strand, CAST(SUM(enrolled) AS SIGNED) as count
+                               FROM enrollment_counters
+                               WHERE academic_year_id = %s
+                               GROUP BY strand
+                               """, (year_id,))
+                by_strand = cursor.fetchall()
+
+                cursor.close()
+
+                return {
+                    'total_students': sum(row['count'] for row in by_strand),
+                    'by_strand': by_strand
+                }
 
         except Exception as e:
-            print(f"Error getting year stats: {e}")
+            logger.error("Error getting year stats: %s", e)
+            skip_cache()
             return {'total_students': 0, 'by_strand': []}
\ No newline at end of file
@@ -1,10 +1,11 @@
 """
 Central Database Manager for SmartEnroll
-Initializes all model classes with database connection
+Initializes all model classes with a pooled connection manager
 """
-import mysql.connector
 from mysql.connector import Error
 from database.config import ACTIVE_CONFIG
+from database.connection import ConnectionPool
+from database.migrations import MigrationRunner
 from models.student import Student
 from models.teacher import Teacher
 from models.section import Section
@@ -12,6 +13,12 @@ from models.room import Room
 from models.user import User
 from models.academic_year import AcademicYear
 from models.payment import Payment
+from models.student_directory import StudentDirectory
+from models.student_profile import StudentProfiles
+from models.student_import import StudentImporter
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 
@@ -19,323 +26,73 @@ class Database:
     """Central database manager that initializes all models"""
 
     def __init__(self):
-        self.db = self._create_connection()
-
-        if self.db is not None:
-            # Initialize all models with database connection
-            self.students = Student(self.db)
-            self.teachers = Teacher(self.db)
-            self.sections = Section(self.db)
-            self.academic_years = AcademicYear(self.db)
-            self.payments = Payment(self.db)
-            self.rooms = Room(self.db)
-            self.users = User(self.db)
-
-            print("✅ Database initialized successfully")
-            print(f"   - Academic Years model: {self.academic_years}")
-            print(f"   - Payments model: {self.payments}")
-            print(f"   - Students model: {self.students}")
-            print(f"   - Teachers model: {self.teachers}")
-            print(f"   - Sections model: {self.sections}")
-            print(f"   - Rooms model: {self.rooms}")
-            print(f"   - Users model: {self.users}")
+        self.pool = self._create_pool()
+
+        if self.pool is not None:
+            # Initialize all models with the connection pool
+            self.students = Student(self.pool)
+            self.teachers = Teacher(self.pool)
+            self.sections = Section(self.pool)
+            self.academic_years = AcademicYear(self.pool)
+            self.payments = Payment(self.pool)
+            self.rooms = Room(self.pool)
+            self.users = User(self.pool)
+
+            # Student details dialog data, cached per student
+            self.profiles = StudentProfiles(self.pool)
+
+            # In-memory typeahead index, loaded in the background by the dashboard
+            self.directory = StudentDirectory(self.pool)
+
+            # Bulk CSV/Excel enrollment
+            self.student_importer = StudentImporter(self.pool)
+
+            logger.info("✅ Database initialized successfully")
+            logger.debug("Models: %s, %s, %s, %s, %s, %s, %s",
+                         self.academic_years, self.payments, self.students, self.teachers,
+                         self.sections, self.rooms, self.users)
         else:
-            print("❌ Database connection failed!")
+            logger.error("❌ Database connection failed!")
 
-    def _create_connection(self):
-        """Create MySQL database connection"""
-        db = None
+    def _create_pool(self):
+        """Create the MySQL connection pool"""
+        pool = None
         try:
-            db = mysql.connector.connect(
-                host=ACTIVE_CONFIG['host'],
-                user=ACTIVE_CONFIG['user'],
-                password=ACTIVE_CONFIG['password'],
-                database=ACTIVE_CONFIG['database'],
-                autocommit=True
-            )
-            print(f"✅ Connected to database: {ACTIVE_CONFIG['database']}")
+            pool = ConnectionPool(ACTIVE_CONFIG)
+            pool.warm_up()
+            logger.info("✅ Connected to database: %s (pool size %s)",
+                        ACTIVE_CONFIG['database'], pool.pool_size)
         except Error as e:
-            print(f"❌ Database connection error: {e}")
-            db = None
-        return db
+            logger.error("❌ Database connection error: %s", e)
+            pool = None
+        return pool
 
     def test_connection(self) -> bool:
-        """Test if database connection is active"""
-        if self.db and self.db.is_connected():
-            return True
+        """Test if the database is reachable"""
+        if self.pool:
+            return self.pool.test_connection()
         return False
 
     def close(self):
-        """Close database connection"""
-        if self.db and self.db.is_connected():
-            self.db.close()
-            print("✅ Database connection closed")
-
-    def initialize_tables(self):
-        """Initialize all database tables"""
-        if not self.db:
-            print("❌ No database connection")
+        """Close all pooled connections"""
+        if self.pool:
+            self.pool.close()
+            logger.info("✅ Database connections closed")
+
+    def migrate_schema(self) -> bool:
+        """Bring the schema up to date; a single version check once it is current"""
+        if not self.pool:
+            logger.error("❌ No database connection")
             return False
 
         try:
-            cursor = self.db.cursor()
-
-            # Users table
-            cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS users
-                           (
-                               id
-                               INT
-                               AUTO_INCREMENT
-                               PRIMARY
-                               KEY,
-                               username
-                               VARCHAR
-                           (
-                               50
-                           ) UNIQUE NOT NULL,
-                               password_hash VARCHAR
-                           (
-                               64
-                           ) NOT NULL,
-                               role ENUM
-                           (
-                               'staff',
-                               'admin'
-                           ) DEFAULT 'staff',
-                               created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                               )
-                           """)
-
-            # Teachers table
-            cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS teachers
-                           (
-                               id
-                               INT
-                               AUTO_INCREMENT
-                               PRIMARY
-                               KEY,
-                               full_name
-                               VARCHAR
-                           (
-                               100
-                           ) NOT NULL,
-                               email VARCHAR
-                           (
-                               100
-                           ) UNIQUE,
-                               contact_number VARCHAR
-                           (
-                               20
-                           ),
-                               department VARCHAR
-                           (
-                               100
-                           ),
-                               specialization VARCHAR
-                           (
-                               100
-                           ),
-                               status ENUM
-                           (
-                               'Active',
-                               'Inactive'
-                           ) DEFAULT 'Active',
-                               hire_date DATE,
-                               created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                               )
-                           """)
-
-            # Rooms table
-            cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS rooms
-                           (
-                               id
-                               INT
-                               AUTO_INCREMENT
-                               PRIMARY
-                               KEY,
-                               room_number
-                               VARCHAR
-                           (
-                               20
-                           ) NOT NULL,
-                               building VARCHAR
-                           (
-                               50
-                           ) NOT NULL,
-                               capacity INT DEFAULT 40,
-                               status ENUM
-                           (
-                               'Active',
-                               'Inactive'
-                           ) DEFAULT 'Active',
-                               created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                               UNIQUE KEY unique_room
-                           (
-                               room_number,
-                               building
-                           )
-                               )
-                           """)
-
-            # Sections table
-            cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS sections
-                           (
-                               id
-                               INT
-                               AUTO_INCREMENT
-                               PRIMARY
-                               KEY,
-                               section_name
-                               VARCHAR
-                           (
-                               50
-                           ) NOT NULL,
-                               grade_level ENUM
-                           (
-                               '11',
-                               '12'
-                           ) DEFAULT '11',
-                               track VARCHAR
-                           (
-                               50
-                           ) NOT NULL,
-                               strand VARCHAR
-                           (
-                               100
-                           ) NOT NULL,
-                               capacity INT DEFAULT 40,
-                               teacher_id INT,
-                               adviser_id INT,
-                               room_number VARCHAR
-                           (
-                               20
-                           ),
-                               status ENUM
-                           (
-                               'Active',
-                               'Inactive'
-                           ) DEFAULT 'Active',
-                               created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                               FOREIGN KEY
-                           (
-                               teacher_id
-                           ) REFERENCES teachers
-                           (
-                               id
-                           ) ON DELETE SET NULL,
-                               FOREIGN KEY
-                           (
-                               adviser_id
-                           ) REFERENCES teachers
-                           (
-                               id
-                           )
-                             ON DELETE SET NULL
-                               )
-                           """)
-
-            # Students table
-            cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS students
-                           (
-                               id
-                               INT
-                               AUTO_INCREMENT
-                               PRIMARY
-                               KEY,
-                               lrn
-                               VARCHAR
-                           (
-                               12
-                           ) UNIQUE NOT NULL,
-                               full_name VARCHAR
-                           (
-                               100
-                           ) NOT NULL,
-                               first_name VARCHAR
-                           (
-                               50
-                           ) NOT NULL,
-                               last_name VARCHAR
-                           (
-                               50
-                           ) NOT NULL,
-                               middle_name VARCHAR
-                           (
-                               50
-                           ),
-                               gender ENUM
-                           (
-                               'Male',
-                               'Female'
-                           ) NOT NULL,
-                               date_of_birth DATE,
-                               address TEXT,
-                               contact_number VARCHAR
-                           (
-                               20
-                           ),
-                               guardian_name VARCHAR
-                           (
-                               100
-                           ),
-                               guardian_contact VARCHAR
-                           (
-                               20
-                           ),
-                               last_school VARCHAR
-                           (
-                               100
-                           ),
-                               email VARCHAR
-                           (
-                               100
-                           ) UNIQUE NOT NULL,
-                               track VARCHAR
-                           (
-                               50
-                           ) NOT NULL,
-                               strand VARCHAR
-                           (
-                               100
-                           ) NOT NULL,
-                               grade_level ENUM
-                           (
-                               '11',
-                               '12'
-                           ) DEFAULT '11',
-                               section_id INT,
-                               payment_status ENUM
-                           (
-                               'Pending',
-                               'Paid',
-                               'Partial'
-                           ) DEFAULT 'Pending',
-                               status ENUM
-                           (
-                               'Pending',
-                               'Enrolled',
-                               'Dropped'
-                           ) DEFAULT 'Pending',
-                               enrollment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                               FOREIGN KEY
-                           (
-                               section_id
-                           ) REFERENCES sections
-                           (
-                               id
-                           ) ON DELETE SET NULL
-                               )
-                           """)
-
-            cursor.close()
-            print("✅ Database tables initialized")
+            applied = MigrationRunner(self).migrate()
+            if applied:
+                logger.info("✅ Applied %s schema migration(s)", applied)
+            else:
+                logger.info("✅ Database schema is up to date")
             return True
 
         except Error as e:
-            print(f"❌ Error initializing tables: {e}")
+            logger.error("❌ Error migrating database schema: %s", e)
             return False
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Model Events - Publish/subscribe notifications for model writes
+Models publish once a write has committed, so in-memory indexes and views
+can update themselves without re-querying the database. Each topic is
+published with the keyword payload listed beside it; "enrolled" values are
+(strand, section_id) pairs, or None when the student is not enrolled.
+"""
+import threading
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Topics
+STUDENT_ADDED = "student.added"  # student_id, full_name, strand, section_id
+STUDENT_UPDATED = "student.updated"  # student_id, full_name, strand, status, enrolled_before, enrolled_after
+STUDENT_DELETED = "student.deleted"  # student_id, enrolled_before
+STUDENTS_IMPORTED = "students.imported"  # count, by_strand {strand: count}
+PAYMENT_POSTED = "payment.posted"  # payment_id, student_id, amount, receipt_number, payment_status, balance
+PAYMENT_REVERSED = "payment.reversed"  # payment_id, student_id, amount, payment_status, balance
+PAYMENT_STATUS_CHANGED = "payment.status_changed"  # student_id, payment_status
+YEAR_ROLLED_OVER = "year.rolled_over"  # year_id, year_name, promoted, unassigned
+
+_subscribers = {}  # topic -> list of callbacks
+_lock = threading.Lock()
+
+
+def subscribe(topic: str, callback):
+    """Call callback(**payload) every time topic is published"""
+    with _lock:
+        _subscribers.setdefault(topic, []).append(callback)
+
+
+def unsubscribe(topic: str, callback):
+    """Stop delivering topic to callback"""
+    with _lock:
+        callbacks = _subscribers.get(topic, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+
+def publish(topic: str, **payload):
+    """Deliver payload to every subscriber of topic on the calling thread"""
+    with _lock:
+        callbacks = list(_subscribers.get(topic, ()))
+
+    for callback in callbacks:
+        try:
+            callback(**payload)
+        except Exception as e:
+            logger.exception("Error handling %s event: %s", topic, e)
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Pagination - Keyset (cursor) pagination shared by the listing models
+Pages are ordered newest first on a (timestamp, id) pair and continue from
+the last row of the previous page, so every page costs the same index
+range scan no matter how deep into the result set it is.
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from models.rows import fetch_rows
+
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass
+class Page:
+    """One page of rows and the token that continues after it"""
+    rows: List[Dict] = field(default_factory=list)
+    next_token: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_token is not None
+
+
+def encode_token(values) -> str:
+    """Opaque page token for the key values of the last row on a page"""
+    raw = json.dumps([str(value) for value in values]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_token(token: str) -> list:
+    """Key values stored in a page token"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page token: {token!r}") from e
+
+
+def fetch_page(cursor, query: str, params: list, keys: Tuple[Tuple[str, str], Tuple[str, str]],
+               page_size: int = DEFAULT_PAGE_SIZE, token: str = None, row_type=None) -> Page:
+    """
+    Run one page of query.
+    query is a SELECT without ORDER BY whose WHERE clause ends with a
+    {keyset} placeholder, after every other %s; keys is
+    ((column, row_field), (column, row_field)) for the timestamp and id
+    the pages are ordered by. With row_type, cursor is a tuple cursor whose
+    columns are row_type's fields in order.
+    """
+    (date_column, date_field), (id_column, id_field) = keys
+
+    keyset, keyset_params = "TRUE", []
+    if token:
+        last_date, last_id = decode_token(token)
+        keyset = f"({date_column} < %s OR ({date_column} = %s AND {id_column} < %s))"
+        keyset_params = [last_date, last_date, int(last_id)]
+
+    sql = (query.format(keyset=keyset) +
+           f" ORDER BY {date_column} DESC, {id_column} DESC LIMIT %s")
+    # One extra row tells us whether another page exists
+    cursor.execute(sql, list(params) + keyset_params + [page_size + 1])
+    rows = fetch_rows(cursor, row_type) if row_type else cursor.fetchall()
+
+    next_token = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_token = encode_token((last[date_field], last[id_field]))
+
+    return Page(rows, next_token)
+
+
+def iter_pages(fetch: Callable[..., Page], *args, **kwargs) -> Iterator[Dict]:
+    """Yield every row of a paginated listing, one page at a time"""
+    token = None
+    while True:
+        page = fetch(*args, token=token, **kwargs)
+        yield from page.rows
+        if not page.has_more:
+            return
+        token = page.next_token
\ No newline at end of file
@@ -5,10 +5,17 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime, date
 from decimal import Decimal
+from database.cache import cached, invalidates, invalidate_row, skip_cache
+from models.rows import Row
+from models import events
+from models.pagination import Page, DEFAULT_PAGE_SIZE, fetch_page, iter_pages
+from utils.log import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
-class PaymentData:
+
+@dataclass(slots=True)
+class PaymentData(Row):
     """Payment transaction data blueprint"""
     id: Optional[int] = None
     student_id: int = 0
@@ -38,261 +45,347 @@ class Payment:
     def __init__(self, db):
         self.db = db
 
+    @invalidates("payment_transactions", "students")
     def add_payment(self, payment_data: PaymentData, user_id: int) -> Tuple[bool, str, Optional[int]]:
         """Add a new payment transaction"""
         try:
             if not payment_data.is_valid():
                 return False, "Invalid payment data", None
 
-            cursor = self.db.cursor()
-
-            # Generate receipt number
-            cursor.execute("SELECT COUNT(*) FROM payment_transactions")
-            count = cursor.fetchone()[0]
-            receipt_number = payment_data.receipt_number or f"REC-{datetime.now().strftime('%Y%m%d')}-{count + 1:04d}"
-
-            # Insert payment
-            query = """
-                    INSERT INTO payment_transactions
-                    (student_id, amount, payment_date, payment_method, reference_number,
-                     receipt_number, academic_year_id, payment_type, notes, recorded_by)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) \
-                    """
-            values = (
-                payment_data.student_id,
-                float(payment_data.amount),
-                payment_data.payment_date,
-                payment_data.payment_method,
-                payment_data.reference_number,
-                receipt_number,
-                payment_data.academic_year_id,
-                payment_data.payment_type,
-                payment_data.notes,
-                user_id
-            )
-            cursor.execute(query, values)
-            payment_id = cursor.lastrowid
-
-            # Update student's payment totals
-            cursor.execute("""
-                           UPDATE students
-                           SET amount_paid = amount_paid + %s,
-                               balance     = total_fees - (amount_paid + %s)
-                           WHERE id = %s
-                           """, (float(payment_data.amount), float(payment_data.amount), payment_data.student_id))
-
-            # Update payment status
-            cursor.execute("""
-                           SELECT total_fees, amount_paid + %s as new_paid
-                           FROM students
-                           WHERE id = %s
-                           """, (float(payment_data.amount), payment_data.student_id))
-            result = cursor.fetchone()
-
-            if result:
-                total_fees = result[0]
-                new_paid = result[1]
-
-                if new_paid >= total_fees:
-                    new_status = 'Paid'
-                elif new_paid > 0:
-                    new_status = 'Partial'
-                else:
-                    new_status = 'Pending'
-
-                cursor.execute("UPDATE students SET payment_status = %s WHERE id = %s",
-                               (new_status, payment_data.student_id))
-
-            self.db.commit()
-            cursor.close()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Lock the student's totals first, so concurrent postings apply one after another
+                cursor.execute("""
+                               SELECT total_fees, amount_paid
+                               FROM students
+                               WHERE id = %s
+                               FOR UPDATE
+                               """, (payment_data.student_id,))
+                totals = cursor.fetchone()
+                if not totals:
+                    cursor.close()
+                    return False, "Student not found", None
+
+                # Generate receipt number from today's sequence
+                receipt_number = payment_data.receipt_number
+                if not receipt_number:
+                    today = datetime.now().date()
+                    receipt_number = self.format_receipt_number(today, self._allocate_receipts(cursor, today))
+
+                # Insert payment
+                query = """
+                        INSERT INTO payment_transactions
+                        (student_id, amount, payment_date, payment_method, reference_number,
+                         receipt_number, academic_year_id, payment_type, notes, recorded_by)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) \
+                        """
+                values = (
+                    payment_data.student_id,
+                    float(payment_data.amount),
+                    payment_data.payment_date,
+                    payment_data.payment_method,
+                    payment_data.reference_number,
+                    receipt_number,
+                    payment_data.academic_year_id,
+                    payment_data.payment_type,
+                    payment_data.notes,
+                    user_id
+                )
+                cursor.execute(query, values)
+                payment_id = cursor.lastrowid
+
+                # Update the student's totals and payment status in one statement
+                payment_status, balance = self._apply_to_student(cursor, payment_data.student_id,
+                                                                 totals, payment_data.amount)
+                cursor.close()
+            invalidate_row("students", payment_data.student_id)
 
+            events.publish(events.PAYMENT_POSTED, payment_id=payment_id, student_id=payment_data.student_id,
+                           amount=float(payment_data.amount), receipt_number=receipt_number,
+                           payment_status=payment_status, balance=balance)
             return True, f"Payment recorded successfully. Receipt: {receipt_number}", payment_id
 
         except Exception as e:
-            print(f"Error adding payment: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding payment: %s", e)
             return False, f"Failed to record payment: {str(e)}", None
 
+    def _apply_to_student(self, cursor, student_id: int, totals: tuple, amount) -> Tuple[str, float]:
+        """
+        Add amount (negative to reverse) to the student's amount_paid.
+        totals is the (total_fees, amount_paid) row locked FOR UPDATE in
+        this transaction; the new balance and payment_status are derived
+        from it here and written in one UPDATE.
+        Returns the student's new (payment_status, balance).
+        """
+        total_fees = totals[0] or Decimal('0.00')
+        amount_paid = (totals[1] or Decimal('0.00')) + Decimal(str(amount))
+        balance = total_fees - amount_paid
+        if amount_paid >= total_fees:
+            payment_status = 'Paid'
+        elif amount_paid > 0:
+            payment_status = 'Partial'
+        else:
+            payment_status = 'Pending'
+
+        cursor.execute("""
+                       UPDATE students
+                       SET amount_paid    = %s,
+                           balance        = %s,
+                           payment_status = %s
+                       WHERE id = %s
+                       """, (amount_paid, balance, payment_status, student_id))
+        return payment_status, float(balance)
+
+    def _allocate_receipts(self, cursor, day: date, count: int = 1) -> int:
+        """
+        Advance the day's receipt sequence by count and return the last
+        number taken. One statement on one row: concurrent cashiers queue
+        on the row lock instead of colliding on receipt_number.
+        """
+        cursor.execute("""
+                       INSERT INTO receipt_sequences (seq_date, last_number)
+                       VALUES (%s, LAST_INSERT_ID(%s))
+                       ON DUPLICATE KEY UPDATE last_number = LAST_INSERT_ID(last_number + %s)
+                       """, (day, count, count))
+        return cursor.lastrowid
+
+    @staticmethod
+    def format_receipt_number(day: date, number: int) -> str:
+        """REC-YYYYMMDD-NNNN"""
+        return f"REC-{day.strftime('%Y%m%d')}-{number:04d}"
+
+    def reserve_receipt_numbers(self, count: int, day: date = None) -> Tuple[bool, str, List[str]]:
+        """
+        Reserve a block of receipt numbers for a station that posts payments
+        offline; pass them back as PaymentData.receipt_number when syncing.
+        """
+        if count < 1:
+            return False, "Count must be at least 1", []
+
+        day = day or datetime.now().date()
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                last = self._allocate_receipts(cursor, day, count)
+                cursor.close()
+
+            numbers = [self.format_receipt_number(day, number)
+                       for number in range(last - count + 1, last + 1)]
+            return True, f"Reserved {count} receipt number(s): {numbers[0]} to {numbers[-1]}", numbers
+
+        except Exception as e:
+            logger.exception("Error reserving receipt numbers: %s", e)
+            return False, f"Failed to reserve receipt numbers: {str(e)}", []
+
+    @cached("payment_transactions", "users", "academic_years")
     def get_student_payments(self, student_id: int) -> List[dict]:
         """Get all payments for a student"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT p.*, u.username as recorded_by_name, ay.year_name
-                    FROM payment_transactions p
-                             LEFT JOIN users u ON p.recorded_by = u.id
-                             LEFT JOIN academic_years ay ON p.academic_year_id = ay.id
-                    WHERE p.student_id = %s
-                    ORDER BY p.payment_date DESC, p.created_at DESC \
-                    """
-            cursor.execute(query, (student_id,))
-            payments = cursor.fetchall()
-            cursor.close()
-            return payments
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                        SELECT p.*, u.username as recorded_by_name, ay.year_name
+                        FROM payment_transactions p
+                                 LEFT JOIN users u ON p.recorded_by = u.id
+                                 LEFT JOIN academic_years ay ON p.academic_year_id = ay.id
+                        WHERE p.student_id = %s
+                        ORDER BY p.payment_date DESC, p.created_at DESC \
+                        """
+                cursor.execute(query, (student_id,))
+                payments = cursor.fetchall()
+                cursor.close()
+                return payments
         except Exception as e:
-            print(f"Error getting student payments: {e}")
+            logger.error("Error getting student payments: %s", e)
+            skip_cache()
             return []
 
+    @cached("students")
     def get_payment_summary(self, student_id: int) -> dict:
         """Get payment summary for a student"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            cursor.execute("""
-                           SELECT total_fees,
-                                  amount_paid,
-                                  balance,
-                                  payment_status
-                           FROM students
-                           WHERE id = %s
-                           """, (student_id,))
-            summary = cursor.fetchone()
-            cursor.close()
-            return summary or {
-                'total_fees': 0,
-                'amount_paid': 0,
-                'balance': 0,
-                'payment_status': 'Pending'
-            }
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("""
+                               SELECT total_fees,
+                                      amount_paid,
+                                      balance,
+                                      payment_status
+                               FROM students
+                               WHERE id = %s
+                               """, (student_id,))
+                summary = cursor.fetchone()
+                cursor.close()
+                return summary or {
+                    'total_fees': 0,
+                    'amount_paid': 0,
+                    'balance': 0,
+                    'payment_status': 'Pending'
+                }
         except Exception as e:
-            print(f"Error getting payment summary: {e}")
+            logger.error("Error getting payment summary: %s", e)
+            skip_cache()
             return {}
 
-    def get_all_payments(self, date_from: date = None, date_to: date = None,
-                         payment_status: str = None) -> List[dict]:
-        """Get all payments with optional filters"""
+    def get_payments_page(self, date_from: date = None, date_to: date = None,
+                          payment_status: str = None, page_size: int = DEFAULT_PAGE_SIZE,
+                          token: str = None) -> Page:
+        """
+        One page of payments with optional filters, newest first.
+        Pass the returned page's next_token to get the following page.
+        """
         try:
-            cursor = self.db.cursor(dictionary=True)
-
-            query = """
-                    SELECT p.*, s.full_name as student_name, s.strand, u.username as recorded_by_name
-                    FROM payment_transactions p
-                             INNER JOIN students s ON p.student_id = s.id
-                             LEFT JOIN users u ON p.recorded_by = u.id
-                    WHERE 1 = 1 \
-                    """
-            params = []
-
-            if date_from:
-                query += " AND p.payment_date >= %s"
-                params.append(date_from)
-
-            if date_to:
-                query += " AND p.payment_date <= %s"
-                params.append(date_to)
-
-            if payment_status:
-                query += " AND s.payment_status = %s"
-                params.append(payment_status)
-
-            query += " ORDER BY p.payment_date DESC, p.created_at DESC LIMIT 100"
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+
+                query = """
+                        SELECT p.*, s.full_name as student_name, s.strand, u.username as recorded_by_name
+                        FROM payment_transactions p
+                                 INNER JOIN students s ON p.student_id = s.id
+                                 LEFT JOIN users u ON p.recorded_by = u.id
+                        WHERE 1 = 1 \
+                        """
+                params = []
+
+                if date_from:
+                    query += " AND p.payment_date >= %s"
+                    params.append(date_from)
+
+                if date_to:
+                    query += " AND p.payment_date <= %s"
+                    params.append(date_to)
+
+                if payment_status:
+                    query += " AND s.payment_status = %s"
+                    params.append(payment_status)
+
+                query += " AND {keyset}"
+
+                page = fetch_page(cursor, query, params,
+                                  (("p.payment_date", "payment_date"), ("p.id", "id")),
+                                  page_size, token)
+                cursor.close()
+                return page
 
-            cursor.execute(query, params)
-            payments = cursor.fetchall()
+        except Exception as e:
+            logger.error("Error getting payments page: %s", e)
+            return Page()
+
+    def get_receipt_rows(self, date_from: date = None, date_to: date = None) -> List[Dict]:
+        """
+        Receipt fields of every payment in a payment date range (both ends
+        inclusive), oldest first, in one query. Each row holds the payment
+        and its student's name, LRN, strand and section.
+        """
+        conditions = ["1 = 1"]
+        params = []
+        if date_from:
+            conditions.append("p.payment_date >= %s")
+            params.append(date_from)
+        if date_to:
+            conditions.append("p.payment_date <= %s")
+            params.append(date_to)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"""
+                SELECT p.*, u.username AS recorded_by_name,
+                       s.full_name, s.lrn, s.strand, sec.section_name
+                FROM payment_transactions p
+                INNER JOIN students s ON p.student_id = s.id
+                LEFT JOIN sections sec ON s.section_id = sec.id
+                LEFT JOIN users u ON p.recorded_by = u.id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY p.payment_date, p.id
+            """, params)
+            rows = cursor.fetchall()
             cursor.close()
-            return payments
+            return rows
 
-        except Exception as e:
-            print(f"Error getting all payments: {e}")
-            return []
+    def get_all_payments(self, date_from: date = None, date_to: date = None,
+                         payment_status: str = None) -> List[dict]:
+        """Get all payments with optional filters"""
+        return list(iter_pages(self.get_payments_page, date_from, date_to, payment_status))
 
+    @invalidates("payment_transactions", "students")
     def delete_payment(self, payment_id: int) -> Tuple[bool, str]:
         """Delete a payment transaction"""
         try:
-            cursor = self.db.cursor()
-
-            # Get payment details first
-            cursor.execute("""
-                           SELECT student_id, amount
-                           FROM payment_transactions
-                           WHERE id = %s
-                           """, (payment_id,))
-            payment = cursor.fetchone()
-
-            if not payment:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Get payment details and the student's totals first, locking both rows until the delete commits
+                cursor.execute("""
+                               SELECT p.student_id, p.amount, s.total_fees, s.amount_paid
+                               FROM payment_transactions p
+                               JOIN students s ON s.id = p.student_id
+                               WHERE p.id = %s
+                               FOR UPDATE
+                               """, (payment_id,))
+                payment = cursor.fetchone()
+
+                if not payment:
+                    cursor.close()
+                    return False, "Payment not found"
+
+                student_id, amount = payment[:2]
+
+                # Delete payment
+                cursor.execute("DELETE FROM payment_transactions WHERE id = %s", (payment_id,))
+
+                # Take the amount back off the student's totals
+                payment_status, balance = self._apply_to_student(cursor, student_id, payment[2:], -amount)
                 cursor.close()
-                return False, "Payment not found"
-
-            student_id, amount = payment
-
-            # Delete payment
-            cursor.execute("DELETE FROM payment_transactions WHERE id = %s", (payment_id,))
-
-            # Update student totals
-            cursor.execute("""
-                           UPDATE students
-                           SET amount_paid = amount_paid - %s,
-                               balance     = total_fees - (amount_paid - %s)
-                           WHERE id = %s
-                           """, (float(amount), float(amount), student_id))
-
-            # Update payment status
-            cursor.execute("""
-                           SELECT total_fees, amount_paid - %s as new_paid
-                           FROM students
-                           WHERE id = %s
-                           """, (float(amount), student_id))
-            result = cursor.fetchone()
-
-            if result:
-                total_fees = result[0]
-                new_paid = result[1]
-
-                if new_paid >= total_fees:
-                    new_status = 'Paid'
-                elif new_paid > 0:
-                    new_status = 'Partial'
-                else:
-                    new_status = 'Pending'
-
-                cursor.execute("UPDATE students SET payment_status = %s WHERE id = %s",
-                               (new_status, student_id))
-
-            self.db.commit()
-            cursor.close()
+            invalidate_row("students", student_id)
 
+            events.publish(events.PAYMENT_REVERSED, payment_id=payment_id, student_id=student_id,
+                           amount=float(amount), payment_status=payment_status, balance=balance)
             return True, "Payment deleted successfully"
 
         except Exception as e:
-            print(f"Error deleting payment: {e}")
+            logger.error("Error deleting payment: %s", e)
             return False, f"Failed to delete payment: {str(e)}"
 
+    @cached("payment_transactions")
     def get_payment_stats(self, academic_year_id: int = None) -> dict:
         """Get payment statistics"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-
-            where_clause = ""
-            params = []
-            if academic_year_id:
-                where_clause = "WHERE academic_year_id = %s"
-                params = [academic_year_id]
-
-            # Total collected
-            cursor.execute(f"""
-                SELECT SUM(amount) as total_collected, COUNT(*) as transaction_count
-                FROM payment_transactions
-                {where_clause}
-            """, params)
-            totals = cursor.fetchone()
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+
+                where_clause = ""
+                params = []
+                if academic_year_id:
+                    where_clause = "WHERE academic_year_id = %s"
+                    params = [academic_year_id]
+
+                # Total collected
+                cursor.execute(f"""
+                    SELECT SUM(amount) as total_collected, COUNT(*) as transaction_count
+                    FROM payment_transactions
+                    {where_clause}
+                """, params)
+                totals = cursor.fetchone()
+
+                # By payment method
+                cursor.execute(f"""
+                    SELECT payment_method, SUM(amount) as amount, COUNT(*) as count
+                    FROM payment_transactions
+                    {where_clause}
+                    GROUP BY payment_method
+                """, params)
+                by_method = cursor.fetchall()
 
-            # By payment method
-            cursor.execute(f"""
-                SELECT payment_method, SUM(amount) as amount, COUNT(*) as count
-                FROM payment_transactions
-                {where_clause}
-                GROUP BY payment_method
-            """, params)
-            by_method = cursor.fetchall()
-
-            cursor.close()
+                cursor.close()
 
-            return {
-                'total_collected': float(totals['total_collected'] or 0),
-                'transaction_count': totals['transaction_count'],
-                'by_method': by_method
-            }
+                return {
+                    'total_collected': float(totals['total_collected'] or 0),
+                    'transaction_count': totals['transaction_count'],
+                    'by_method': by_method
+                }
 
         except Exception as e:
-            print(f"Error getting payment stats: {e}")
+            logger.error("Error getting payment stats: %s", e)
+            skip_cache()
             return {}
\ No newline at end of file
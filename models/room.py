@@ -3,10 +3,15 @@ Room Model - Handles all room-related database operations
 """
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
+from database.cache import cached, invalidates, skip_cache
+from models.rows import Row, select_list, fetch_row
+from utils.log import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
-class RoomData:
+
+@dataclass(slots=True)
+class RoomData(Row):
     """Room data blueprint"""
     id: Optional[int] = None
     room_number: str = ""
@@ -39,114 +44,123 @@ class Room:
     def __init__(self, db):
         self.db = db
 
+    @cached("rooms")
     def get_all_rooms(self) -> List[dict]:
         """Get all rooms"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                SELECT id, room_number, building, capacity, status, created_at
-                FROM rooms
-                WHERE status = 'Active'
-                ORDER BY building, room_number
-            """
-            cursor.execute(query)
-            rooms = cursor.fetchall()
-            cursor.close()
-            return rooms
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                    SELECT id, room_number, building, capacity, status, created_at
+                    FROM rooms
+                    WHERE status = 'Active'
+                    ORDER BY building, room_number
+                """
+                cursor.execute(query)
+                rooms = cursor.fetchall()
+                cursor.close()
+                return rooms
 
         except Exception as e:
-            print(f"Error getting rooms: {e}")
+            logger.error("Error getting rooms: %s", e)
+            skip_cache()
             return []
 
+    @cached("rooms")
     def get_room_by_id(self, room_id: int) -> Optional[RoomData]:
         """Get room by ID"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = "SELECT * FROM rooms WHERE id = %s"
-            cursor.execute(query, (room_id,))
-            row = cursor.fetchone()
-            cursor.close()
-
-            if row:
-                return RoomData(**row)
-            return None
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"SELECT {select_list(RoomData)} FROM rooms WHERE id = %s"
+                cursor.execute(query, (room_id,))
+                row = fetch_row(cursor, RoomData)
+                cursor.close()
+                return row
 
         except Exception as e:
-            print(f"Error getting room: {e}")
+            logger.error("Error getting room: %s", e)
+            skip_cache()
             return None
 
+    @invalidates("rooms")
     def add_room(self, room_number: str, building: str, capacity: int) -> Tuple[bool, str]:
         """Add a new room"""
         try:
-            cursor = self.db.cursor()
-
-            # Check if room already exists
-            cursor.execute(
-                "SELECT id FROM rooms WHERE room_number = %s AND building = %s",
-                (room_number, building)
-            )
-            if cursor.fetchone():
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                # Check if room already exists
+                cursor.execute(
+                    "SELECT id FROM rooms WHERE room_number = %s AND building = %s",
+                    (room_number, building)
+                )
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, f"Room {room_number} in {building} already exists"
+
+                # Insert new room
+                query = """
+                    INSERT INTO rooms (room_number, building, capacity, status, created_at)
+                    VALUES (%s, %s, %s, 'Active', NOW())
+                """
+                cursor.execute(query, (room_number, building, capacity))
+                conn.commit()
                 cursor.close()
-                return False, f"Room {room_number} in {building} already exists"
-
-            # Insert new room
-            query = """
-                INSERT INTO rooms (room_number, building, capacity, status, created_at)
-                VALUES (%s, %s, %s, 'Active', NOW())
-            """
-            cursor.execute(query, (room_number, building, capacity))
-            self.db.commit()
-            cursor.close()
 
-            return True, "Room added successfully"
+                return True, "Room added successfully"
 
         except Exception as e:
-            print(f"Error adding room: {e}")
+            logger.error("Error adding room: %s", e)
             return False, f"Failed to add room: {str(e)}"
 
+    @invalidates("rooms")
     def delete_room(self, room_id: int) -> Tuple[bool, str]:
         """Delete a room"""
         try:
-            cursor = self.db.cursor()
-
-            # Check if room is assigned to any section
-            cursor.execute(
-                "SELECT COUNT(*) FROM sections WHERE room_number IN (SELECT room_number FROM rooms WHERE id = %s)",
-                (room_id,)
-            )
-            count = cursor.fetchone()[0]
-
-            if count > 0:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                # Check if room is assigned to any section
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sections WHERE room_number IN (SELECT room_number FROM rooms WHERE id = %s)",
+                    (room_id,)
+                )
+                count = cursor.fetchone()[0]
+
+                if count > 0:
+                    cursor.close()
+                    return False, f"Cannot delete: Room is assigned to {count} section(s)"
+
+                # Delete room
+                cursor.execute("DELETE FROM rooms WHERE id = %s", (room_id,))
+                conn.commit()
                 cursor.close()
-                return False, f"Cannot delete: Room is assigned to {count} section(s)"
-
-            # Delete room
-            cursor.execute("DELETE FROM rooms WHERE id = %s", (room_id,))
-            self.db.commit()
-            cursor.close()
 
-            return True, "Room deleted successfully"
+                return True, "Room deleted successfully"
 
         except Exception as e:
-            print(f"Error deleting room: {e}")
+            logger.error("Error deleting room: %s", e)
             return False, f"Failed to delete room: {str(e)}"
 
+    @invalidates("rooms")
     def update_room(self, room_id: int, room_number: str, building: str, capacity: int) -> Tuple[bool, str]:
         """Update room details"""
         try:
-            cursor = self.db.cursor()
-
-            query = """
-                UPDATE rooms 
-                SET room_number = %s, building = %s, capacity = %s
-                WHERE id = %s
-            """
-            cursor.execute(query, (room_number, building, capacity, room_id))
-            self.db.commit()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                query = """
+                    UPDATE rooms 
+                    SET room_number = %s, building = %s, capacity = %s
+                    WHERE id = %s
+                """
+                cursor.execute(query, (room_number, building, capacity, room_id))
+                conn.commit()
+                cursor.close()
 
-            return True, "Room updated successfully"
+                return True, "Room updated successfully"
 
         except Exception as e:
-            print(f"Error updating room: {e}")
+            logger.error("Error updating room: %s", e)
             return False, f"Failed to update room: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Rows - Compact row objects built straight from tuple cursors
+Row types are slotted dataclasses. Queries select their columns in field
+order (see select_list), so each fetched tuple becomes an object without
+an intermediate dictionary. Rows also answer row['field'] and
+row.get('field'), so views written against dicts can take them as is.
+"""
+import dataclasses
+from typing import Dict, List, Optional, Type, TypeVar
+
+R = TypeVar('R', bound='Row')
+
+
+class Row:
+    """Read-only mapping access for slotted dataclass rows"""
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def keys(self) -> List[str]:
+        return [field.name for field in dataclasses.fields(self)]
+
+    def replace(self: R, **changes) -> R:
+        """Copy with changes; rows may be shared with the query cache, so never mutate them"""
+        return dataclasses.replace(self, **changes)
+
+
+def select_list(row_type: Type[Row], alias: str = None, expressions: Dict[str, str] = None,
+                last: str = None) -> str:
+    """
+    SELECT expressions for row_type's fields in declaration order.
+    Each field is read from "alias.field" unless expressions gives another
+    expression for it. With last, fields after it are not selected and
+    keep their defaults.
+    """
+    expressions = expressions or {}
+    columns = []
+    for field in dataclasses.fields(row_type):
+        column = f"{alias}.{field.name}" if alias else field.name
+        columns.append(expressions.get(field.name, column))
+        if field.name == last:
+            break
+    return ", ".join(columns)
+
+
+def fetch_rows(cursor, row_type: Type[R]) -> List[R]:
+    """All remaining rows of a tuple cursor as row_type objects"""
+    return [row_type(*row) for row in cursor.fetchall()]
+
+
+def fetch_row(cursor, row_type: Type[R]) -> Optional[R]:
+    """The next row of a tuple cursor as a row_type object, or None"""
+    row = cursor.fetchone()
+    return row_type(*row) if row is not None else None
\ No newline at end of file
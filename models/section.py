@@ -3,10 +3,15 @@ Section Model - Handles all section-related database operations
 """
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
+from database.cache import cached, invalidates, skip_cache
+from models.rows import Row, select_list, fetch_rows, fetch_row
+from utils.log import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
-class SectionData:
+
+@dataclass(slots=True)
+class SectionData(Row):
     """Section data blueprint"""
     id: Optional[int] = None
     section_name: str = ""
@@ -21,6 +26,8 @@ class SectionData:
     adviser_name: Optional[str] = None
     adviser_email: Optional[str] = None
     status: str = "Active"
+    grade_level: str = "11"
+    academic_year_id: Optional[int] = None  # None: open in every year
 
     @property
     def available_slots(self) -> int:
@@ -56,118 +63,98 @@ class SectionData:
             'adviser_name': self.adviser_name,
             'adviser_email': self.adviser_email,
             'status': self.status,
+            'grade_level': self.grade_level,
+            'academic_year_id': self.academic_year_id,
             'is_full': self.is_full,
             'fill_percentage': self.fill_percentage
         }
 
 
+SECTION_COLUMNS = select_list(SectionData, 's', {
+    'student_count': 's.enrolled_count',
+    'teacher_name': 't.full_name',
+    'adviser_name': 'adv.full_name',
+    'adviser_email': 'adv.email',
+})
+STRAND_SECTION_COLUMNS = select_list(SectionData, 's', {'student_count': 's.enrolled_count'},
+                                     last='room_number')
+
+
 class Section:
     """Section model - Database operations for sections/classrooms"""
 
     def __init__(self, db):
         self.db = db
 
+    @cached("sections", "teachers", "students")
     def get_all_sections(self) -> List[SectionData]:
         """Get all active sections with details"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT s.id,
-                           s.section_name,
-                           s.strand,
-                           s.track,
-                           s.capacity,
-                           s.room_number,
-                           s.status,
-                           s.teacher_id,
-                           s.adviser_id,
-                           t.full_name   AS teacher_name,
-                           adv.full_name AS adviser_name,
-                           adv.email     AS adviser_email,
-                           COUNT(st.id)  AS student_count
-                    FROM sections s
-                             LEFT JOIN teachers t ON s.teacher_id = t.id
-                             LEFT JOIN teachers adv ON s.adviser_id = adv.id
-                             LEFT JOIN students st ON st.section_id = s.id AND st.status = 'Enrolled'
-                    WHERE s.status = 'Active'
-                    GROUP BY s.id, s.section_name, s.strand, s.track, s.capacity,
-                             s.room_number, s.status, s.teacher_id, s.adviser_id,
-                             t.full_name, adv.full_name, adv.email
-                    ORDER BY s.strand, s.section_name \
-                    """
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"""
+                        SELECT {SECTION_COLUMNS}
+                        FROM sections s
+                                 LEFT JOIN teachers t ON s.teacher_id = t.id
+                                 LEFT JOIN teachers adv ON s.adviser_id = adv.id
+                        WHERE s.status = 'Active'
+                        ORDER BY s.strand, s.section_name \
+                        """
+                cursor.execute(query)
+                sections = fetch_rows(cursor, SectionData)
+                cursor.close()
 
-            return [SectionData(**row) for row in rows]
+                return sections
 
         except Exception as e:
-            print(f"Error getting sections: {e}")
+            logger.error("Error getting sections: %s", e)
+            skip_cache()
             return []
 
+    @cached("sections", "teachers", "students")
     def get_section_by_id(self, section_id: int) -> Optional[SectionData]:
         """Get section by ID"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT s.id,
-                           s.section_name,
-                           s.strand,
-                           s.track,
-                           s.capacity,
-                           s.room_number,
-                           s.status,
-                           s.teacher_id,
-                           s.adviser_id,
-                           t.full_name   AS teacher_name,
-                           adv.full_name AS adviser_name,
-                           adv.email     AS adviser_email,
-                           COUNT(st.id)  AS student_count
-                    FROM sections s
-                             LEFT JOIN teachers t ON s.teacher_id = t.id
-                             LEFT JOIN teachers adv ON s.adviser_id = adv.id
-                             LEFT JOIN students st ON st.section_id = s.id AND st.status = 'Enrolled'
-                    WHERE s.id = %s
-                    GROUP BY s.id \
-                    """
-            cursor.execute(query, (section_id,))
-            row = cursor.fetchone()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"""
+                        SELECT {SECTION_COLUMNS}
+                        FROM sections s
+                                 LEFT JOIN teachers t ON s.teacher_id = t.id
+                                 LEFT JOIN teachers adv ON s.adviser_id = adv.id
+                        WHERE s.id = %s \
+                        """
+                cursor.execute(query, (section_id,))
+                section = fetch_row(cursor, SectionData)
+                cursor.close()
 
-            if row:
-                return SectionData(**row)
-            return None
+                return section
 
         except Exception as e:
-            print(f"Error getting section: {e}")
+            logger.error("Error getting section: %s", e)
+            skip_cache()
             return None
 
     def get_sections_by_strand(self, strand: str, status: str = 'Active') -> List[SectionData]:
         """Get sections filtered by strand"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT s.id,
-                           s.section_name,
-                           s.strand,
-                           s.capacity,
-                           s.room_number,
-                           COUNT(st.id) AS student_count
-                    FROM sections s
-                             LEFT JOIN students st ON st.section_id = s.id AND st.status = 'Enrolled'
-                    WHERE s.strand = %s \
-                      AND s.status = %s
-                    GROUP BY s.id, s.section_name, s.strand, s.capacity, s.room_number
-                    ORDER BY s.section_name \
-                    """
-            cursor.execute(query, (strand, status))
-            rows = cursor.fetchall()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"""
+                        SELECT {STRAND_SECTION_COLUMNS}
+                        FROM sections s
+                        WHERE s.strand = %s \
+                          AND s.status = %s
+                        ORDER BY s.section_name \
+                        """
+                cursor.execute(query, (strand, status))
+                sections = fetch_rows(cursor, SectionData)
+                cursor.close()
 
-            return [SectionData(**row) for row in rows]
+                return sections
 
         except Exception as e:
-            print(f"Error getting sections by strand: {e}")
+            logger.error("Error getting sections by strand: %s", e)
             return []
 
     def find_available_section(self, strand: str) -> Optional[SectionData]:
@@ -185,68 +172,159 @@ class Section:
             return max(available, key=lambda s: s.available_slots)
 
         except Exception as e:
-            print(f"Error finding available section: {e}")
+            logger.error("Error finding available section: %s", e)
             return None
 
+    def reserve_seat(self, strand: str, section_id: int = None, grade_level: str = '11',
+                     year_id: int = None) -> Optional[int]:
+        """
+        Take one seat in section_id, or in the emptiest active section of the
+        strand and grade level for year_id (sections with no year count for
+        any year). Call inside the enrolling transaction: the conditional
+        increment locks the section row until commit, so concurrent
+        enrollments can never push a section past its capacity.
+        Returns the section id, or None when no seat is free or section_id
+        belongs to another strand, grade level or year.
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+
+            if section_id:
+                candidates = [section_id]
+            else:
+                cursor.execute("""
+                               SELECT id
+                               FROM sections
+                               WHERE strand = %s
+                                 AND grade_level = %s
+                                 AND (academic_year_id = %s OR academic_year_id IS NULL)
+                                 AND status = 'Active'
+                                 AND enrolled_count < capacity
+                               ORDER BY capacity - enrolled_count DESC, section_name
+                               LIMIT 10
+                               """, (strand, grade_level, year_id))
+                candidates = [row[0] for row in cursor.fetchall()]
+
+            # A candidate filled by another station since the SELECT matches no row
+            for candidate in candidates:
+                cursor.execute("""
+                               UPDATE sections
+                               SET enrolled_count = enrolled_count + 1
+                               WHERE id = %s
+                                 AND strand = %s
+                                 AND grade_level = %s
+                                 AND (academic_year_id = %s OR academic_year_id IS NULL)
+                                 AND status = 'Active'
+                                 AND enrolled_count < capacity
+                               """, (candidate, strand, grade_level, year_id))
+                if cursor.rowcount == 1:
+                    cursor.close()
+                    return candidate
+
+            cursor.close()
+            return None
+
+    def release_seat(self, section_id: int):
+        """Give back a seat taken by reserve_seat; call inside the same kind of transaction"""
+        if not section_id:
+            return
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                           UPDATE sections
+                           SET enrolled_count = enrolled_count - 1
+                           WHERE id = %s
+                             AND enrolled_count > 0
+                           """, (section_id,))
+            cursor.close()
+
+    @invalidates("sections")
+    def rebuild_enrolled_counts(self) -> bool:
+        """Recount sections.enrolled_count from the students table"""
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                               UPDATE sections s
+                               SET s.enrolled_count = (SELECT COUNT(*)
+                                                       FROM students st
+                                                       WHERE st.section_id = s.id
+                                                         AND st.status = 'Enrolled')
+                               """)
+                cursor.close()
+                return True
+
+        except Exception as e:
+            logger.error("Error rebuilding section counts: %s", e)
+            return False
+
+    @invalidates("sections")
     def add_section(self, data: SectionData) -> Tuple[bool, str]:
         """Add a new section"""
         try:
-            cursor = self.db.cursor()
-
-            # Check if section exists
-            cursor.execute(
-                "SELECT id FROM sections WHERE section_name = %s AND strand = %s",
-                (data.section_name, data.strand)
-            )
-            if cursor.fetchone():
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                # Check if section exists
+                cursor.execute(
+                    "SELECT id FROM sections WHERE section_name = %s AND strand = %s AND grade_level = %s",
+                    (data.section_name, data.strand, data.grade_level)
+                )
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, (f"Section '{data.section_name}' for Grade {data.grade_level} "
+                                   f"{data.strand} already exists")
+
+                query = """
+                        INSERT INTO sections (section_name, grade_level, strand, track, capacity,
+                                              room_number, teacher_id, adviser_id, status,
+                                              academic_year_id, created_at)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Active', %s, NOW()) \
+                        """
+
+                values = (
+                    data.section_name,
+                    data.grade_level,
+                    data.strand,
+                    data.track,
+                    data.capacity,
+                    data.room_number,
+                    data.teacher_id,
+                    data.adviser_id,
+                    data.academic_year_id
+                )
+
+                cursor.execute(query, values)
+                conn.commit()
                 cursor.close()
-                return False, f"Section '{data.section_name}' for {data.strand} already exists"
-
-            query = """
-                    INSERT INTO sections (section_name, strand, track, capacity,
-                                          room_number, teacher_id, adviser_id, status, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, 'Active', NOW()) \
-                    """
-
-            values = (
-                data.section_name,
-                data.strand,
-                data.track,
-                data.capacity,
-                data.room_number,
-                data.teacher_id,
-                data.adviser_id
-            )
-
-            cursor.execute(query, values)
-            self.db.commit()
-            cursor.close()
 
-            return True, "Section added successfully"
+                return True, "Section added successfully"
 
         except Exception as e:
-            print(f"Error adding section: {e}")
+            logger.error("Error adding section: %s", e)
             return False, f"Failed to add section: {str(e)}"
 
+    @invalidates("sections")
     def delete_section(self, section_id: int) -> Tuple[bool, str]:
         """Delete a section"""
         try:
-            cursor = self.db.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
 
-            # Check if section has students
-            cursor.execute("SELECT COUNT(*) FROM students WHERE section_id = %s", (section_id,))
-            count = cursor.fetchone()[0]
+                # Check if section has students
+                cursor.execute("SELECT COUNT(*) FROM students WHERE section_id = %s", (section_id,))
+                count = cursor.fetchone()[0]
 
-            if count > 0:
-                cursor.close()
-                return False, f"Cannot delete: Section has {count} enrolled student(s)"
+                if count > 0:
+                    cursor.close()
+                    return False, f"Cannot delete: Section has {count} enrolled student(s)"
 
-            cursor.execute("DELETE FROM sections WHERE id = %s", (section_id,))
-            self.db.commit()
-            cursor.close()
+                cursor.execute("DELETE FROM sections WHERE id = %s", (section_id,))
+                conn.commit()
+                cursor.close()
 
-            return True, "Section deleted successfully"
+                return True, "Section deleted successfully"
 
         except Exception as e:
-            print(f"Error deleting section: {e}")
+            logger.error("Error deleting section: %s", e)
             return False, f"Failed to delete section: {str(e)}"
\ No newline at end of file
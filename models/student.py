@@ -2,13 +2,51 @@
 Student Model - Handles all student-related database operations
 ENHANCED: Added comprehensive data retrieval for student details
 """
+import re
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime
-
-
-@dataclass
-class StudentData:
+from database.cache import cached, invalidates, invalidate_row, skip_cache
+from models import events
+from models.pagination import Page, DEFAULT_PAGE_SIZE, fetch_page
+from models.rows import Row, select_list, fetch_rows, fetch_row
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Words shorter than this are not in the full-text index (innodb_ft_min_token_size)
+FULLTEXT_MIN_WORD = 3
+
+STRANDS = ('STEM', 'ABM', 'HUMSS', 'GAS', 'TVL')
+
+# Columns that advanced search and listings filter on by exact match
+FILTER_FIELDS = ('strand', 'grade_level', 'status', 'payment_status', 'gender')
+
+# Roster export columns: (header, SQL expression)
+ROSTER_COLUMNS = [
+    ("LRN", "s.lrn"),
+    ("Last Name", "s.last_name"),
+    ("First Name", "s.first_name"),
+    ("Middle Name", "s.middle_name"),
+    ("Gender", "s.gender"),
+    ("Date of Birth", "s.date_of_birth"),
+    ("Email", "s.email"),
+    ("Contact Number", "s.contact_number"),
+    ("Address", "s.address"),
+    ("Guardian Name", "s.guardian_name"),
+    ("Guardian Contact", "s.guardian_contact"),
+    ("Strand", "s.strand"),
+    ("Track", "s.track"),
+    ("Grade Level", "s.grade_level"),
+    ("Section", "sec.section_name"),
+    ("Payment Status", "s.payment_status"),
+    ("Status", "s.status"),
+    ("Enrollment Date", "s.enrollment_date"),
+]
+
+
+@dataclass(slots=True)
+class StudentData(Row):
     """Student data blueprint"""
     id: Optional[int] = None
     lrn: str = ""
@@ -73,379 +111,792 @@ class StudentData:
         }
 
 
+@dataclass(slots=True)
+class StudentListRow(Row):
+    """A student in listings, search results and the activity table"""
+    id: Optional[int] = None
+    full_name: str = ""
+    strand: str = ""
+    date: Optional[str] = None  # Formatted enrollment date
+    status: str = "Enrolled"
+    email: str = ""
+    payment_status: str = "Pending"
+    grade_level: str = "11"
+    gender: str = ""
+    lrn: str = ""
+    enrollment_date: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class SectionStudentRow(Row):
+    """A student in a classroom's student list"""
+    id: int
+    name: str
+    email: str
+    strand: str
+    payment_status: str
+    date: str
+
+
+# Select lists for building rows positionally from tuple cursors
+STUDENT_COLUMNS = select_list(StudentData, 's', {'section_name': 'sec.section_name'})
+LIST_COLUMNS = select_list(StudentListRow, expressions={
+    'date': "DATE_FORMAT(enrollment_date, '%Y-%m-%d') AS date",
+})
+
+
 class Student:
     """Student model - Database operations for students"""
 
     def __init__(self, db):
         self.db = db
 
-    def add_student(self, data: StudentData) -> Tuple[bool, str]:
-        """Add a new student"""
+    @invalidates("students", "sections", "enrollment_counters")
+    def add_student(self, data: StudentData, require_section: bool = False) -> Tuple[bool, str]:
+        """
+        Add a new student.
+        A seat is reserved in data.section_id, or in the emptiest section of
+        the strand when no section is given, in the same transaction as the
+        insert. With require_section, enrollment fails when no seat is free.
+        """
         if not data.is_valid():
             return False, "Invalid student data"
 
         try:
-            cursor = self.db.cursor()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
 
-            # Check if LRN exists
-            cursor.execute("SELECT id FROM students WHERE lrn=%s", (data.lrn,))
-            if cursor.fetchone():
-                cursor.close()
-                return False, "LRN already exists"
-
-            # AUTO-ASSIGN SECTION: If no section_id provided, find one automatically
-            if not data.section_id:
-                print(f"No section assigned, finding available section for {data.strand}...")
+                # Check if LRN exists
+                cursor.execute("SELECT id FROM students WHERE lrn=%s", (data.lrn,))
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, "LRN already exists"
 
-                # Import Section model
+                # SECTION: take a seat atomically, auto-assigning if no section_id provided
+                from models.academic_year import AcademicYear
                 from models.section import Section
                 section_model = Section(self.db)
-
-                # Find available section for this strand
-                available_section = section_model.find_available_section(data.strand)
-
-                if available_section:
-                    data.section_id = available_section.id
-                    print(f"✅ Auto-assigned to section: {available_section.section_name} (ID: {available_section.id})")
+                active_year = AcademicYear(self.db).get_active_year()
+                year_id = active_year['id'] if active_year else None
+
+                requested_section = data.section_id
+                data.section_id = section_model.reserve_seat(
+                    data.strand, requested_section, data.grade_level, year_id
+                )
+
+                if data.section_id:
+                    logger.debug("✅ Reserved seat in section ID: %s", data.section_id)
+                elif requested_section:
+                    cursor.close()
+                    return False, "The selected section is full or is not open to this strand and grade"
+                elif require_section:
+                    cursor.close()
+                    return False, (f"There are no available sections for {data.strand} strand. "
+                                   "All sections are full or no sections have been created.")
                 else:
-                    print(f"⚠️ Warning: No available section found for {data.strand}")
-                    # You can either:
-                    # 1. Continue without section (current behavior)
-                    # 2. Return error: return False, f"No available section for {data.strand}"
-
-            query = """
-                    INSERT INTO students
-                    (lrn, full_name, first_name, last_name, middle_name, email, contact_number,
-                     address, date_of_birth, gender, guardian_name, guardian_contact,
-                     last_school, strand, track, grade_level, section_id,
-                     status, enrollment_date, payment_status, payment_mode)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            'Enrolled', NOW(), 'Pending', %s) \
-                    """
-
-            values = (
-                data.lrn,
-                data.full_name,
-                data.first_name,
-                data.last_name,
-                data.middle_name,
-                data.email,
-                data.contact_number,
-                data.address,
-                data.date_of_birth,
-                data.gender,
-                data.guardian_name,
-                data.guardian_contact,
-                data.last_school,
-                data.strand,
-                data.track,
-                data.grade_level,
-                data.section_id,  # This will now have a value
-                data.payment_mode
-            )
-
-            cursor.execute(query, values)
-            self.db.commit()
-            cursor.close()
+                    logger.warning("⚠️ Warning: No available section found for %s", data.strand)
+
+                query = """
+                        INSERT INTO students
+                        (lrn, full_name, first_name, last_name, middle_name, email, contact_number,
+                         address, date_of_birth, gender, guardian_name, guardian_contact,
+                         last_school, strand, track, grade_level, section_id, academic_year_id,
+                         status, enrollment_date, payment_status, payment_mode)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                                'Enrolled', NOW(), 'Pending', %s) \
+                        """
+
+                values = (
+                    data.lrn,
+                    data.full_name,
+                    data.first_name,
+                    data.last_name,
+                    data.middle_name,
+                    data.email,
+                    data.contact_number,
+                    data.address,
+                    data.date_of_birth,
+                    data.gender,
+                    data.guardian_name,
+                    data.guardian_contact,
+                    data.last_school,
+                    data.strand,
+                    data.track,
+                    data.grade_level,
+                    data.section_id,  # This will now have a value
+                    year_id,
+                    data.payment_mode
+                )
+
+                cursor.execute(query, values)
+                student_id = cursor.lastrowid
+                self._adjust_enrollment_counter(cursor, data.strand, data.section_id, year_id, 1)
+                cursor.close()
 
+            events.publish(events.STUDENT_ADDED, student_id=student_id, full_name=data.full_name,
+                           strand=data.strand, section_id=data.section_id)
             return True, "Student enrolled successfully"
 
         except Exception as e:
-            print(f"Error adding student: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding student: %s", e)
             return False, str(e)
 
+    @cached("students", "sections")
     def get_all_students(self) -> List[StudentData]:
         """Get all enrolled students"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                SELECT s.*, sec.section_name
-                FROM students s
-                LEFT JOIN sections sec ON s.section_id = sec.id
-                WHERE s.status = 'Enrolled'
-                ORDER BY s.enrollment_date DESC
-            """
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            cursor.close()
-
-            return [StudentData(**row) for row in rows]
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"""
+                    SELECT {STUDENT_COLUMNS}
+                    FROM students s
+                    LEFT JOIN sections sec ON s.section_id = sec.id
+                    WHERE s.status = 'Enrolled'
+                    ORDER BY s.enrollment_date DESC
+                """
+                cursor.execute(query)
+                students = fetch_rows(cursor, StudentData)
+                cursor.close()
+                return students
 
         except Exception as e:
-            print(f"Error getting students: {e}")
+            logger.error("Error getting students: %s", e)
+            skip_cache()
             return []
 
+    @cached("students", "sections")
     def get_student_by_id(self, student_id: int) -> Optional[StudentData]:
         """Get complete student information by ID"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                SELECT s.id, s.lrn, s.full_name, s.first_name, s.last_name, s.middle_name,
-                       s.email, s.contact_number, s.address, s.date_of_birth, s.gender,
-                       s.guardian_name, s.guardian_contact, s.last_school,
-                       s.strand, s.track, s.grade_level, s.section_id,
-                       s.payment_status, s.payment_mode, s.status, s.enrollment_date,
-                       sec.section_name
-                FROM students s
-                LEFT JOIN sections sec ON s.section_id = sec.id
-                WHERE s.id = %s
-            """
-            cursor.execute(query, (student_id,))
-            row = cursor.fetchone()
-            cursor.close()
-
-            if row:
-                return StudentData(**row)
-            return None
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"""
+                    SELECT {STUDENT_COLUMNS}
+                    FROM students s
+                    LEFT JOIN sections sec ON s.section_id = sec.id
+                    WHERE s.id = %s
+                """
+                cursor.execute(query, (student_id,))
+                student = fetch_row(cursor, StudentData)
+                cursor.close()
+                return student
 
         except Exception as e:
-            print(f"Error getting student: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting student: %s", e)
+            skip_cache()
             return None
 
-    def get_students_by_section(self, section_id: int) -> List[Dict]:
+    @cached("students")
+    def get_students_by_section(self, section_id: int) -> List[SectionStudentRow]:
         """Get all students in a specific section"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                SELECT s.id, s.full_name AS name, s.email, s.strand,
-                       COALESCE(s.payment_status, 'Pending') AS payment_status,
-                       DATE_FORMAT(s.enrollment_date, '%Y-%m-%d') AS date
-                FROM students s
-                WHERE s.section_id = %s AND s.status = 'Enrolled'
-                ORDER BY s.full_name
-            """
-            cursor.execute(query, (section_id,))
-            students = cursor.fetchall()
-            cursor.close()
-            return students
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = """
+                    SELECT s.id, s.full_name AS name, s.email, s.strand,
+                           COALESCE(s.payment_status, 'Pending') AS payment_status,
+                           DATE_FORMAT(s.enrollment_date, '%Y-%m-%d') AS date
+                    FROM students s
+                    WHERE s.section_id = %s AND s.status = 'Enrolled'
+                    ORDER BY s.full_name
+                """
+                cursor.execute(query, (section_id,))
+                students = fetch_rows(cursor, SectionStudentRow)
+                cursor.close()
+                return students
 
         except Exception as e:
-            print(f"Error getting students by section: {e}")
+            logger.error("Error getting students by section: %s", e)
+            skip_cache()
             return []
 
-    def get_recent_enrollments(self, limit: int = 10) -> List[Dict]:
+    def get_registration_form_rows(self, section_id: int = None, start_date=None,
+                                   end_date=None) -> List[Dict]:
+        """
+        Form fields for every enrolled student in a section and/or
+        enrollment date range (end_date inclusive), in one query
+        """
+        conditions = ["s.status = 'Enrolled'"]
+        params = []
+        if section_id:
+            conditions.append("s.section_id = %s")
+            params.append(section_id)
+        if start_date:
+            conditions.append("s.enrollment_date >= %s")
+            params.append(start_date)
+        if end_date:
+            conditions.append("s.enrollment_date < %s + INTERVAL 1 DAY")
+            params.append(end_date)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"""
+                SELECT s.lrn, s.full_name, s.gender,
+                       DATE_FORMAT(s.date_of_birth, '%Y-%m-%d') AS date_of_birth,
+                       s.address, s.contact_number, s.email,
+                       s.guardian_name, s.guardian_contact,
+                       s.strand, sec.section_name, s.payment_mode
+                FROM students s
+                LEFT JOIN sections sec ON s.section_id = sec.id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY s.strand, sec.section_name, s.last_name, s.first_name
+            """, params)
+            rows = cursor.fetchall()
+            cursor.close()
+            return rows
+
+    @cached("students")
+    def get_recent_enrollments(self, limit: int = 10) -> List[StudentListRow]:
         """Get most recent enrollments"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                SELECT id, full_name, strand,
-                       DATE_FORMAT(enrollment_date, '%Y-%m-%d %H:%i') as date,
-                       status
-                FROM students
-                WHERE status = 'Enrolled'
-                ORDER BY enrollment_date DESC
-                LIMIT %s
-            """
-            cursor.execute(query, (limit,))
-            enrollments = cursor.fetchall()
-            cursor.close()
-            return enrollments
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = """
+                    SELECT id, full_name, strand,
+                           DATE_FORMAT(enrollment_date, '%Y-%m-%d %H:%i') as date,
+                           status
+                    FROM students
+                    WHERE status = 'Enrolled'
+                    ORDER BY enrollment_date DESC
+                    LIMIT %s
+                """
+                cursor.execute(query, (limit,))
+                enrollments = fetch_rows(cursor, StudentListRow)
+                cursor.close()
+                return enrollments
 
         except Exception as e:
-            print(f"Error getting recent enrollments: {e}")
+            logger.error("Error getting recent enrollments: %s", e)
+            skip_cache()
             return []
 
-    def get_enrollments_by_date(self, date_filter, limit: int = 50) -> List[Dict]:
-        """Get enrollments filtered by date"""
+    def get_students_page(self, filters: dict = None, page_size: int = DEFAULT_PAGE_SIZE,
+                          token: str = None) -> Page:
+        """
+        One page of students (StudentListRow) matching filters, newest
+        enrollments first. Pass the returned page's next_token to get the
+        following page.
+        """
+        filters = filters or {}
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                SELECT full_name, strand,
-                       DATE_FORMAT(enrollment_date, '%Y-%m-%d %H:%i:%s') as date,
-                       status
-                FROM students
-                WHERE status = 'Enrolled' AND enrollment_date >= %s
-                ORDER BY enrollment_date DESC
-                LIMIT %s
-            """
-            cursor.execute(query, (date_filter, limit))
-            enrollments = cursor.fetchall()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                conditions = []
+                params = []
+
+                if filters.get('name'):
+                    _, _, condition, search_params = self._search_clause(filters['name'])
+                    conditions.append(condition)
+                    params.extend(search_params)
+
+                for field in FILTER_FIELDS:
+                    if filters.get(field):
+                        conditions.append(f"{field} = %s")
+                        params.append(filters[field])
+
+                if filters.get('date_from'):
+                    conditions.append("enrollment_date >= %s")
+                    params.append(filters['date_from'])
+
+                conditions.append("{keyset}")
+                query = f"""
+                    SELECT {LIST_COLUMNS}
+                    FROM students
+                    WHERE {' AND '.join(conditions)}
+                """
+
+                page = fetch_page(cursor, query, params,
+                                  (("enrollment_date", "enrollment_date"), ("id", "id")),
+                                  page_size, token, row_type=StudentListRow)
+                cursor.close()
+                return page
+
+        except Exception as e:
+            logger.error("Error getting students page: %s", e)
+            return Page()
+
+    def export_roster(self, path: str, status: str = 'Enrolled', progress=None) -> int:
+        """
+        Write the student master list to a .csv or .xlsx file.
+        Rows are streamed from an unbuffered cursor straight into the file,
+        so memory use does not grow with the roster. progress, if given, is
+        called with (rows_written, total_rows). Returns the rows written.
+        """
+        from utils.table_writer import TableWriter
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM students WHERE status = %s", (status,))
+            total = cursor.fetchone()[0]
             cursor.close()
-            return enrollments
+
+            columns = ", ".join(expression for _, expression in ROSTER_COLUMNS)
+            cursor = conn.cursor(buffered=False)
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM students s
+                LEFT JOIN sections sec ON s.section_id = sec.id
+                WHERE s.status = %s
+                ORDER BY s.strand, sec.section_name, s.last_name, s.first_name
+            """, (status,))
+
+            written = 0
+            try:
+                with TableWriter(path, [header for header, _ in ROSTER_COLUMNS], "Roster") as writer:
+                    while True:
+                        rows = cursor.fetchmany(1000)
+                        if not rows:
+                            break
+                        for row in rows:
+                            writer.writerow(row)
+                        written += len(rows)
+                        if progress:
+                            progress((written, total))
+            finally:
+                # Drain what is left on the wire if writing failed part way
+                conn.consume_results()
+                cursor.close()
+
+            return written
+
+    def get_enrollments_by_date(self, date_filter, limit: int = 50) -> List[StudentListRow]:
+        """Get enrollments filtered by date"""
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = """
+                    SELECT id, full_name, strand,
+                           DATE_FORMAT(enrollment_date, '%Y-%m-%d %H:%i:%s') as date,
+                           status
+                    FROM students
+                    WHERE status = 'Enrolled' AND enrollment_date >= %s
+                    ORDER BY enrollment_date DESC
+                    LIMIT %s
+                """
+                cursor.execute(query, (date_filter, limit))
+                enrollments = fetch_rows(cursor, StudentListRow)
+                cursor.close()
+                return enrollments
 
         except Exception as e:
-            print(f"Error getting enrollments by date: {e}")
+            logger.error("Error getting enrollments by date: %s", e)
             return []
 
+    @invalidates("students")
     def update_payment_status(self, student_id: int, new_status: str) -> bool:
         """Update student payment status"""
         try:
-            cursor = self.db.cursor()
-            query = "UPDATE students SET payment_status = %s WHERE id = %s"
-            cursor.execute(query, (new_status, student_id))
-            self.db.commit()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = "UPDATE students SET payment_status = %s WHERE id = %s"
+                cursor.execute(query, (new_status, student_id))
+                conn.commit()
+                cursor.close()
+            invalidate_row("students", student_id)
+
+            events.publish(events.PAYMENT_STATUS_CHANGED, student_id=student_id, payment_status=new_status)
             return True
         except Exception as e:
-            print(f"Error updating payment status: {e}")
+            logger.error("Error updating payment status: %s", e)
             return False
 
+    @invalidates("students", "sections", "student_status_history", "section_assignments", "enrollment_counters")
     def update_student(self, student_id: int, data: Dict, user_id: int = None) -> Tuple[bool, str]:
         """Update student information - ENHANCED"""
         try:
-            cursor = self.db.cursor()
-
-            # Track old values for audit
-            cursor.execute("SELECT * FROM students WHERE id = %s", (student_id,))
-            old_data = cursor.fetchone()
-
-            # Build update query
-            updates = []
-            values = []
-
-            # All updatable fields
-            fields = [
-                'first_name', 'middle_name', 'last_name', 'full_name',
-                'gender', 'date_of_birth', 'address', 'contact_number',
-                'email', 'guardian_name', 'guardian_contact', 'last_school',
-                'strand', 'track', 'grade_level', 'section_id',
-                'payment_status', 'status', 'status_reason'
-            ]
-
-            for field in fields:
-                if field in data:
-                    updates.append(f"{field} = %s")
-                    values.append(data[field])
-
-            if not updates:
-                return False, "No data to update"
-
-            # Add timestamp
-            updates.append("status_changed_date = NOW()")
-            if user_id:
-                updates.append("status_changed_by = %s")
-                values.append(user_id)
-
-            values.append(student_id)
-            query = f"UPDATE students SET {', '.join(updates)} WHERE id = %s"
-
-            cursor.execute(query, values)
-
-            # Log status change if status was updated
-            if 'status' in data and old_data:
-                old_status = old_data[15]  # Adjust index based on your table
-                new_status = data['status']
-                if old_status != new_status:
-                    cursor.execute("""
-                                   INSERT INTO student_status_history
-                                       (student_id, old_status, new_status, reason, changed_by)
-                                   VALUES (%s, %s, %s, %s, %s)
-                                   """, (student_id, old_status, new_status,
-                                         data.get('status_reason'), user_id))
-
-            # Log section change if section_id was updated
-            if 'section_id' in data and old_data:
-                old_section = old_data[16]  # Adjust index
-                new_section = data['section_id']
-                if old_section != new_section:
-                    # Mark old assignment as inactive
-                    if old_section:
-                        cursor.execute("""
-                                       UPDATE section_assignments
-                                       SET is_current   = FALSE,
-                                           removed_date = NOW()
-                                       WHERE student_id = %s
-                                         AND section_id = %s
-                                         AND is_current = TRUE
-                                       """, (student_id, old_section))
-
-                    # Create new assignment
-                    if new_section:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor(dictionary=True)
+
+                # Track old values for audit
+                cursor.execute("""
+                    SELECT status, section_id, strand, grade_level, academic_year_id, full_name
+                    FROM students WHERE id = %s
+                """, (student_id,))
+                old_data = cursor.fetchone()
+
+                # Build update query
+                updates = []
+                values = []
+
+                # All updatable fields
+                fields = [
+                    'first_name', 'middle_name', 'last_name', 'full_name',
+                    'gender', 'date_of_birth', 'address', 'contact_number',
+                    'email', 'guardian_name', 'guardian_contact', 'last_school',
+                    'strand', 'track', 'grade_level', 'section_id',
+                    'payment_status', 'status', 'status_reason'
+                ]
+
+                for field in fields:
+                    if field in data:
+                        updates.append(f"{field} = %s")
+                        values.append(data[field])
+
+                if not updates:
+                    return False, "No data to update"
+
+                # Add timestamp
+                updates.append("status_changed_date = NOW()")
+                if user_id:
+                    updates.append("status_changed_by = %s")
+                    values.append(user_id)
+
+                values.append(student_id)
+                query = f"UPDATE students SET {', '.join(updates)} WHERE id = %s"
+
+                cursor.execute(query, values)
+
+                # Log status change if status was updated
+                if 'status' in data and old_data:
+                    old_status = old_data['status']
+                    new_status = data['status']
+                    if old_status != new_status:
                         cursor.execute("""
-                                       INSERT INTO section_assignments
-                                           (student_id, section_id, assigned_by, is_current)
-                                       VALUES (%s, %s, %s, TRUE)
-                                       """, (student_id, new_section, user_id))
-
-            self.db.commit()
-            cursor.close()
+                                       INSERT INTO student_status_history
+                                           (student_id, old_status, new_status, reason, changed_by)
+                                       VALUES (%s, %s, %s, %s, %s)
+                                       """, (student_id, old_status, new_status,
+                                             data.get('status_reason'), user_id))
+
+                # Log section change if section_id was updated
+                if 'section_id' in data and old_data:
+                    old_section = old_data['section_id']
+                    new_section = data['section_id']
+                    if old_section != new_section:
+                        # Mark old assignment as inactive
+                        if old_section:
+                            cursor.execute("""
+                                           UPDATE section_assignments
+                                           SET is_current   = FALSE,
+                                               removed_date = NOW()
+                                           WHERE student_id = %s
+                                             AND section_id = %s
+                                             AND is_current = TRUE
+                                           """, (student_id, old_section))
+
+                        # Create new assignment
+                        if new_section:
+                            cursor.execute("""
+                                           INSERT INTO section_assignments
+                                               (student_id, section_id, assigned_by, is_current)
+                                           VALUES (%s, %s, %s, TRUE)
+                                           """, (student_id, new_section, user_id))
+
+                # Move the student between section seats and enrollment counters
+                if old_data:
+                    self._move_enrollment(cursor, old_data, data)
 
+                cursor.close()
+            invalidate_row("students", student_id)
+
+            if old_data:
+                new_data = {key: data.get(key, old_data[key]) for key in old_data}
+                events.publish(events.STUDENT_UPDATED, student_id=student_id,
+                               full_name=new_data['full_name'], strand=new_data['strand'],
+                               status=new_data['status'],
+                               enrolled_before=self._enrolled_key(old_data),
+                               enrolled_after=self._enrolled_key(new_data))
             return True, "Student updated successfully"
 
         except Exception as e:
-            print(f"Error updating student: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error updating student: %s", e)
             return False, str(e)
 
+    @invalidates("students", "sections", "enrollment_counters")
     def delete_student(self, student_id: int) -> bool:
         """Delete a student"""
         try:
-            cursor = self.db.cursor()
-            cursor.execute("DELETE FROM students WHERE id = %s", (student_id,))
-            self.db.commit()
-            cursor.close()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT status, section_id, strand, academic_year_id
+                    FROM students WHERE id = %s
+                """, (student_id,))
+                old_data = cursor.fetchone()
+
+                cursor.execute("DELETE FROM students WHERE id = %s", (student_id,))
+
+                if old_data and old_data['status'] == 'Enrolled':
+                    from models.section import Section
+                    Section(self.db).release_seat(old_data['section_id'])
+                    self._adjust_enrollment_counter(
+                        cursor, old_data['strand'], old_data['section_id'],
+                        old_data['academic_year_id'], -1
+                    )
+                cursor.close()
+            invalidate_row("students", student_id)
+
+            events.publish(events.STUDENT_DELETED, student_id=student_id,
+                           enrolled_before=self._enrolled_key(old_data) if old_data else None)
             return True
         except Exception as e:
-            print(f"Error deleting student: {e}")
+            logger.error("Error deleting student: %s", e)
             return False
 
-    def get_enrollment_stats(self, date_filter=None) -> Dict:
-        """Get enrollment statistics with optional date filtering"""
+    @staticmethod
+    def _enrolled_key(row: Dict) -> Optional[Tuple[str, Optional[int]]]:
+        """(strand, section_id) the student counts toward, or None if not enrolled"""
+        if row['status'] != 'Enrolled':
+            return None
+        return row['strand'], row['section_id']
+
+    def _adjust_enrollment_counter(self, cursor, strand, section_id, academic_year_id, delta: int):
+        """Add delta to the enrolled count of a strand/section/year"""
+        cursor.execute("""
+            INSERT INTO enrollment_counters (strand, section_id, academic_year_id, enrolled)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE enrolled = enrolled + VALUES(enrolled)
+        """, (strand, section_id or 0, academic_year_id or 0, delta))
+
+    def _move_enrollment(self, cursor, old_data: Dict, data: Dict):
+        """Apply a status, strand, section or grade change to section seats and enrollment counters"""
+        old_key = (old_data['status'], old_data['strand'], old_data['section_id'], old_data['grade_level'])
+        new_key = (
+            data.get('status', old_data['status']),
+            data.get('strand', old_data['strand']),
+            data.get('section_id', old_data['section_id']),
+            data.get('grade_level', old_data['grade_level'])
+        )
+        if old_key == new_key:
+            return
+
+        from models.section import Section
+        section_model = Section(self.db)
+
+        year_id = old_data['academic_year_id']
+        if old_key[0] == 'Enrolled':
+            section_model.release_seat(old_key[2])
+            self._adjust_enrollment_counter(cursor, old_key[1], old_key[2], year_id, -1)
+        if new_key[0] == 'Enrolled':
+            # Students saved before years were tracked take seats in the active year
+            seat_year_id = year_id
+            if seat_year_id is None:
+                from models.academic_year import AcademicYear
+                active_year = AcademicYear(self.db).get_active_year()
+                seat_year_id = active_year['id'] if active_year else None
+
+            # Raising rolls back the whole update
+            if new_key[2] and not section_model.reserve_seat(new_key[1], new_key[2], new_key[3], seat_year_id):
+                raise ValueError("The selected section is full or is not open to this strand and grade")
+            self._adjust_enrollment_counter(cursor, new_key[1], new_key[2], year_id, 1)
+
+    def promote_grade_11(self, cursor, from_year_id: Optional[int], to_year_id: int,
+                         reason: str, user_id: int = None) -> Tuple[int, int]:
+        """
+        Move every enrolled Grade 11 student of from_year_id (or with no year
+        and enrolled before to_year_id starts) to Grade 12 in to_year_id, filling the strand's open Grade 12 sections
+        in section-name order. Call inside the rollover transaction: each step
+        is one set-based statement over a temporary table of the cohort, so
+        the cost does not grow with round trips per student.
+        Returns (promoted, left without a section).
+        """
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS rollover_students, rollover_sections")
         try:
-            cursor = self.db.cursor(dictionary=True)
+            cursor.execute("""
+                CREATE TEMPORARY TABLE rollover_students (
+                    student_id INT PRIMARY KEY,
+                    strand VARCHAR(100) NOT NULL,
+                    old_section_id INT NULL,
+                    old_year_id INT NULL,
+                    seat INT NOT NULL,
+                    new_section_id INT NULL
+                ) ENGINE=MEMORY
+            """)
+            # Seats are numbered per strand in name order
+            cursor.execute("""
+                INSERT INTO rollover_students (student_id, strand, old_section_id, old_year_id, seat)
+                SELECT id, strand, section_id, academic_year_id,
+                       ROW_NUMBER() OVER (PARTITION BY strand ORDER BY last_name, first_name, id)
+                FROM students
+                WHERE status = 'Enrolled'
+                  AND grade_level = '11'
+                  AND (academic_year_id <=> %s
+                       OR (academic_year_id IS NULL
+                           AND enrollment_date < (SELECT start_date FROM academic_years WHERE id = %s)))
+            """, (from_year_id, to_year_id))
+            promoted = cursor.rowcount
+            if not promoted:
+                return 0, 0
+
+            # Lock the Grade 12 sections, then give each a range of seat numbers
+            cursor.execute("""
+                SELECT id FROM sections
+                WHERE grade_level = '12'
+                  AND status = 'Active'
+                  AND (academic_year_id = %s OR academic_year_id IS NULL)
+                FOR UPDATE
+            """, (to_year_id,))
+            cursor.fetchall()
+            cursor.execute("""
+                CREATE TEMPORARY TABLE rollover_sections (
+                    section_id INT PRIMARY KEY,
+                    strand VARCHAR(100) NOT NULL,
+                    first_seat INT NOT NULL,
+                    last_seat INT NOT NULL
+                ) ENGINE=MEMORY
+            """)
+            cursor.execute("""
+                INSERT INTO rollover_sections (section_id, strand, first_seat, last_seat)
+                SELECT id, strand,
+                       SUM(capacity - enrolled_count) OVER w - (capacity - enrolled_count) + 1,
+                       SUM(capacity - enrolled_count) OVER w
+                FROM sections
+                WHERE grade_level = '12'
+                  AND status = 'Active'
+                  AND (academic_year_id = %s OR academic_year_id IS NULL)
+                  AND enrolled_count < capacity
+                WINDOW w AS (PARTITION BY strand ORDER BY section_name, id)
+            """, (to_year_id,))
+            cursor.execute("""
+                UPDATE rollover_students r
+                JOIN rollover_sections x ON x.strand = r.strand AND r.seat BETWEEN x.first_seat AND x.last_seat
+                SET r.new_section_id = x.section_id
+            """)
 
-            # Build WHERE clause for date filtering
-            date_condition = ""
-            params = []
-            if date_filter:
-                date_condition = " AND enrollment_date >= %s"
-                params = [date_filter]
+            # History first, while the students still show their Grade 11 sections
+            cursor.execute("""
+                INSERT INTO student_status_history (student_id, old_status, new_status, reason, changed_by)
+                SELECT student_id, 'Enrolled', 'Enrolled', %s, %s
+                FROM rollover_students
+            """, (reason, user_id))
+            cursor.execute("""
+                UPDATE section_assignments a
+                JOIN rollover_students r ON a.student_id = r.student_id
+                SET a.is_current = FALSE,
+                    a.removed_date = NOW()
+                WHERE a.is_current = TRUE
+            """)
+            cursor.execute("""
+                INSERT INTO section_assignments (student_id, section_id, reason, assigned_by, is_current)
+                SELECT student_id, new_section_id, %s, %s, TRUE
+                FROM rollover_students
+                WHERE new_section_id IS NOT NULL
+            """, (reason, user_id))
 
-            # Total enrolled
-            query = f"SELECT COUNT(*) as count FROM students WHERE status='Enrolled'{date_condition}"
-            cursor.execute(query, params)
-            total = cursor.fetchone()['count']
+            cursor.execute("""
+                UPDATE students s
+                JOIN rollover_students r ON s.id = r.student_id
+                SET s.grade_level = '12',
+                    s.academic_year_id = %s,
+                    s.section_id = r.new_section_id
+            """, (to_year_id,))
+
+            # Section seats: give back the Grade 11 seats, take the Grade 12 ones
+            cursor.execute("""
+                UPDATE sections s
+                JOIN (SELECT old_section_id AS id, COUNT(*) AS seats
+                      FROM rollover_students
+                      WHERE old_section_id IS NOT NULL
+                      GROUP BY old_section_id) r ON s.id = r.id
+                SET s.enrolled_count = GREATEST(s.enrolled_count - r.seats, 0)
+            """)
+            cursor.execute("""
+                UPDATE sections s
+                JOIN (SELECT new_section_id AS id, COUNT(*) AS seats
+                      FROM rollover_students
+                      WHERE new_section_id IS NOT NULL
+                      GROUP BY new_section_id) r ON s.id = r.id
+                SET s.enrolled_count = s.enrolled_count + r.seats
+            """)
 
-            # Get total capacity per strand from sections
+            # Enrollment counters: out of the old strand/section/year keys, into the new ones
             cursor.execute("""
-                SELECT strand, SUM(capacity) as total_capacity
-                FROM sections
-                WHERE status = 'Active'
-                GROUP BY strand
+                INSERT INTO enrollment_counters (strand, section_id, academic_year_id, enrolled)
+                SELECT strand, COALESCE(old_section_id, 0), COALESCE(old_year_id, 0), -COUNT(*)
+                FROM rollover_students
+                GROUP BY strand, COALESCE(old_section_id, 0), COALESCE(old_year_id, 0)
+                ON DUPLICATE KEY UPDATE enrolled = enrolled + VALUES(enrolled)
             """)
-            strand_capacities = {row['strand']: row['total_capacity'] for row in cursor.fetchall()}
-
-            # Calculate total slots
-            total_slots = sum(strand_capacities.values())
-
-            # Get enrolled count per strand with date filter
-            query = f"""
-                SELECT strand, COUNT(*) as enrolled
-                FROM students 
-                WHERE status='Enrolled'{date_condition}
-                GROUP BY strand
-            """
-            cursor.execute(query, params)
-            enrolled_by_strand = {row['strand']: row['enrolled'] for row in cursor.fetchall()}
-
-            # Build strand data
-            strands = ['STEM', 'ABM', 'HUMSS', 'GAS', 'TVL']
-            strand_list = []
-            for strand in strands:
-                total_slots_strand = strand_capacities.get(strand, 0)
-                enrolled = enrolled_by_strand.get(strand, 0)
-                strand_list.append({
-                    'name': strand,
-                    'enrolled': enrolled,
-                    'total_slots': total_slots_strand
-                })
+            cursor.execute("""
+                INSERT INTO enrollment_counters (strand, section_id, academic_year_id, enrolled)
+                SELECT strand, COALESCE(new_section_id, 0), %s, COUNT(*)
+                FROM rollover_students
+                GROUP BY strand, COALESCE(new_section_id, 0)
+                ON DUPLICATE KEY UPDATE enrolled = enrolled + VALUES(enrolled)
+            """, (to_year_id,))
+
+            cursor.execute("SELECT COUNT(*) FROM rollover_students WHERE new_section_id IS NULL")
+            unassigned = cursor.fetchone()[0]
+            return promoted, unassigned
+
+        finally:
+            cursor.execute("DROP TEMPORARY TABLE IF EXISTS rollover_students, rollover_sections")
+
+    @invalidates("enrollment_counters")
+    def rebuild_enrollment_counters(self) -> bool:
+        """Recount enrollment_counters from the students table"""
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM enrollment_counters")
+                cursor.execute("""
+                    INSERT INTO enrollment_counters (strand, section_id, academic_year_id, enrolled)
+                    SELECT strand, COALESCE(section_id, 0), COALESCE(academic_year_id, 0), COUNT(*)
+                    FROM students
+                    WHERE status = 'Enrolled'
+                    GROUP BY strand, COALESCE(section_id, 0), COALESCE(academic_year_id, 0)
+                """)
+                cursor.close()
+                return True
 
-            cursor.close()
+        except Exception as e:
+            logger.error("Error rebuilding enrollment counters: %s", e)
+            return False
 
-            return {
-                'total_enrolled': total,
-                'total_slots': total_slots,
-                'available_slots': total_slots - total,
-                'by_strand': strand_list
-            }
+    @cached("students", "sections", "enrollment_counters")
+    def get_enrollment_stats(self, date_filter=None) -> Dict:
+        """Get enrollment statistics with optional date filtering"""
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+
+                if date_filter:
+                    enrolled_by_strand, strand_capacities = self._count_enrolled_since(cursor, date_filter)
+                else:
+                    # Enrolled counts and capacities per strand in one round trip
+                    cursor.execute("""
+                        SELECT strand, SUM(enrolled) as enrolled, SUM(capacity) as total_capacity
+                        FROM (
+                            SELECT strand, enrolled, 0 as capacity
+                            FROM enrollment_counters
+                            UNION ALL
+                            SELECT strand, 0, capacity
+                            FROM sections
+                            WHERE status = 'Active'
+                        ) totals
+                        GROUP BY strand
+                    """)
+                    rows = cursor.fetchall()
+                    enrolled_by_strand = {row['strand']: int(row['enrolled']) for row in rows}
+                    strand_capacities = {row['strand']: int(row['total_capacity']) for row in rows}
+
+                cursor.close()
+
+                total = sum(enrolled_by_strand.values())
+                total_slots = sum(strand_capacities.values())
+
+                # Build strand data
+                strand_list = []
+                for strand in STRANDS:
+                    total_slots_strand = strand_capacities.get(strand, 0)
+                    enrolled = enrolled_by_strand.get(strand, 0)
+                    strand_list.append({
+                        'name': strand,
+                        'enrolled': enrolled,
+                        'total_slots': total_slots_strand
+                    })
+
+                return {
+                    'total_enrolled': total,
+                    'total_slots': total_slots,
+                    'available_slots': total_slots - total,
+                    'by_strand': strand_list
+                }
 
         except Exception as e:
-            print(f"Error getting enrollment stats: {e}")
+            logger.error("Error getting enrollment stats: %s", e)
+            skip_cache()
             return {
                 'total_enrolled': 0,
                 'total_slots': 500,
@@ -453,98 +904,128 @@ class Student:
                 'by_strand': []
             }
 
-    def search_students(self, query: str) -> List[Dict]:
-        """Search students by name, email, or strand"""
+    def _count_enrolled_since(self, cursor, date_filter) -> Tuple[Dict, Dict]:
+        """Enrolled counts and capacities per strand for enrollments since date_filter"""
+        # Counters are not dated, so filtered reports still count the students table
+        cursor.execute("""
+            SELECT strand, COUNT(*) as enrolled
+            FROM students
+            WHERE status='Enrolled' AND enrollment_date >= %s
+            GROUP BY strand
+        """, (date_filter,))
+        enrolled_by_strand = {row['strand']: row['enrolled'] for row in cursor.fetchall()}
+
+        cursor.execute("""
+            SELECT strand, SUM(capacity) as total_capacity
+            FROM sections
+            WHERE status = 'Active'
+            GROUP BY strand
+        """)
+        strand_capacities = {row['strand']: int(row['total_capacity']) for row in cursor.fetchall()}
+
+        return enrolled_by_strand, strand_capacities
+
+    def _search_clause(self, text: str) -> Tuple[str, list, str, list]:
+        """
+        Build the relevance expression and WHERE condition for a search box query.
+        Digits match LRNs by prefix; words match names and emails through the
+        ft_student_search full-text index, each word as a prefix.
+        """
+        text = text.strip()
+        if text.isdigit():
+            # Exact LRN first, then the other LRNs that start with it
+            return "(lrn = %s) + 1", [text], "lrn LIKE %s", [f"{text}%"]
+
+        words = re.findall(r"\w+", text)
+        indexed = [word for word in words if len(word) >= FULLTEXT_MIN_WORD]
+
+        if indexed:
+            boolean_query = " ".join(f"+{word}*" for word in indexed)
+            relevance = "MATCH(full_name, email) AGAINST (%s IN BOOLEAN MODE)"
+            relevance_params = [boolean_query]
+            condition = relevance
+            params = [boolean_query]
+        elif words:
+            # Too short for the index - match the start of the name instead
+            relevance = "1"
+            relevance_params = []
+            condition = "full_name LIKE %s"
+            params = [f"{' '.join(words)}%"]
+        else:
+            return "0", [], "FALSE", []
+
+        if text.upper() in STRANDS:
+            condition = f"({condition} OR strand = %s)"
+            params.append(text.upper())
+
+        return relevance, relevance_params, condition, params
+
+    def search_students(self, query: str, limit: int = None) -> List[StudentListRow]:
+        """Search enrolled students by name, email, LRN or strand, best matches first"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            search_query = f"%{query.lower()}%"
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                relevance, relevance_params, condition, params = self._search_clause(query)
+
+                sql = f"""
+                    SELECT {LIST_COLUMNS}
+                    FROM students
+                    WHERE status = 'Enrolled' AND {condition}
+                    ORDER BY {relevance} DESC, enrollment_date DESC
+                """
+                params = params + relevance_params
+                if limit:
+                    sql += " LIMIT %s"
+                    params.append(limit)
 
-            sql = """
-                SELECT id, full_name, email, strand, payment_status,
-                       DATE_FORMAT(enrollment_date, '%Y-%m-%d') as date
-                FROM students
-                WHERE status = 'Enrolled' 
-                AND (LOWER(full_name) LIKE %s 
-                     OR LOWER(email) LIKE %s 
-                     OR LOWER(strand) LIKE %s)
-                ORDER BY enrollment_date DESC
-                LIMIT 50
-            """
-            cursor.execute(sql, (search_query, search_query, search_query))
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+                cursor.execute(sql, params)
+                results = fetch_rows(cursor, StudentListRow)
+                cursor.close()
+                return results
 
         except Exception as e:
-            print(f"Error searching students: {e}")
+            logger.error("Error searching students: %s", e)
             return []
 
+    def advanced_search(self, filters: dict, limit: int = None) -> List[StudentListRow]:
+        """Advanced search with multiple filters"""
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                relevance, relevance_params = "0", []
+                conditions = []
+                params = []
+
+                # Name/LRN/Email search
+                if filters.get('name'):
+                    relevance, relevance_params, condition, search_params = self._search_clause(filters['name'])
+                    conditions.append(condition)
+                    params.extend(search_params)
+
+                # Exact-match filters
+                for field in FILTER_FIELDS:
+                    if filters.get(field):
+                        conditions.append(f"{field} = %s")
+                        params.append(filters[field])
+
+                query = f"""
+                        SELECT {LIST_COLUMNS}
+                        FROM students
+                        WHERE {' AND '.join(conditions) or 'TRUE'}
+                        ORDER BY {relevance} DESC, enrollment_date DESC
+                        """
+                params = params + relevance_params
+                if limit:
+                    query += " LIMIT %s"
+                    params.append(limit)
+
+                cursor.execute(query, params)
+                results = fetch_rows(cursor, StudentListRow)
+                cursor.close()
 
-def advanced_search(self, filters: dict) -> List[Dict]:
-    """Advanced search with multiple filters"""
-    try:
-        cursor = self.db.cursor(dictionary=True)
-
-        query = """
-                SELECT id, \
-                       full_name, \
-                       email, \
-                       strand, \
-                       grade_level,
-                       payment_status, \
-                       status, \
-                       gender,
-                       DATE_FORMAT(enrollment_date, '%Y-%m-%d') as date
-                FROM students
-                WHERE 1=1 \
-                """
-        params = []
+                return results
 
-        # Name/LRN/Email search
-        if filters.get('name'):
-            query += """ AND (
-                LOWER(full_name) LIKE %s 
-                OR LOWER(email) LIKE %s 
-                OR lrn LIKE %s
-            )"""
-            search_term = f"%{filters['name'].lower()}%"
-            params.extend([search_term, search_term, search_term])
-
-        # Strand filter
-        if filters.get('strand'):
-            query += " AND strand = %s"
-            params.append(filters['strand'])
-
-        # Grade level filter
-        if filters.get('grade_level'):
-            query += " AND grade_level = %s"
-            params.append(filters['grade_level'])
-
-        # Status filter
-        if filters.get('status'):
-            query += " AND status = %s"
-            params.append(filters['status'])
-
-        # Payment status filter
-        if filters.get('payment_status'):
-            query += " AND payment_status = %s"
-            params.append(filters['payment_status'])
-
-        # Gender filter
-        if filters.get('gender'):
-            query += " AND gender = %s"
-            params.append(filters['gender'])
-
-        query += " ORDER BY enrollment_date DESC LIMIT 100"
-
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        cursor.close()
-
-        return results
-
-    except Exception as e:
-        print(f"Error in advanced search: {e}")
-        import traceback
-        traceback.print_exc()
-        return []
\ No newline at end of file
+        except Exception as e:
+            logger.exception("Error in advanced search: %s", e)
+            return []
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""
+Student Directory - In-memory prefix index of enrolled students
+Loaded once from the database and kept current from student model events,
+so the dashboard can suggest students while the user is still typing.
+Events only mark what changed; the re-reads happen when the owner calls
+sync() on a worker thread, never inside the write that published them.
+"""
+import threading
+from bisect import bisect_left, insort
+from typing import List
+
+from models import events
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class DirectoryEntry:
+    """The fields of an enrolled student needed for typeahead"""
+    __slots__ = ('id', 'lrn', 'full_name', 'email', 'strand')
+
+    def __init__(self, id: int, lrn: str, full_name: str, email: str, strand: str):
+        self.id = id
+        self.lrn = lrn or ""
+        self.full_name = full_name or ""
+        self.email = email or ""
+        self.strand = strand or ""
+
+    def keys(self) -> set:
+        """Lowercase search keys: each name word, the email, the LRN and the strand"""
+        keys = set(self.full_name.lower().split())
+        keys.update(key for key in (self.email.lower(), self.lrn, self.strand.lower()) if key)
+        return keys
+
+
+class StudentDirectory:
+    """Sorted (key, student_id) index answering prefix queries with binary search"""
+
+    def __init__(self, db):
+        self.db = db
+        self.loaded = False
+
+        self._entries = {}  # student_id -> DirectoryEntry
+        self._index = []  # sorted (key, student_id)
+        self._loading = False
+        self._pending = set()  # ids changed since they were last read
+        self._reload = False  # a bulk change needs a full load
+        self._lock = threading.RLock()
+
+        events.subscribe(events.STUDENT_ADDED, self._on_student_changed)
+        events.subscribe(events.STUDENT_UPDATED, self._on_student_changed)
+        events.subscribe(events.STUDENT_DELETED, self._on_student_deleted)
+        events.subscribe(events.STUDENTS_IMPORTED, self._on_bulk_change)
+        events.subscribe(events.YEAR_ROLLED_OVER, self._on_bulk_change)
+
+    def load(self) -> int:
+        """Read every enrolled student and rebuild the index"""
+        with self._lock:
+            self._loading = True
+            self._reload = False
+            self._pending.clear()
+
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, lrn, full_name, email, strand
+                    FROM students
+                    WHERE status = 'Enrolled'
+                """)
+                entries = {row[0]: DirectoryEntry(*row) for row in cursor.fetchall()}
+                cursor.close()
+        except Exception as e:
+            logger.error("Error loading student directory: %s", e)
+            with self._lock:
+                self._loading = False
+            return 0
+
+        index = [(key, entry.id) for entry in entries.values() for key in entry.keys()]
+        index.sort()
+
+        with self._lock:
+            self._entries = entries
+            self._index = index
+            self._loading = False
+            self.loaded = True
+            pending = list(self._pending)
+            self._pending.clear()
+
+        # Apply writes that raced with the initial read
+        for student_id in pending:
+            self.refresh(student_id)
+
+        return len(entries)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether writes since the last read are waiting for sync()"""
+        with self._lock:
+            return self.loaded and not self._loading and (self._reload or bool(self._pending))
+
+    def sync(self) -> int:
+        """Re-read what events marked as changed; call on a worker thread"""
+        with self._lock:
+            if self._loading or not self.loaded:
+                return 0
+            reload = self._reload
+            pending = list(self._pending)
+            self._pending.clear()
+
+        if reload:
+            return self.load()
+        for student_id in pending:
+            self.refresh(student_id)
+        return len(pending)
+
+    def search(self, text: str, limit: int = 10) -> List[DirectoryEntry]:
+        """Students where every word of text prefixes one of their keys"""
+        terms = text.lower().split()
+        if not terms:
+            return []
+
+        with self._lock:
+            # Walk the narrowest prefix range and check the other terms per entry
+            ranges = [(self._prefix_range(term), term) for term in terms]
+            (lo, hi), _ = min(ranges, key=lambda r: r[0][1] - r[0][0])
+
+            results = []
+            seen = set()
+            for i in range(lo, hi):
+                student_id = self._index[i][1]
+                if student_id in seen:
+                    continue
+                seen.add(student_id)
+
+                entry = self._entries[student_id]
+                keys = entry.keys()
+                if all(any(key.startswith(term) for key in keys) for term in terms):
+                    results.append(entry)
+                    if len(results) >= limit:
+                        break
+
+            return results
+
+    def refresh(self, student_id: int):
+        """Re-read one student and update the index"""
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, lrn, full_name, email, strand
+                    FROM students
+                    WHERE id = %s AND status = 'Enrolled'
+                """, (student_id,))
+                row = cursor.fetchone()
+                cursor.close()
+        except Exception as e:
+            logger.error("Error refreshing student %s in directory: %s", student_id, e)
+            return
+
+        with self._lock:
+            self._remove(student_id)
+            if row:
+                self._add(DirectoryEntry(*row))
+
+    def _prefix_range(self, prefix: str):
+        """Index positions of the keys starting with prefix"""
+        lo = bisect_left(self._index, (prefix,))
+        hi = bisect_left(self._index, (prefix + "\uffff",))
+        return lo, hi
+
+    def _add(self, entry: DirectoryEntry):
+        self._entries[entry.id] = entry
+        for key in entry.keys():
+            insort(self._index, (key, entry.id))
+
+    def _remove(self, student_id: int):
+        entry = self._entries.pop(student_id, None)
+        if entry is None:
+            return
+        for key in entry.keys():
+            i = bisect_left(self._index, (key, student_id))
+            if i < len(self._index) and self._index[i] == (key, student_id):
+                del self._index[i]
+
+    def _on_student_changed(self, student_id: int, **_):
+        with self._lock:
+            if self._loading or self.loaded:
+                self._pending.add(student_id)
+
+    def _on_student_deleted(self, student_id: int, **_):
+        with self._lock:
+            if self._loading:
+                self._pending.add(student_id)
+            self._remove(student_id)
+
+    def _on_bulk_change(self, **_):
+        # Imports and rollovers touch too many rows to refresh one by one
+        with self._lock:
+            if self.loaded:
+                self._reload = True
\ No newline at end of file
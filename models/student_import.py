@@ -0,0 +1,389 @@
+"""
+Student Import - Bulk enrollment of applicants from CSV or Excel files
+Rows are streamed from the file, validated against in-memory sets of the
+LRNs and emails already taken, and inserted in chunks with one section
+allocation and one batched INSERT per chunk.
+"""
+import csv
+import heapq
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from database.cache import invalidates
+from models import events
+from models.student import StudentData, STRANDS
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from openpyxl import load_workbook
+except ImportError:  # Excel import is optional
+    load_workbook = None
+
+
+# Header aliases accepted in import files -> StudentData field
+COLUMN_ALIASES = {
+    'lrn': 'lrn',
+    'first_name': 'first_name',
+    'firstname': 'first_name',
+    'middle_name': 'middle_name',
+    'middlename': 'middle_name',
+    'last_name': 'last_name',
+    'lastname': 'last_name',
+    'email': 'email',
+    'email_address': 'email',
+    'contact': 'contact_number',
+    'contact_number': 'contact_number',
+    'gender': 'gender',
+    'sex': 'gender',
+    'date_of_birth': 'date_of_birth',
+    'birthdate': 'date_of_birth',
+    'address': 'address',
+    'guardian_name': 'guardian_name',
+    'guardian': 'guardian_name',
+    'guardian_contact': 'guardian_contact',
+    'last_school': 'last_school',
+    'last_school_attended': 'last_school',
+    'strand': 'strand',
+    'track': 'track',
+    'grade_level': 'grade_level',
+    'grade': 'grade_level',
+    'payment_mode': 'payment_mode',
+}
+
+INSERT_STUDENT = """
+    INSERT INTO students
+    (lrn, full_name, first_name, last_name, middle_name, email, contact_number,
+     address, date_of_birth, gender, guardian_name, guardian_contact,
+     last_school, strand, track, grade_level, section_id, academic_year_id,
+     status, enrollment_date, payment_status, payment_mode)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            'Enrolled', NOW(), 'Pending', %s)
+"""
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import run"""
+    imported: int = 0
+    unassigned: int = 0  # imported without a free section seat
+    errors: List[Tuple[int, str]] = field(default_factory=list)  # (line, reason)
+    error_file: Optional[str] = None
+    by_strand: Dict[str, int] = field(default_factory=dict)  # imported per strand
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+class StudentImporter:
+    """Loads applicant files into the students table in batches"""
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, db):
+        self.db = db
+
+    @invalidates("students", "sections", "enrollment_counters")
+    def import_file(self, path: str, progress=None) -> ImportResult:
+        """
+        Import every valid row of a .csv or .xlsx file.
+        Rejected rows are written with their reason to <name>_errors.csv
+        next to the source file. progress, if given, is called with the
+        number of rows processed so far.
+        """
+        result = ImportResult()
+        taken_lrns, taken_emails = self._load_taken_keys()
+
+        error_rows = []
+        chunk = []
+        processed = 0
+
+        for line, row in self._read_rows(path):
+            processed += 1
+            student, reason = self._to_student(row)
+
+            if reason is None:
+                if student.lrn in taken_lrns:
+                    reason = "LRN already exists"
+                elif student.email.lower() in taken_emails:
+                    reason = "Email already exists"
+
+            if reason:
+                result.errors.append((line, reason))
+                error_rows.append((line, row, reason))
+                continue
+
+            taken_lrns.add(student.lrn)
+            taken_emails.add(student.email.lower())
+            chunk.append((line, row, student))
+
+            if len(chunk) >= self.CHUNK_SIZE:
+                self._insert_chunk(chunk, result, error_rows)
+                chunk = []
+                if progress:
+                    progress(processed)
+
+        if chunk:
+            self._insert_chunk(chunk, result, error_rows)
+        if progress:
+            progress(processed)
+
+        if error_rows:
+            result.error_file = self._write_error_file(path, error_rows)
+
+        if result.imported:
+            events.publish(events.STUDENTS_IMPORTED, count=result.imported, by_strand=result.by_strand)
+
+        return result
+
+    def _load_taken_keys(self) -> Tuple[set, set]:
+        """LRNs and lowercase emails already in the students table"""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT lrn, email FROM students")
+            lrns = set()
+            emails = set()
+            for lrn, email in cursor.fetchall():
+                lrns.add(lrn)
+                if email:
+                    emails.add(email.lower())
+            cursor.close()
+            return lrns, emails
+
+    def _read_rows(self, path: str) -> Iterator[Tuple[int, Dict]]:
+        """Yield (line number, row dict keyed by StudentData field) from the file"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.csv':
+            rows = self._read_csv(path)
+        elif extension in ('.xlsx', '.xlsm'):
+            rows = self._read_xlsx(path)
+        else:
+            raise ValueError(f"Unsupported file type: {extension or path}")
+
+        header = None
+        for line, values in rows:
+            if header is None:
+                header = [COLUMN_ALIASES.get(self._normalize_header(value)) for value in values]
+                if 'lrn' not in header:
+                    raise ValueError("The file has no LRN column")
+                continue
+
+            if not any(self._cell_text(value) for value in values):
+                continue  # Blank line
+
+            row = {}
+            for name, value in zip(header, values):
+                if name:
+                    row[name] = self._cell_text(value)
+            yield line, row
+
+    def _read_csv(self, path: str) -> Iterator[Tuple[int, list]]:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for line, values in enumerate(csv.reader(f), start=1):
+                yield line, values
+
+    def _read_xlsx(self, path: str) -> Iterator[Tuple[int, list]]:
+        if load_workbook is None:
+            raise ValueError("Excel import needs the openpyxl package (pip install openpyxl)")
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active
+            for line, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+                yield line, list(values)
+        finally:
+            workbook.close()
+
+    def _normalize_header(self, value) -> str:
+        return self._cell_text(value).lower().replace(' ', '_').replace('-', '_')
+
+    def _cell_text(self, value) -> str:
+        """Cell value as stripped text; Excel numbers and dates are converted"""
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # LRNs and phone numbers typed as numbers
+        if isinstance(value, datetime):
+            value = value.date()
+        if isinstance(value, date):
+            return value.isoformat()
+        return str(value).strip()
+
+    def _to_student(self, row: Dict) -> Tuple[Optional[StudentData], Optional[str]]:
+        """Build a StudentData from a row, or return the reason it is invalid"""
+        lrn = row.get('lrn', '')
+        first_name = row.get('first_name', '')
+        middle_name = row.get('middle_name') or None
+        last_name = row.get('last_name', '')
+        strand = row.get('strand', '').upper()
+
+        if middle_name:
+            full_name = f"{first_name} {middle_name} {last_name}"
+        else:
+            full_name = f"{first_name} {last_name}"
+
+        student = StudentData(
+            lrn=lrn,
+            full_name=full_name,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+            email=row.get('email') or f"{lrn}@student.edu",
+            contact_number=row.get('contact_number') or "N/A",
+            gender=row.get('gender') or "Male",
+            date_of_birth=row.get('date_of_birth') or None,
+            address=row.get('address') or "N/A",
+            guardian_name=row.get('guardian_name') or None,
+            guardian_contact=row.get('guardian_contact') or None,
+            last_school=row.get('last_school') or None,
+            strand=strand,
+            track=row.get('track') or ('Academic' if strand in ['STEM', 'ABM', 'HUMSS', 'GAS'] else 'TVL'),
+            grade_level=row.get('grade_level') or "11",
+            payment_mode=row.get('payment_mode') or "Full Payment"
+        )
+
+        # is_valid checks the length of the LRN but not that it is all digits
+        if not lrn.isdigit() or len(lrn) != 12:
+            return None, "LRN must be exactly 12 digits"
+        if not student.is_valid():
+            if not first_name or not last_name:
+                return None, "First and last name are required"
+            if '@' not in student.email:
+                return None, "Invalid email address"
+            return None, "Strand is required"
+        if strand not in STRANDS:
+            return None, f"Unknown strand: {strand}"
+        if student.grade_level not in ('11', '12'):
+            return None, f"Invalid grade level: {student.grade_level}"
+
+        return student, None
+
+    def _insert_chunk(self, chunk: list, result: ImportResult, error_rows: list):
+        """Insert a chunk in one transaction, falling back to row by row if it fails"""
+        try:
+            result.unassigned += self._insert_students([student for _, _, student in chunk])
+            result.imported += len(chunk)
+            for _, _, student in chunk:
+                result.by_strand[student.strand] = result.by_strand.get(student.strand, 0) + 1
+            return
+        except Exception as e:
+            if len(chunk) == 1:
+                line, row, _ = chunk[0]
+                result.errors.append((line, str(e)))
+                error_rows.append((line, row, str(e)))
+                return
+            logger.warning("Bulk insert failed, retrying row by row: %s", e)
+
+        for item in chunk:
+            self._insert_chunk([item], result, error_rows)
+
+    def _insert_students(self, students: List[StudentData]) -> int:
+        """
+        Allocate seats and insert students in one transaction.
+        Returns how many could not be given a section.
+        """
+        from models.academic_year import AcademicYear
+        active_year = AcademicYear(self.db).get_active_year()
+        year_id = active_year['id'] if active_year else None
+
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+
+            unassigned = 0
+            by_group = {}
+            for student in students:
+                by_group.setdefault((student.strand, student.grade_level), []).append(student)
+
+            seats_taken = {}
+            for (strand, grade_level), group in by_group.items():
+                unassigned += self._allocate_sections(cursor, strand, grade_level, year_id,
+                                                      group, seats_taken)
+
+            cursor.executemany(INSERT_STUDENT, [
+                (s.lrn, s.full_name, s.first_name, s.last_name, s.middle_name, s.email,
+                 s.contact_number, s.address, s.date_of_birth, s.gender, s.guardian_name,
+                 s.guardian_contact, s.last_school, s.strand, s.track, s.grade_level,
+                 s.section_id, year_id, s.payment_mode)
+                for s in students
+            ])
+
+            if seats_taken:
+                cursor.executemany(
+                    "UPDATE sections SET enrolled_count = enrolled_count + %s WHERE id = %s",
+                    [(count, section_id) for section_id, count in seats_taken.items()]
+                )
+
+            counters = {}
+            for s in students:
+                key = (s.strand, s.section_id or 0)
+                counters[key] = counters.get(key, 0) + 1
+            cursor.executemany("""
+                INSERT INTO enrollment_counters (strand, section_id, academic_year_id, enrolled)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE enrolled = enrolled + VALUES(enrolled)
+            """, [(strand, section_id, year_id or 0, count) for (strand, section_id), count in counters.items()])
+
+            cursor.close()
+            return unassigned
+
+    def _allocate_sections(self, cursor, strand: str, grade_level: str, year_id: Optional[int],
+                           students: List[StudentData], seats_taken: Dict[int, int]) -> int:
+        """
+        Spread students over the sections of the strand and grade level open
+        in year_id, emptiest first.
+        The section rows stay locked until the chunk commits, so enrollment
+        stations cannot take the same seats meanwhile.
+        """
+        cursor.execute("""
+                       SELECT id, capacity - enrolled_count AS free
+                       FROM sections
+                       WHERE strand = %s
+                         AND grade_level = %s
+                         AND (academic_year_id = %s OR academic_year_id IS NULL)
+                         AND status = 'Active'
+                         AND enrolled_count < capacity
+                       ORDER BY section_name
+                       FOR UPDATE
+                       """, (strand, grade_level, year_id))
+        # Max-heap on free seats
+        heap = [(-free, section_id) for section_id, free in cursor.fetchall()]
+        heapq.heapify(heap)
+
+        unassigned = 0
+        for student in students:
+            if not heap:
+                student.section_id = None
+                unassigned += 1
+                continue
+
+            free, section_id = heapq.heappop(heap)
+            student.section_id = section_id
+            seats_taken[section_id] = seats_taken.get(section_id, 0) + 1
+            if free + 1 < 0:
+                heapq.heappush(heap, (free + 1, section_id))
+
+        return unassigned
+
+    def _write_error_file(self, path: str, error_rows: list) -> Optional[str]:
+        """Write rejected rows and their reasons next to the source file"""
+        error_path = f"{os.path.splitext(path)[0]}_errors.csv"
+        fields = []
+        for _, row, _ in error_rows:
+            for name in row:
+                if name not in fields:
+                    fields.append(name)
+
+        try:
+            with open(error_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['line', 'error'] + fields)
+                for line, row, reason in sorted(error_rows, key=lambda r: r[0]):
+                    writer.writerow([line, reason] + [row.get(name, '') for name in fields])
+            return error_path
+        except OSError as e:
+            logger.error("Error writing import error file: %s", e)
+            return None
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Student Profile - Everything the student details and payment dialogs show
+The student, their section, payment summary and history, status changes,
+section assignments and documents are read in one pass over one pooled
+connection, and the result is cached for that student until a write to
+them commits (see invalidate_row). prefetch() loads many students the
+same way with IN (...) lists, so visible table rows open instantly.
+"""
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional
+
+from database.cache import cached, skip_cache
+from models.rows import select_list
+from models.section import SectionData
+from models.student import StudentData, STUDENT_COLUMNS
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+STUDENT_FIELDS = len(fields(StudentData))
+SUMMARY_FIELDS = ('total_fees', 'amount_paid', 'balance')
+
+# Most students loaded per IN (...) list
+PREFETCH_BATCH = 50
+
+# The student's section, joined on the same row as the student
+PROFILE_SECTION_COLUMNS = select_list(SectionData, 'sec', {
+    'student_count': 'sec.enrolled_count',
+    'teacher_name': 't.full_name',
+    'adviser_name': 'adv.full_name',
+    'adviser_email': 'adv.email',
+})
+
+
+@dataclass(slots=True)
+class StudentProfile:
+    """A student with the records around them; shared with the cache, so treat as read-only"""
+    student: StudentData
+    section: Optional[SectionData] = None
+    payment_summary: Dict = field(default_factory=dict)  # total_fees, amount_paid, balance, payment_status
+    payments: List[Dict] = field(default_factory=list)  # newest first, as get_student_payments
+    status_history: List[Dict] = field(default_factory=list)  # newest first
+    section_assignments: List[Dict] = field(default_factory=list)  # newest first
+    documents: Optional[Dict] = None  # latest student_documents checklist
+
+    @property
+    def student_id(self) -> int:
+        return self.student.id
+
+
+class StudentProfiles:
+    """Loads StudentProfile objects, one at a time or in batches"""
+
+    def __init__(self, db):
+        self.db = db
+
+    @cached("sections", "teachers", "users", "academic_years", row="students")
+    def get_profile(self, student_id: int) -> Optional[StudentProfile]:
+        """The full profile of student_id, or None if there is no such student"""
+        try:
+            return self._load([student_id]).get(student_id)
+        except Exception as e:
+            logger.exception("Error loading student profile: %s", e)
+            skip_cache()
+            return None
+
+    def prefetch(self, student_ids: List[int]) -> int:
+        """
+        Load the profiles of student_ids that are not cached yet, in batches,
+        and cache them as get_profile would. Returns how many were loaded.
+        """
+        missing = [student_id for student_id in dict.fromkeys(student_ids)
+                   if not self.get_profile.is_cached(student_id)]
+        loaded = 0
+        try:
+            for start in range(0, len(missing), PREFETCH_BATCH):
+                batch = missing[start:start + PREFETCH_BATCH]
+                generations = {student_id: self.get_profile.generation(student_id) for student_id in batch}
+                for student_id, profile in self._load(batch).items():
+                    self.get_profile.store(profile, student_id, generation=generations[student_id])
+                    loaded += 1
+        except Exception as e:
+            logger.error("Error prefetching student profiles: %s", e)
+        logger.debug("Prefetched %s of %s student profiles", loaded, len(missing))
+        return loaded
+
+    def _load(self, student_ids: List[int]) -> Dict[int, StudentProfile]:
+        """Profiles by student id; ids with no student are left out"""
+        ids = ", ".join(["%s"] * len(student_ids))
+        profiles = {}
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+
+            # Students, sections and payment totals, one row per student
+            cursor.execute(f"""
+                SELECT {STUDENT_COLUMNS},
+                       s.total_fees, s.amount_paid, s.balance,
+                       {PROFILE_SECTION_COLUMNS}
+                FROM students s
+                LEFT JOIN sections sec ON s.section_id = sec.id
+                LEFT JOIN teachers t ON sec.teacher_id = t.id
+                LEFT JOIN teachers adv ON sec.adviser_id = adv.id
+                WHERE s.id IN ({ids})
+            """, student_ids)
+            for row in cursor.fetchall():
+                student = StudentData(*row[:STUDENT_FIELDS])
+                totals = row[STUDENT_FIELDS:STUDENT_FIELDS + len(SUMMARY_FIELDS)]
+                section_row = row[STUDENT_FIELDS + len(SUMMARY_FIELDS):]
+                profiles[student.id] = StudentProfile(
+                    student=student,
+                    section=SectionData(*section_row) if section_row[0] is not None else None,
+                    payment_summary={
+                        **{name: value or 0 for name, value in zip(SUMMARY_FIELDS, totals)},
+                        'payment_status': student.payment_status,
+                    },
+                )
+            cursor.close()
+
+            if not profiles:
+                return profiles
+
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"""
+                SELECT p.*, u.username as recorded_by_name, ay.year_name
+                FROM payment_transactions p
+                LEFT JOIN users u ON p.recorded_by = u.id
+                LEFT JOIN academic_years ay ON p.academic_year_id = ay.id
+                WHERE p.student_id IN ({ids})
+                ORDER BY p.payment_date DESC, p.created_at DESC
+            """, student_ids)
+            for row in cursor.fetchall():
+                profiles[row['student_id']].payments.append(row)
+
+            cursor.execute(f"""
+                SELECT h.student_id, h.old_status, h.new_status, h.reason, h.changed_date,
+                       u.username AS changed_by_name
+                FROM student_status_history h
+                LEFT JOIN users u ON h.changed_by = u.id
+                WHERE h.student_id IN ({ids})
+                ORDER BY h.changed_date DESC
+            """, student_ids)
+            for row in cursor.fetchall():
+                profiles[row['student_id']].status_history.append(row)
+
+            cursor.execute(f"""
+                SELECT a.student_id, a.section_id, sec.section_name, a.assigned_date,
+                       a.removed_date, a.reason, a.is_current
+                FROM section_assignments a
+                LEFT JOIN sections sec ON a.section_id = sec.id
+                WHERE a.student_id IN ({ids})
+                ORDER BY a.assigned_date DESC
+            """, student_ids)
+            for row in cursor.fetchall():
+                profiles[row['student_id']].section_assignments.append(row)
+
+            # Newest checklist first; keep only that one per student
+            cursor.execute(f"""
+                SELECT student_id, form_138, psa_birth_cert, good_moral, medical_cert,
+                       report_card, verification_date, notes
+                FROM student_documents
+                WHERE student_id IN ({ids})
+                ORDER BY id DESC
+            """, student_ids)
+            for row in cursor.fetchall():
+                profile = profiles[row['student_id']]
+                if profile.documents is None:
+                    profile.documents = row
+            cursor.close()
+
+        return profiles
\ No newline at end of file
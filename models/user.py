@@ -5,10 +5,15 @@ import hashlib
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict
 from datetime import datetime
+from database.cache import cached, invalidates, skip_cache
+from models.rows import Row, select_list, fetch_row
+from utils.log import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
-class UserData:
+
+@dataclass(slots=True)
+class UserData(Row):
     """User data blueprint"""
     id: Optional[int] = None
     username: str = ""
@@ -47,63 +52,68 @@ class User:
     def validate_user(self, username: str, password: str) -> Optional[Dict]:
         """Validate user credentials and return user info"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            hashed = self._hash_password(password)
-
-            query = """
-                    SELECT id, username, role
-                    FROM users
-                    WHERE username = %s \
-                      AND password_hash = %s \
-                    """
-            cursor.execute(query, (username, hashed))
-            user = cursor.fetchone()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                hashed = self._hash_password(password)
+
+                query = """
+                        SELECT id, username, role
+                        FROM users
+                        WHERE username = %s \
+                          AND password_hash = %s \
+                        """
+                cursor.execute(query, (username, hashed))
+                user = cursor.fetchone()
+                cursor.close()
 
-            return user
+                return user
 
         except Exception as e:
-            print(f"Error validating user: {e}")
+            logger.error("Error validating user: %s", e)
             return None
 
+    @cached("users")
     def get_all_users(self) -> List[dict]:
         """Get all users (without passwords)"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = """
-                    SELECT id, \
-                           username, \
-                           role,
-                           DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%s') as created_at
-                    FROM users
-                    ORDER BY id DESC \
-                    """
-            cursor.execute(query)
-            users = cursor.fetchall()
-            cursor.close()
-            return users
+            with self.db.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                        SELECT id, \
+                               username, \
+                               role,
+                               DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%s') as created_at
+                        FROM users
+                        ORDER BY id DESC \
+                        """
+                cursor.execute(query)
+                users = cursor.fetchall()
+                cursor.close()
+                return users
 
         except Exception as e:
-            print(f"Error getting users: {e}")
+            logger.error("Error getting users: %s", e)
+            skip_cache()
             return []
 
+    @cached("users")
     def get_user_by_id(self, user_id: int) -> Optional[UserData]:
         """Get user by ID"""
         try:
-            cursor = self.db.cursor(dictionary=True)
-            query = "SELECT * FROM users WHERE id = %s"
-            cursor.execute(query, (user_id,))
-            row = cursor.fetchone()
-            cursor.close()
-
-            if row:
-                return UserData(**row)
-            return None
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                query = f"SELECT {select_list(UserData)} FROM users WHERE id = %s"
+                cursor.execute(query, (user_id,))
+                row = fetch_row(cursor, UserData)
+                cursor.close()
+                return row
 
         except Exception as e:
-            print(f"Error getting user: {e}")
+            logger.error("Error getting user: %s", e)
+            skip_cache()
             return None
 
+    @invalidates("users")
     def add_user(self, username: str, password: str, role: str) -> Tuple[bool, str]:
         """Add a new user with hashed password"""
         try:
@@ -111,100 +121,107 @@ class User:
             if len(password) < 6:
                 return False, "Password must be at least 6 characters"
 
-            cursor = self.db.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
 
-            # Check if username exists
-            cursor.execute("SELECT id FROM users WHERE username = %s", (username,))
-            if cursor.fetchone():
+                # Check if username exists
+                cursor.execute("SELECT id FROM users WHERE username = %s", (username,))
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, "Username already exists"
+
+                # Hash password and insert
+                hashed = self._hash_password(password)
+                query = """
+                        INSERT INTO users (username, password_hash, role, created_at)
+                        VALUES (%s, %s, %s, NOW()) \
+                        """
+                cursor.execute(query, (username, hashed, role))
+                conn.commit()
                 cursor.close()
-                return False, "Username already exists"
-
-            # Hash password and insert
-            hashed = self._hash_password(password)
-            query = """
-                    INSERT INTO users (username, password_hash, role, created_at)
-                    VALUES (%s, %s, %s, NOW()) \
-                    """
-            cursor.execute(query, (username, hashed, role))
-            self.db.commit()
-            cursor.close()
 
-            return True, "User added successfully"
+                return True, "User added successfully"
 
         except Exception as e:
-            print(f"Error adding user: {e}")
+            logger.error("Error adding user: %s", e)
             return False, f"Failed to add user: {str(e)}"
 
+    @invalidates("users")
     def delete_user(self, user_id: int) -> Tuple[bool, str]:
         """Delete a user"""
         try:
-            cursor = self.db.cursor()
-
-            # Prevent deleting the last admin
-            cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'admin'")
-            admin_count = cursor.fetchone()[0]
-
-            if admin_count <= 1:
-                cursor.execute("SELECT role FROM users WHERE id = %s", (user_id,))
-                user_role = cursor.fetchone()
-                if user_role and user_role[0] == 'admin':
-                    cursor.close()
-                    return False, "Cannot delete the last admin user"
-
-            # Delete user
-            cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
-            self.db.commit()
-            cursor.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+
+                # Prevent deleting the last admin
+                cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'admin'")
+                admin_count = cursor.fetchone()[0]
+
+                if admin_count <= 1:
+                    cursor.execute("SELECT role FROM users WHERE id = %s", (user_id,))
+                    user_role = cursor.fetchone()
+                    if user_role and user_role[0] == 'admin':
+                        cursor.close()
+                        return False, "Cannot delete the last admin user"
+
+                # Delete user
+                cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
+                conn.commit()
+                cursor.close()
 
-            return True, "User deleted successfully"
+                return True, "User deleted successfully"
 
         except Exception as e:
-            print(f"Error deleting user: {e}")
+            logger.error("Error deleting user: %s", e)
             return False, f"Failed to delete user: {str(e)}"
 
+    @invalidates("users")
     def update_password(self, user_id: int, new_password: str) -> Tuple[bool, str]:
         """Update user password"""
         try:
             if len(new_password) < 6:
                 return False, "Password must be at least 6 characters"
 
-            cursor = self.db.cursor()
-            hashed = self._hash_password(new_password)
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                hashed = self._hash_password(new_password)
 
-            query = "UPDATE users SET password_hash = %s WHERE id = %s"
-            cursor.execute(query, (hashed, user_id))
-            self.db.commit()
-            cursor.close()
+                query = "UPDATE users SET password_hash = %s WHERE id = %s"
+                cursor.execute(query, (hashed, user_id))
+                conn.commit()
+                cursor.close()
 
-            return True, "Password updated successfully"
+                return True, "Password updated successfully"
 
         except Exception as e:
-            print(f"Error updating password: {e}")
+            logger.error("Error updating password: %s", e)
             return False, f"Failed to update password: {str(e)}"
 
+    @invalidates("users")
     def create_default_admin(self) -> Tuple[bool, str]:
         """Create default admin user if none exists"""
         try:
-            cursor = self.db.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
 
-            # Check if admin exists
-            cursor.execute("SELECT COUNT(*) FROM users WHERE username = 'admin'")
-            if cursor.fetchone()[0] > 0:
+                # Check if admin exists
+                cursor.execute("SELECT COUNT(*) FROM users WHERE username = 'admin'")
+                if cursor.fetchone()[0] > 0:
+                    cursor.close()
+                    return False, "Default admin already exists"
+
+                # Create admin
+                hashed = self._hash_password('admin123')
+                query = """
+                        INSERT INTO users (username, password_hash, role, created_at)
+                        VALUES ('admin', %s, 'admin', NOW()) \
+                        """
+                cursor.execute(query, (hashed,))
+                conn.commit()
                 cursor.close()
-                return False, "Default admin already exists"
-
-            # Create admin
-            hashed = self._hash_password('admin123')
-            query = """
-                    INSERT INTO users (username, password_hash, role, created_at)
-                    VALUES ('admin', %s, 'admin', NOW()) \
-                    """
-            cursor.execute(query, (hashed,))
-            self.db.commit()
-            cursor.close()
 
-            return True, "Default admin created (username: admin, password: admin123)"
+                return True, "Default admin created (username: admin, password: admin123)"
 
         except Exception as e:
-            print(f"Error creating default admin: {e}")
+            logger.error("Error creating default admin: %s", e)
             return False, str(e)
\ No newline at end of file
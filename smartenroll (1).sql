@@ -374,7 +374,7 @@ ALTER TABLE `payment_transactions`
   ADD UNIQUE KEY `receipt_number` (`receipt_number`),
   ADD KEY `academic_year_id` (`academic_year_id`),
   ADD KEY `recorded_by` (`recorded_by`),
-  ADD KEY `idx_student` (`student_id`),
+  ADD KEY `idx_student_date` (`student_id`,`payment_date`,`created_at`),
   ADD KEY `idx_date` (`payment_date`);
 
 --
@@ -391,7 +391,8 @@ ALTER TABLE `sections`
   ADD PRIMARY KEY (`id`),
   ADD KEY `teacher_id` (`teacher_id`),
   ADD KEY `adviser_id` (`adviser_id`),
-  ADD KEY `academic_year_id` (`academic_year_id`);
+  ADD KEY `academic_year_id` (`academic_year_id`),
+  ADD KEY `idx_strand_status` (`strand`,`status`,`section_name`);
 
 --
 -- Indexes for table `section_assignments`
@@ -413,9 +414,12 @@ ALTER TABLE `students`
   ADD KEY `idx_lrn` (`lrn`),
   ADD KEY `idx_email` (`email`),
   ADD KEY `idx_status` (`status`),
-  ADD KEY `idx_strand` (`strand`),
-  ADD KEY `idx_section` (`section_id`),
-  ADD KEY `fk_academic_year` (`academic_year_id`);
+  ADD KEY `idx_status_enrolled` (`status`,`enrollment_date`),
+  ADD KEY `idx_strand_status_date` (`strand`,`status`,`enrollment_date`),
+  ADD KEY `idx_status_strand_section` (`status`,`strand`,`section_id`,`academic_year_id`),
+  ADD KEY `idx_section_status` (`section_id`,`status`),
+  ADD KEY `fk_academic_year` (`academic_year_id`),
+  ADD FULLTEXT KEY `ft_student_search` (`full_name`,`email`);
 
 --
 -- Indexes for table `student_documents`
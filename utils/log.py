@@ -0,0 +1,110 @@
+"""
+Log - Leveled application logging through a background queue
+Callers only put records on a queue; a listener thread formats them and
+writes the rotating log file and the console, so logging never waits on
+disk or a slow Windows console. Messages use %-style arguments and are
+only formatted when their level is enabled. Per-row TRACE events are
+sampled: one in every trace_sample_rate is kept per call site; DEBUG and
+above are always kept.
+"""
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from database.config import LOG_CONFIG
+
+# Below DEBUG, for events emitted once per row or per item
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+ROOT_LOGGER = "smartenroll"
+
+_listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module; pass __name__"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in every `rate` TRACE records from each call site"""
+
+    def __init__(self, rate: int):
+        super().__init__()
+        self.rate = max(int(rate), 1)
+        self._seen = {}  # (pathname, lineno) -> records so far
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > TRACE or self.rate == 1:
+            return True
+        site = (record.pathname, record.lineno)
+        with self._lock:
+            seen = self._seen.get(site, 0)
+            self._seen[site] = seen + 1
+        return seen % self.rate == 0
+
+
+def _level(name) -> int:
+    """Level number for a name such as 'INFO' or 'TRACE'"""
+    level = logging.getLevelName(str(name).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def setup_logging(config: dict = None):
+    """
+    Route the application loggers through the queue. Safe to call twice.
+    The SMARTENROLL_LOG_LEVEL environment variable overrides the level.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    config = {**LOG_CONFIG, **(config or {})}
+    level = _level(os.environ.get("SMARTENROLL_LOG_LEVEL", config['level']))
+
+    handlers = []
+    try:
+        path = config['file']
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        file_handler = RotatingFileHandler(path, maxBytes=config['max_bytes'],
+                                           backupCount=config['backups'], encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)-7s %(threadName)s %(name)s: %(message)s"))
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"⚠️ Could not open log file, logging to the console only: {e}")
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(_level(config['console_level']))
+    console.setFormatter(logging.Formatter("%(message)s"))
+    handlers.append(console)
+
+    records = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    queue_handler.addFilter(SamplingFilter(config['trace_sample_rate']))
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+    root.propagate = False
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Write out queued records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
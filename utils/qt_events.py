@@ -0,0 +1,33 @@
+"""
+Qt Events - Delivers model events to widgets on the GUI thread
+Models publish on whichever thread did the write, which may be a TaskRunner
+worker. The bridge re-emits each event as a Qt signal, so slots on GUI
+objects run on the GUI thread through a queued connection.
+"""
+from functools import partial
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from models import events
+
+
+class EventBridge(QObject):
+    """Forwards the given model event topics to the received signal"""
+
+    # Emits (topic, payload)
+    received = pyqtSignal(str, dict)
+
+    def __init__(self, topics, parent=None):
+        super().__init__(parent)
+        subscriptions = []
+        for topic in topics:
+            handler = partial(self._forward, topic)
+            events.subscribe(topic, handler)
+            subscriptions.append((topic, handler))
+
+        # Stop receiving once the bridge is gone
+        self.destroyed.connect(lambda *_, subs=subscriptions: [
+            events.unsubscribe(topic, handler) for topic, handler in subs
+        ])
+
+    def _forward(self, topic: str, **payload):
+        self.received.emit(topic, payload)
\ No newline at end of file
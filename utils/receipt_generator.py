@@ -1 +1,191 @@
-
+"""
+Receipt Generator - Renders payment receipts to PDF
+The school logo is read once per process and decoded once per thread;
+paragraph styles and the table style are shared by every receipt.
+Rendering is plain blocking code so callers run it on a TaskRunner, and batches of receipts are drawn into
+one document.
+"""
+import io
+import os
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+SCHOOL_NAME = "SmartEnroll"
+SCHOOL_SUBTITLE = "Student Enrollment Management"
+RECEIPTS_DIR = "receipts"
+LOGO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "school_logo.png")
+
+_template = None
+_template_lock = threading.Lock()
+
+
+class _ReceiptTemplate:
+    """Everything about a receipt that does not depend on the payment"""
+
+    def __init__(self):
+        # ImageReader is not thread-safe, so each rendering thread decodes its own copy
+        self.logo_bytes = None
+        if os.path.exists(LOGO_PATH):
+            with open(LOGO_PATH, 'rb') as f:
+                self.logo_bytes = f.read()
+        self._local = threading.local()
+
+        base = getSampleStyleSheet()
+        self.title = ParagraphStyle('ReceiptTitle', parent=base['Title'], fontSize=18,
+                                    textColor=colors.HexColor('#2C3E50'), spaceAfter=4)
+        self.subtitle = ParagraphStyle('ReceiptSubtitle', parent=base['Normal'], alignment=1,
+                                       textColor=colors.HexColor('#7F8C8D'))
+        self.normal = base['Normal']
+        self.footer = ParagraphStyle('ReceiptFooter', parent=base['Normal'], alignment=1,
+                                     fontSize=8, textColor=colors.HexColor('#7F8C8D'))
+        self.amount = ParagraphStyle('ReceiptAmount', parent=base['Heading2'], alignment=1,
+                                     textColor=colors.HexColor('#27AE60'))
+
+        self.table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#365486')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDC3C7')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')]),
+        ])
+
+    @property
+    def logo(self) -> Optional[ImageReader]:
+        """This thread's reader for the logo; reportlab embeds one reader only once per document"""
+        if self.logo_bytes is None:
+            return None
+        reader = getattr(self._local, 'logo', None)
+        if reader is None:
+            reader = self._local.logo = ImageReader(io.BytesIO(self.logo_bytes))
+        return reader
+
+    def draw_page(self, canvas, doc):
+        """Page decoration shared by every receipt page"""
+        logo = self.logo
+        if logo is None:
+            return
+        canvas.saveState()
+        size = 0.8 * inch
+        canvas.drawImage(logo, doc.leftMargin, doc.pagesize[1] - doc.topMargin + 0.1 * inch,
+                         width=size, height=size, preserveAspectRatio=True, mask='auto')
+        canvas.restoreState()
+
+
+def _get_template() -> _ReceiptTemplate:
+    """Build the shared template on first use"""
+    global _template
+    if _template is None:
+        with _template_lock:
+            if _template is None:
+                _template = _ReceiptTemplate()
+    return _template
+
+
+def _format_amount(value) -> str:
+    try:
+        return f"PHP {float(value):,.2f}"
+    except (TypeError, ValueError):
+        return "PHP 0.00"
+
+
+def _receipt_story(template: _ReceiptTemplate, payment: dict, student: dict) -> list:
+    """Flowables for one receipt"""
+    story = [
+        Paragraph("OFFICIAL RECEIPT", template.title),
+        Paragraph(SCHOOL_NAME, template.subtitle),
+        Paragraph(SCHOOL_SUBTITLE, template.subtitle),
+        Spacer(1, 16),
+        Paragraph(_format_amount(payment.get('amount')), template.amount),
+        Spacer(1, 10),
+    ]
+
+    data = [
+        ['Field', 'Details'],
+        ['Receipt Number', payment.get('receipt_number') or 'N/A'],
+        ['Payment Date', str(payment.get('payment_date') or 'N/A')],
+        ['Student Name', student.get('full_name') or 'N/A'],
+        ['LRN', student.get('lrn') or 'N/A'],
+        ['Strand / Section', f"{student.get('strand') or 'N/A'} / {student.get('section_name') or 'TBA'}"],
+        ['Payment Type', payment.get('payment_type') or 'N/A'],
+        ['Payment Method', payment.get('payment_method') or 'N/A'],
+        ['Reference Number', payment.get('reference_number') or 'N/A'],
+        ['Amount Paid', _format_amount(payment.get('amount'))],
+        ['Recorded By', payment.get('recorded_by_name') or 'N/A'],
+    ]
+    if payment.get('notes'):
+        data.append(['Notes', Paragraph(str(payment['notes']), template.normal)])
+
+    table = Table(data, colWidths=[150, 330])
+    table.setStyle(template.table_style)
+    story.append(table)
+
+    story.append(Spacer(1, 24))
+    story.append(Paragraph(
+        f"Generated on {datetime.now().strftime('%B %d, %Y %I:%M %p')}. "
+        "This receipt is system generated and valid without signature.",
+        template.footer
+    ))
+    return story
+
+
+def _receipt_path(payment: dict) -> str:
+    os.makedirs(RECEIPTS_DIR, exist_ok=True)
+    name = payment.get('receipt_number') or f"payment_{payment.get('id', 'new')}"
+    return os.path.join(RECEIPTS_DIR, f"Receipt_{name}.pdf")
+
+
+def generate_payment_receipt(payment: dict, student: dict, output_path: str = None) -> Optional[str]:
+    """Render one receipt to PDF; returns the file path, or None on failure"""
+    try:
+        template = _get_template()
+        path = output_path or _receipt_path(payment)
+
+        doc = SimpleDocTemplate(path, pagesize=letter, title=f"Receipt {payment.get('receipt_number', '')}")
+        doc.build(_receipt_story(template, payment, student),
+                  onFirstPage=template.draw_page, onLaterPages=template.draw_page)
+        return path
+
+    except Exception as e:
+        logger.exception("Error generating receipt: %s", e)
+        return None
+
+
+def generate_receipt_batch(receipts: List[Tuple[dict, dict]], output_path: str, progress=None) -> Optional[str]:
+    """
+    Render many (payment, student) receipts into one PDF, one per page.
+    progress, if given, is called with (receipts_done, total) while the
+    pages are laid out.
+    """
+    try:
+        template = _get_template()
+        story = []
+        total = len(receipts)
+        for done, (payment, student) in enumerate(receipts, start=1):
+            if story:
+                story.append(PageBreak())
+            story.extend(_receipt_story(template, payment, student))
+            if progress and (done % 50 == 0 or done == total):
+                progress((done, total))
+
+        doc = SimpleDocTemplate(output_path, pagesize=letter, title="Payment Receipts")
+        doc.build(story, onFirstPage=template.draw_page, onLaterPages=template.draw_page)
+        return output_path
+
+    except Exception as e:
+        logger.exception("Error generating receipt batch: %s", e)
+        return None
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Registration Forms - Renders student enrollment forms to PDF
+reportlab layout is CPU bound and holds the GIL, so large batches are split
+into chunks rendered in parallel by a process pool. The chunk files are
+merged into one PDF when pypdf is installed and zipped otherwise.
+"""
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+
+try:
+    from pypdf import PdfWriter
+except ImportError:  # Merging into a single PDF is optional
+    PdfWriter = None
+
+FORMS_DIR = "registration_forms"
+CHUNK_SIZE = 50  # forms per worker job
+
+# Form row label -> student dict key
+FORM_FIELDS = [
+    ('LRN', 'lrn'),
+    ('Full Name', 'full_name'),
+    ('Gender', 'gender'),
+    ('Date of Birth', 'date_of_birth'),
+    ('Address', 'address'),
+    ('Contact Number', 'contact_number'),
+    ('Email Address', 'email'),
+    ('Guardian Name', 'guardian_name'),
+    ('Guardian Contact', 'guardian_contact'),
+    ('Strand', 'strand'),
+    ('Section', 'section_name'),
+    ('Payment Mode', 'payment_mode'),
+]
+
+_styles = None
+
+
+def _get_styles() -> Dict:
+    """Paragraph and table styles, built once per process"""
+    global _styles
+    if _styles is None:
+        base = getSampleStyleSheet()
+        _styles = {
+            'title': ParagraphStyle('FormTitle', parent=base['Title'],
+                                    textColor=colors.HexColor('#2C3E50')),
+            'centered': ParagraphStyle('FormCentered', parent=base['Normal'], alignment=1),
+            'table': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#365486')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 1), (-1, -1), 10),
+                ('TOPPADDING', (0, 1), (-1, -1), 8),
+                ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+            ]),
+        }
+    return _styles
+
+
+def _form_story(student: Dict, styles: Dict, generated_on: str) -> list:
+    """Flowables for one student's form"""
+    story = [
+        Paragraph("STUDENT ENROLLMENT FORM", styles['title']),
+        Spacer(1, 12),
+        Paragraph("SmartEnroll System", styles['centered']),
+        Paragraph("Student Enrollment Management", styles['centered']),
+        Spacer(1, 20),
+    ]
+
+    data = [['Field', 'Information']]
+    for label, key in FORM_FIELDS:
+        value = student.get(key)
+        if key == 'section_name':
+            value = value or 'TBA'
+        elif key in ('guardian_name', 'guardian_contact'):
+            value = value or 'N/A'
+        data.append([label, '' if value is None else str(value)])
+
+    table = Table(data, colWidths=[150, 350])
+    table.setStyle(styles['table'])
+    story.append(table)
+    story.append(Spacer(1, 30))
+
+    story.append(Paragraph("This is an official enrollment document.", styles['centered']))
+    story.append(Spacer(1, 10))
+    story.append(Paragraph(f"Generated on: {generated_on}", styles['centered']))
+    return story
+
+
+def _render(students: List[Dict], path: str) -> str:
+    """Render forms one per page into path (runs in worker processes too)"""
+    styles = _get_styles()
+    generated_on = datetime.now().strftime("%B %d, %Y at %I:%M:%S %p")
+
+    story = []
+    for student in students:
+        if story:
+            story.append(PageBreak())
+        story.extend(_form_story(student, styles, generated_on))
+
+    SimpleDocTemplate(path, pagesize=letter).build(story)
+    return path
+
+
+def render_registration_form(student: Dict, output_path: str = None) -> str:
+    """Render one student's form; returns the file path"""
+    if output_path is None:
+        os.makedirs(FORMS_DIR, exist_ok=True)
+        output_path = os.path.join(FORMS_DIR, f"Registration_{student['lrn']}.pdf")
+    return _render([student], output_path)
+
+
+def render_registration_forms(students: List[Dict], output_path: str, progress=None,
+                              workers: int = None) -> str:
+    """
+    Render one form per student, in order, into output_path.
+    Batches larger than CHUNK_SIZE are rendered across a process pool.
+    Without pypdf the rendered parts are zipped next to output_path and
+    the .zip path is returned instead. progress, if given, is called with
+    (forms_done, total).
+    """
+    total = len(students)
+    if not total:
+        raise ValueError("No students matched the selection")
+
+    if total <= CHUNK_SIZE:
+        _render(students, output_path)
+        if progress:
+            progress((total, total))
+        return output_path
+
+    chunks = [students[i:i + CHUNK_SIZE] for i in range(0, total, CHUNK_SIZE)]
+    workdir = tempfile.mkdtemp(prefix="smartenroll_forms_")
+    try:
+        parts = [os.path.join(workdir, f"part_{n:04d}.pdf") for n in range(len(chunks))]
+        workers = workers or min(len(chunks), os.cpu_count() or 1)
+
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_render, chunk, part): len(chunk)
+                       for chunk, part in zip(chunks, parts)}
+            for future in as_completed(futures):
+                future.result()  # Re-raises a worker's error
+                done += futures[future]
+                if progress:
+                    progress((done, total))
+
+        return _combine(parts, output_path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _combine(parts: List[str], output_path: str) -> str:
+    """Merge the rendered parts into output_path, or zip them without pypdf"""
+    if PdfWriter is not None:
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(part)
+        with open(output_path, 'wb') as f:
+            writer.write(f)
+        return output_path
+
+    zip_path = f"{os.path.splitext(output_path)[0]}.zip"
+    name = os.path.splitext(os.path.basename(output_path))[0]
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for n, part in enumerate(parts, start=1):
+            archive.write(part, f"{name}_{n:03d}.pdf")
+    return zip_path
\ No newline at end of file
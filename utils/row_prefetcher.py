@@ -0,0 +1,72 @@
+"""
+Row Prefetcher - Warms the cache for the rows a table is showing
+Watches a table's scroll position and contents and, once they settle,
+hands the student ids of the visible rows to a loader on a worker thread,
+so opening one of those rows is answered from the cache.
+"""
+from PyQt6.QtCore import QObject, QTimer
+
+from utils.task_runner import TaskRunner
+from utils.log import get_logger, TRACE
+
+logger = get_logger(__name__)
+
+
+class VisibleRowPrefetcher(QObject):
+    """Calls load(student_ids) in the background for the rows visible in table"""
+
+    # Wait this long after the last scroll or reload before prefetching
+    SETTLE_MS = 150
+
+    def __init__(self, table, student_id_at, load, parent=None):
+        """
+        table is a QTableView or QTableWidget; student_id_at(row) returns the
+        student id shown at row, or None; load runs on a worker thread.
+        """
+        super().__init__(parent)
+        self.table = table
+        self.student_id_at = student_id_at
+        self.load = load
+
+        # A runner of its own, so prefetching never shows the page as loading
+        self.tasks = TaskRunner(self)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.SETTLE_MS)
+        self._timer.timeout.connect(self._prefetch_visible)
+
+        table.verticalScrollBar().valueChanged.connect(self.schedule)
+        model = table.model()
+        for signal in (model.modelReset, model.rowsInserted, model.rowsRemoved, model.layoutChanged):
+            signal.connect(self.schedule)
+
+    def schedule(self, *_):
+        """Prefetch once the table has been still for SETTLE_MS"""
+        self._timer.start()
+
+    def _visible_ids(self) -> tuple:
+        rows = self.table.model().rowCount()
+        if not rows:
+            return ()
+        first = self.table.rowAt(0)
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        first = max(first, 0)
+        last = rows - 1 if last < 0 else last
+
+        ids = (self.student_id_at(row) for row in range(first, last + 1))
+        return tuple(student_id for student_id in ids if student_id)
+
+    def _prefetch_visible(self):
+        try:
+            ids = self._visible_ids()
+        except Exception as e:
+            logger.error("Error reading visible rows: %s", e)
+            return
+
+        # load skips ids that are still cached, so repeats cost no queries
+        if not ids:
+            return
+        logger.log(TRACE, "Prefetching %s visible rows", len(ids))
+        self.tasks.submit("prefetch", self.load, list(ids),
+                          on_error=lambda e: logger.error("Error prefetching rows: %s", e))
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Table Writer - Row-by-row CSV and Excel output
+Rows are written as they arrive, so exports of any size use constant memory.
+"""
+import csv
+import os
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # Excel export is optional
+    Workbook = None
+
+
+class TableWriter:
+    """Writes a header and rows to a .csv or .xlsx file"""
+
+    def __init__(self, path: str, headers: list, sheet_title: str = "Sheet1"):
+        self.path = path
+        self.extension = os.path.splitext(path)[1].lower()
+
+        if self.extension == '.csv':
+            self._file = open(path, 'w', newline='', encoding='utf-8-sig')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(headers)
+        elif self.extension == '.xlsx':
+            if Workbook is None:
+                raise ValueError("Excel export needs the openpyxl package (pip install openpyxl)")
+            # Write-only workbooks stream rows to disk instead of keeping cells in memory
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet(sheet_title)
+            self._sheet.append(headers)
+        else:
+            raise ValueError(f"Unsupported export type: {self.extension or path}")
+
+    def writerow(self, row):
+        if self.extension == '.csv':
+            self._writer.writerow(row)
+        else:
+            self._sheet.append(list(row))
+
+    def close(self):
+        if self.extension == '.csv':
+            self._file.close()
+        else:
+            self._workbook.save(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Task Runner - Runs model calls off the GUI thread
+Work is executed on a QThreadPool and results are delivered back to the
+GUI thread through Qt signals. Submitting a new task under the same key
+supersedes the previous one, so only the latest request updates the view.
+Writes go through submit_write instead, which never supersedes anything.
+Long jobs can report progress by accepting a progress callback.
+"""
+import itertools
+import traceback
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class _TaskSignals(QObject):
+    """Signals emitted from the worker thread"""
+    finished = pyqtSignal(object)  # result
+    failed = pyqtSignal(object, str)  # exception, formatted traceback
+    progress = pyqtSignal(object)  # whatever the task passes to progress()
+
+
+class _Task(QRunnable):
+    """A single unit of background work"""
+
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(e, traceback.format_exc())
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(result)
+
+
+class TaskRunner(QObject):
+    """Runs callables in the background, one active task per key"""
+
+    # Emits True when the first task starts and False when the last one ends
+    loading_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None, thread_pool: QThreadPool = None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._tasks = {}
+        self._write_ids = itertools.count(1)
+
+    def submit(self, key: str, fn, *args, on_result=None, on_error=None, on_progress=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) in the background, superseding any task under key.
+        With on_progress, fn is also given a progress= callback; each value
+        it is called with is delivered to on_progress on the GUI thread.
+        """
+        was_idle = not self._tasks
+        self._drop(key)
+
+        task = _Task(fn, args, kwargs)
+        if on_progress:
+            task.kwargs['progress'] = task.signals.progress.emit
+            task.signals.progress.connect(
+                lambda value, k=key, t=task: self._tasks.get(k) is t and on_progress(value)
+            )
+        task.signals.finished.connect(
+            lambda result, k=key, t=task: self._on_finished(k, t, result, on_result)
+        )
+        task.signals.failed.connect(
+            lambda error, tb, k=key, t=task: self._on_failed(k, t, error, tb, on_error)
+        )
+        self._tasks[key] = task
+        self.thread_pool.start(task)
+
+        if was_idle:
+            self.loading_changed.emit(True)
+
+    def submit_write(self, name: str, fn, *args, **kwargs) -> str:
+        """
+        Run a write in the background under a key of its own, so it is never
+        dropped or superseded by a later task; takes the same callbacks as
+        submit. Returns the key, e.g. for is_busy.
+        """
+        key = f"{name}#{next(self._write_ids)}"
+        self.submit(key, fn, *args, **kwargs)
+        return key
+
+    def cancel(self, key: str):
+        """Cancel the task under key; its result will be discarded"""
+        if self._drop(key) and not self._tasks:
+            self.loading_changed.emit(False)
+
+    def cancel_all(self):
+        """Cancel every pending task"""
+        for key in list(self._tasks):
+            self._drop(key)
+        self.loading_changed.emit(False)
+
+    def is_busy(self, key: str = None) -> bool:
+        """Check whether a task (or any task) is still running"""
+        if key is None:
+            return bool(self._tasks)
+        return key in self._tasks
+
+    def _drop(self, key: str) -> bool:
+        """Forget the task under key, removing it from the queue if not started"""
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return False
+        task.cancelled = True
+        self.thread_pool.tryTake(task)
+        return True
+
+    def _finish(self, key: str, task: _Task) -> bool:
+        """Mark task as done; returns False if it was superseded"""
+        if self._tasks.get(key) is not task:
+            return False
+        del self._tasks[key]
+        if not self._tasks:
+            self.loading_changed.emit(False)
+        return True
+
+    def _on_finished(self, key, task, result, on_result):
+        if self._finish(key, task) and on_result:
+            on_result(result)
+
+    def _on_failed(self, key, task, error, tb, on_error):
+        if not self._finish(key, task):
+            return
+        if on_error:
+            on_error(error)
+        else:
+            logger.error("Background task '%s' failed: %s\n%s", key, error, tb)
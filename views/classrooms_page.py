@@ -85,6 +85,11 @@ class ClassroomsPageUI(QWidget):
         """)
         filter_layout.addWidget(self.info_badge)
 
+        self.loading_label = QLabel("Loading...")
+        self.loading_label.setStyleSheet("color: #7F8C8D; border: none;")
+        self.loading_label.setVisible(False)
+        filter_layout.addWidget(self.loading_label)
+
         filter_layout.addStretch()
 
         # Strand Filter
@@ -230,6 +235,10 @@ class ClassroomsPageUI(QWidget):
             # Emit signal to load student data
             self.classroom_selected.emit(section_id, section_name)
 
+    def set_loading(self, loading: bool):
+        """Show or hide the loading indicator"""
+        self.loading_label.setVisible(loading)
+
     def switch_to_sections_view(self):
         """Switch to sections view"""
         self.current_view = "sections"
@@ -1,10 +1,11 @@
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QFrame, QGridLayout, QTableWidget,
-                             QHeaderView, QLineEdit, QPushButton)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+                             QFrame, QGridLayout, QTableView,
+                             QHeaderView, QLineEdit, QPushButton, QCompleter)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QStandardItemModel, QStandardItem
 from datetime import datetime
+from views.student_table import StudentTableModel, ActionButtonsDelegate
 
 
 class DashboardPageUI(QWidget):
@@ -12,6 +13,9 @@ class DashboardPageUI(QWidget):
     # Signals
     search_requested = pyqtSignal(str)  # Emits search query
     clear_search_requested = pyqtSignal()  # Emits when clear is clicked
+    typeahead_requested = pyqtSignal(str)  # Emits partial query while typing
+    suggestion_selected = pyqtSignal(int)  # Emits student_id of a chosen suggestion
+    view_requested = pyqtSignal(int)  # Emits student_id
     edit_requested = pyqtSignal(int, str)  # Emits (student_id, student_name)
     delete_requested = pyqtSignal(int, str)  # Emits (student_id, student_name)
 
@@ -114,6 +118,21 @@ class DashboardPageUI(QWidget):
         """)
         self.search_input.returnPressed.connect(self._on_search_pressed)
 
+        # Typeahead suggestions, requested once typing pauses
+        self._suggestion_ids = {}
+        self.suggestion_model = QStandardItemModel(self)
+        self.completer = QCompleter(self.suggestion_model, self)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(10)
+        self.completer.activated.connect(self._on_suggestion_activated)
+        self.search_input.setCompleter(self.completer)
+
+        self.typeahead_timer = QTimer(self)
+        self.typeahead_timer.setSingleShot(True)
+        self.typeahead_timer.setInterval(150)
+        self.typeahead_timer.timeout.connect(self._on_typeahead_timeout)
+        self.search_input.textEdited.connect(lambda: self.typeahead_timer.start())
+
         # Search button
         self.search_btn = QPushButton("Search")
         self.search_btn.setStyleSheet("""
@@ -181,9 +200,36 @@ class DashboardPageUI(QWidget):
             self.search_requested.emit(query)
             self.clear_search_btn.setVisible(True)
 
+    def _on_typeahead_timeout(self):
+        #Ask for suggestions once the user stops typing
+        query = self.search_input.text().strip()
+        if query and query not in self._suggestion_ids:
+            self.typeahead_requested.emit(query)
+
+    def show_suggestions(self, suggestions: list):
+        """Show (student_id, label) suggestions under the search bar"""
+        self.suggestion_model.clear()
+        self._suggestion_ids = {}
+        for student_id, label in suggestions:
+            self.suggestion_model.appendRow(QStandardItem(label))
+            self._suggestion_ids[label] = student_id
+
+        if suggestions:
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+    def _on_suggestion_activated(self, label: str):
+        #Open the chosen student
+        student_id = self._suggestion_ids.get(label)
+        if student_id is not None:
+            self.suggestion_selected.emit(student_id)
+
     def _on_clear_pressed(self):
         #Handle clear button press
         self.search_input.clear()
+        self.typeahead_timer.stop()
+        self.show_suggestions([])
         self.clear_search_btn.setVisible(False)
         self.clear_search_requested.emit()
 
@@ -302,16 +348,27 @@ class DashboardPageUI(QWidget):
         self.activity_live_label.setFont(QFont("Segoe UI", 10))
         self.activity_live_label.setStyleSheet("color: #5DADE2; border: none;")
 
+        self.loading_label = QLabel("Loading...")
+        self.loading_label.setFont(QFont("Segoe UI", 10))
+        self.loading_label.setStyleSheet("color: #7F8C8D; border: none;")
+        self.loading_label.setVisible(False)
+
         header_layout.addWidget(self.activity_title)
         header_layout.addStretch()
+        header_layout.addWidget(self.loading_label)
         header_layout.addWidget(self.activity_live_label)
 
         card_layout.addLayout(header_layout)
 
-        # Table with 4 columns (Name, Strand, Status, Actions) - Actions now has Edit + Delete
-        self.activity_table = QTableWidget()
-        self.activity_table.setColumnCount(4)
-        self.activity_table.setHorizontalHeaderLabels(["Student Name", "Strand", "Status", "Actions"])
+        # Table with 4 columns (Name, Strand, Status, Actions) - rows fetched as the user scrolls
+        self.activity_model = StudentTableModel(self)
+        self.activity_table = QTableView()
+        self.activity_table.setModel(self.activity_model)
+
+        # View/Edit/Delete buttons are painted, not per-row widgets
+        self.action_delegate = ActionButtonsDelegate(self.activity_table)
+        self.action_delegate.action_clicked.connect(self._on_row_action)
+        self.activity_table.setItemDelegateForColumn(StudentTableModel.ACTIONS_COLUMN, self.action_delegate)
 
         # Set column resize modes
         self.activity_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
@@ -321,12 +378,12 @@ class DashboardPageUI(QWidget):
         self.activity_table.setColumnWidth(3, 180)  # Wider for Edit + Delete buttons
 
         self.activity_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: none;
                 background-color: white;
                 gridline-color: #F0F0F0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px;
                 border-bottom: 1px solid #F0F0F0;
             }
@@ -340,7 +397,8 @@ class DashboardPageUI(QWidget):
             }
         """)
         self.activity_table.verticalHeader().setVisible(False)
-        self.activity_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.activity_table.verticalHeader().setDefaultSectionSize(50)
+        self.activity_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.activity_table.setAlternatingRowColors(True)
         self.activity_table.setMinimumHeight(300)
 
@@ -348,12 +406,26 @@ class DashboardPageUI(QWidget):
 
         return card
 
-    def set_search_results_mode(self, count: int):
+    def _on_row_action(self, action: str, row: int):
+        #Translate a painted button click into the matching signal
+        student = self.activity_model.row_data(row)
+        if action == "view":
+            self.view_requested.emit(student['id'])
+        elif action == "edit":
+            self.edit_requested.emit(student['id'], student['full_name'])
+        elif action == "delete":
+            self.delete_requested.emit(student['id'], student['full_name'])
+
+    def set_search_results_mode(self, count: int, more: bool = False):
         #Switch to search results display mode
-        self.activity_title.setText(f"Search Results ({count} found)")
+        self.activity_title.setText(f"Search Results ({count}{'+' if more else ''} found)")
         self.activity_live_label.setVisible(False)
 
     def set_recent_mode(self):
         #Switch back to recent enrollments mode
         self.activity_title.setText("Recent Enrollment Activity")
-        self.activity_live_label.setVisible(True)
\ No newline at end of file
+        self.activity_live_label.setVisible(True)
+
+    def set_loading(self, loading: bool):
+        #Show or hide the loading indicator while data is fetched
+        self.loading_label.setVisible(loading)
\ No newline at end of file
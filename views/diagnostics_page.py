@@ -0,0 +1,132 @@
+"""
+Diagnostics Page - Query timings per page and per statement (admin only)
+"""
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableWidget, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+
+
+class DiagnosticsPageUI(QWidget):
+
+    PAGE_COLUMNS = ["Page", "Visits", "Avg Switch (ms)", "Queries", "Query Time (ms)"]
+    STATEMENT_COLUMNS = ["Model Method", "Statement", "Calls", "Total (ms)",
+                         "Avg (ms)", "Max (ms)", "Rows"]
+
+    def __init__(self):
+        super().__init__()
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Create all UI elements"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(20)
+
+        # Header
+        header_layout = QHBoxLayout()
+
+        title = QLabel("Diagnostics")
+        title.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))
+        title.setStyleSheet("color: #2C3E50;")
+
+        admin_badge = QLabel("Admin Only")
+        admin_badge.setStyleSheet("""
+            background-color: white;
+            color: #E74C3C;
+            padding: 6px 12px;
+            border-radius: 6px;
+            border: 1px solid #E74C3C;
+            font-size: 11px;
+            font-weight: bold;
+        """)
+        admin_badge.setFixedHeight(30)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("color: #7F8C8D; font-size: 13px;")
+
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.refresh_btn.setStyleSheet(self._button_style("#365486"))
+
+        self.reset_btn = QPushButton("Reset")
+        self.reset_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.reset_btn.setStyleSheet(self._button_style("#E74C3C"))
+
+        header_layout.addWidget(title)
+        header_layout.addWidget(admin_badge)
+        header_layout.addStretch()
+        header_layout.addWidget(self.summary_label)
+        header_layout.addWidget(self.refresh_btn)
+        header_layout.addWidget(self.reset_btn)
+        layout.addLayout(header_layout)
+
+        # Per-page totals
+        layout.addWidget(self._section_label("Pages"))
+        self.pages_table = self._create_table(self.PAGE_COLUMNS)
+        self.pages_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.pages_table.setMaximumHeight(260)
+        layout.addWidget(self.pages_table)
+
+        # Per-statement totals
+        layout.addWidget(self._section_label("Statements"))
+        self.statements_table = self._create_table(self.STATEMENT_COLUMNS)
+        header = self.statements_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.statements_table, 1)
+
+        self.slow_log_label = QLabel("")
+        self.slow_log_label.setStyleSheet("color: #7F8C8D; font-size: 12px;")
+        self.slow_log_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(self.slow_log_label)
+
+    def _section_label(self, text: str) -> QLabel:
+        label = QLabel(text)
+        label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        label.setStyleSheet("color: #34495E;")
+        return label
+
+    def _create_table(self, columns: list) -> QTableWidget:
+        table = QTableWidget()
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setAlternatingRowColors(True)
+        table.setShowGrid(False)
+        table.setWordWrap(False)
+        table.setStyleSheet("""
+            QTableWidget {
+                background-color: white;
+                border: 1px solid #E0E0E0;
+                border-radius: 8px;
+            }
+            QHeaderView::section {
+                background-color: #F8F9FA;
+                padding: 8px;
+                border: none;
+                border-bottom: 2px solid #365486;
+                font-weight: bold;
+                color: #2C3E50;
+            }
+            QTableWidget::item {
+                padding: 6px;
+                color: #34495E;
+            }
+        """)
+        return table
+
+    def _button_style(self, bg_color: str) -> str:
+        return f"""
+            QPushButton {{
+                background-color: {bg_color};
+                color: white;
+                border: none;
+                padding: 8px 18px;
+                border-radius: 6px;
+                font-size: 13px;
+                font-weight: bold;
+            }}
+        """
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QComboBox, QPushButton, QFrame,
-                             QScrollArea, QDateEdit, QGraphicsDropShadowEffect)
+                             QScrollArea, QDateEdit, QGraphicsDropShadowEffect,
+                             QProgressBar)
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont, QColor
 
@@ -268,6 +269,20 @@ class EnrollmentPageUI(QWidget):
         self.print_btn.setMinimumHeight(48)
         self.print_btn.setFixedWidth(140)
 
+        self.import_btn = QPushButton("📥 Import")
+        self.import_btn.setToolTip("Enroll applicants from a CSV or Excel file")
+        self.import_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.import_btn.setStyleSheet(self._secondary_button_style())
+        self.import_btn.setMinimumHeight(48)
+        self.import_btn.setFixedWidth(140)
+
+        self.batch_print_btn = QPushButton("🖨 Print Batch")
+        self.batch_print_btn.setToolTip("Print registration forms for a section or date range")
+        self.batch_print_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.batch_print_btn.setStyleSheet(self._secondary_button_style())
+        self.batch_print_btn.setMinimumHeight(48)
+        self.batch_print_btn.setFixedWidth(140)
+
         self.enroll_btn = QPushButton("✓ Enroll Student")
         self.enroll_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.enroll_btn.setStyleSheet(self._primary_button_style())
@@ -276,10 +291,19 @@ class EnrollmentPageUI(QWidget):
 
         btn_layout.addWidget(self.clear_btn)
         btn_layout.addStretch()
+        btn_layout.addWidget(self.import_btn)
         btn_layout.addWidget(self.print_btn)
+        btn_layout.addWidget(self.batch_print_btn)
         btn_layout.addWidget(self.enroll_btn)
 
         self.main_layout.addLayout(btn_layout)
+
+        # Batch print progress, shown while forms are rendered
+        self.forms_progress = QProgressBar()
+        self.forms_progress.setTextVisible(True)
+        self.forms_progress.setMaximumHeight(18)
+        self.forms_progress.setVisible(False)
+        self.main_layout.addWidget(self.forms_progress)
         self.main_layout.addStretch()
 
         # Set scroll widget
@@ -290,6 +314,15 @@ class EnrollmentPageUI(QWidget):
         main_container_layout.setContentsMargins(0, 0, 0, 0)
         main_container_layout.addWidget(scroll)
 
+    def set_forms_progress(self, done: int, total: int):
+        self.forms_progress.setVisible(True)
+        self.forms_progress.setMaximum(max(total, 1))
+        self.forms_progress.setValue(min(done, max(total, 1)))
+        self.forms_progress.setFormat(f"Rendering forms... {done} / {total}")
+
+    def hide_forms_progress(self):
+        self.forms_progress.setVisible(False)
+
     def _create_section_header(self, text: str) -> QLabel:
         """Create a section header with clean styling"""
         label = QLabel(text)
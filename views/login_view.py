@@ -3,6 +3,9 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QPixmap, QIcon, QColor
 import os
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class LoginViewUI(QWidget):
@@ -97,15 +100,15 @@ class LoginViewUI(QWidget):
         icon_set = False
         for logo_path in possible_paths:
             if os.path.exists(logo_path):
-                print(f"✅ Setting window icon from: {logo_path}")
+                logger.debug("✅ Setting window icon from: %s", logo_path)
                 icon = QIcon(logo_path)
                 self.setWindowIcon(icon)
                 icon_set = True
                 break
 
         if not icon_set:
-            print("⚠️ Window icon not found. Using default icon.")
-            print("💡 Place 'school_logo.png' in project root to set custom icon")
+            logger.warning("⚠️ Window icon not found. Using default icon.")
+            logger.info("💡 Place 'school_logo.png' in project root to set custom icon")
 
     def _create_logo_widget(self) -> QLabel:
         """Create logo widget with circular background"""
@@ -121,7 +124,7 @@ class LoginViewUI(QWidget):
         logo_label.setFixedSize(100, 100)  # Logo size without background padding
 
         if os.path.exists(logo_path):
-            print(f"✅ Login logo found at: {logo_path}")
+            logger.debug("✅ Login logo found at: %s", logo_path)
             pixmap = QPixmap(logo_path)
             if not pixmap.isNull():
                 # Scale logo to fit nicely
@@ -141,13 +144,13 @@ class LoginViewUI(QWidget):
                 """)
 
             else:
-                print("❌ Failed to load login logo image")
+                logger.error("❌ Failed to load login logo image")
                 self._set_fallback_logo(logo_label)
         else:
-            print(f"❌ Login logo not found at: {logo_path}")
-            print("💡 Please save your logo as 'school_logo.png' in the project root")
-            print(f"💡 Current working directory: {os.getcwd()}")
-            print(f"💡 Script directory: {script_dir}")
+            logger.error("❌ Login logo not found at: %s", logo_path)
+            logger.info("💡 Please save your logo as 'school_logo.png' in the project root")
+            logger.info("💡 Current working directory: %s", os.getcwd())
+            logger.info("💡 Script directory: %s", script_dir)
             self._set_fallback_logo(logo_label)
 
         return logo_label
@@ -15,6 +15,7 @@ class ManagementPageUI(QWidget):
     delete_room_requested = pyqtSignal(int, str)
     add_section_requested = pyqtSignal(dict)
     delete_section_requested = pyqtSignal(int, str)
+    rollover_requested = pyqtSignal(int, str)  # target year id, year name
 
     def __init__(self):
         super().__init__()
@@ -313,6 +314,15 @@ class ManagementPageUI(QWidget):
         self.section_strand_combo.addItems(["STEM", "ABM", "HUMSS", "GAS", "TVL"])
         self.section_strand_combo.setStyleSheet(self._combo_style(is_small_screen))
 
+        self.section_grade_combo = QComboBox()
+        self.section_grade_combo.addItem("Grade 11", "11")
+        self.section_grade_combo.addItem("Grade 12", "12")
+        self.section_grade_combo.setStyleSheet(self._combo_style(is_small_screen))
+
+        self.section_year_combo = QComboBox()
+        self.section_year_combo.addItem("Any Year", None)
+        self.section_year_combo.setStyleSheet(self._combo_style(is_small_screen))
+
         self.section_capacity_input = QLineEdit()
         self.section_capacity_input.setPlaceholderText("Capacity *")
         self.section_capacity_input.setStyleSheet(self._input_style(is_small_screen))
@@ -333,6 +343,8 @@ class ManagementPageUI(QWidget):
 
         form_layout.addWidget(self.section_name_input, 2)
         form_layout.addWidget(self.section_strand_combo, 1)
+        form_layout.addWidget(self.section_grade_combo, 1)
+        form_layout.addWidget(self.section_year_combo, 1)
         form_layout.addWidget(self.section_capacity_input, 1)
         form_layout.addWidget(self.section_room_combo, 1)
         form_layout.addWidget(self.section_teacher_combo, 2)
@@ -341,6 +353,40 @@ class ManagementPageUI(QWidget):
         add_layout.addLayout(form_layout)
         layout.addWidget(add_frame)
 
+        # Academic Year Rollover
+        rollover_frame = QFrame()
+        rollover_frame.setStyleSheet("""
+            QFrame {
+                background-color: #FEF5E7;
+                border-radius: 10px;
+                border: 1px solid #F5B041;
+            }
+        """)
+        rollover_layout = QHBoxLayout(rollover_frame)
+        rollover_layout.setContentsMargins(20, 15, 20, 15)
+        rollover_layout.setSpacing(15)
+
+        rollover_title = QLabel("Roll Over to Next Year")
+        rollover_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        rollover_title.setStyleSheet("color: #2C3E50; border: none;")
+
+        rollover_hint = QLabel("Promotes enrolled Grade 11 students into Grade 12 sections")
+        rollover_hint.setStyleSheet("color: #7F8C8D; border: none;")
+
+        self.rollover_year_combo = QComboBox()
+        self.rollover_year_combo.setStyleSheet(self._combo_style(is_small_screen))
+
+        self.rollover_btn = QPushButton("Roll Over")
+        self.rollover_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.rollover_btn.setStyleSheet(self._button_style("#D68910", is_small_screen))
+        self.rollover_btn.clicked.connect(self._on_rollover)
+
+        rollover_layout.addWidget(rollover_title)
+        rollover_layout.addWidget(rollover_hint, 1)
+        rollover_layout.addWidget(self.rollover_year_combo, 1)
+        rollover_layout.addWidget(self.rollover_btn)
+        layout.addWidget(rollover_frame)
+
         # Sections Table
         self.sections_table = QTableWidget()
         self.sections_table.setColumnCount(7)
@@ -397,12 +443,20 @@ class ManagementPageUI(QWidget):
         data = {
             'section_name': self.section_name_input.text().strip(),
             'strand': self.section_strand_combo.currentText(),
+            'grade_level': self.section_grade_combo.currentData(),
+            'academic_year_id': self.section_year_combo.currentData(),
             'capacity': self.section_capacity_input.text().strip(),
             'room_id': room_id,
             'teacher_id': teacher_id
         }
         self.add_section_requested.emit(data)
 
+    def _on_rollover(self):
+        """Handle roll over button click"""
+        year_id = self.rollover_year_combo.currentData()
+        if year_id:
+            self.rollover_requested.emit(year_id, self.rollover_year_combo.currentText())
+
     def clear_teacher_form(self):
         """Clear teacher form inputs"""
         self.teacher_name_input.clear()
@@ -421,6 +475,8 @@ class ManagementPageUI(QWidget):
         """Clear section form inputs"""
         self.section_name_input.clear()
         self.section_strand_combo.setCurrentIndex(0)
+        self.section_grade_combo.setCurrentIndex(0)
+        self.section_year_combo.setCurrentIndex(0)
         self.section_capacity_input.clear()
         self.section_room_combo.setCurrentIndex(0)
         self.section_teacher_combo.setCurrentIndex(0)
@@ -9,6 +9,10 @@ from PyQt6.QtCore import Qt, pyqtSignal, QDate
 from PyQt6.QtGui import QFont
 from datetime import datetime
 from decimal import Decimal
+from utils.task_runner import TaskRunner
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class PaymentDialog(QDialog):
@@ -24,6 +28,7 @@ class PaymentDialog(QDialog):
         self.payment_history = payment_history
         self.academic_years = academic_years
         self.current_user_id = current_user_id
+        self.tasks = TaskRunner(self)
         self.setup_ui()
 
     def setup_ui(self):
@@ -567,40 +572,40 @@ class PaymentDialog(QDialog):
                 self.payment_recorded.emit(self.student_data.get('id'), payment_data)
 
         except Exception as e:
-            print(f"Error recording payment: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error recording payment: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to record payment:\n{str(e)}")
 
     def print_receipt(self, payment_data: dict):
         """Print receipt for a payment"""
-        try:
-            from models.payment import PaymentData
-            from utils.receipt_generator import generate_payment_receipt
-
-            # Generate receipt PDF
-            receipt_file = generate_payment_receipt(
-                payment_data,
-                self.student_data
-            )
-
-            if receipt_file:
-                QMessageBox.information(
-                    self,
-                    "✅ Receipt Generated",
-                    f"Receipt has been generated!\n\nFile: {receipt_file}"
-                )
-
-                # Try to open the PDF
-                import os
-                if os.name == 'nt':  # Windows
-                    os.startfile(receipt_file)
-                elif os.name == 'posix':  # macOS/Linux
-                    import subprocess
-                    subprocess.call(('open' if os.uname().sysname == 'Darwin' else 'xdg-open', receipt_file))
-
-        except Exception as e:
-            print(f"Error printing receipt: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(self, "Error", f"Failed to print receipt:\n{str(e)}")
\ No newline at end of file
+        from utils.receipt_generator import generate_payment_receipt
+
+        # Rendered in the background so the dialog stays responsive
+        self.tasks.submit(
+            f"receipt:{payment_data.get('id')}", generate_payment_receipt,
+            payment_data, self.student_data,
+            on_result=self._show_receipt,
+            on_error=self._show_receipt_error
+        )
+
+    def _show_receipt(self, receipt_file):
+        if not receipt_file:
+            QMessageBox.critical(self, "Error", "Failed to generate receipt.")
+            return
+
+        QMessageBox.information(
+            self,
+            "✅ Receipt Generated",
+            f"Receipt has been generated!\n\nFile: {receipt_file}"
+        )
+
+        # Try to open the PDF
+        import os
+        if os.name == 'nt':  # Windows
+            os.startfile(receipt_file)
+        elif os.name == 'posix':  # macOS/Linux
+            import subprocess
+            subprocess.call(('open' if os.uname().sysname == 'Darwin' else 'xdg-open', receipt_file))
+
+    def _show_receipt_error(self, error: Exception):
+        logger.error("Error printing receipt: %s", error)
+        QMessageBox.critical(self, "Error", f"Failed to print receipt:\n{str(error)}")
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Print Forms Dialog - Choose which students' registration forms to print
+"""
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QComboBox, QDateEdit, QCheckBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtGui import QFont
+
+
+class PrintFormsDialog(QDialog):
+    """Dialog for printing registration forms by section and/or date range"""
+
+    print_requested = pyqtSignal(dict)  # Emits section_id / start_date / end_date
+
+    def __init__(self, sections: list, parent=None):
+        super().__init__(parent)
+        self.sections = sections
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the dialog UI"""
+        self.setWindowTitle("Print Registration Forms")
+        self.setMinimumSize(480, 360)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(20)
+        layout.setContentsMargins(30, 30, 30, 30)
+
+        # Title
+        title = QLabel("🖨 Print Registration Forms")
+        title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        title.setStyleSheet("color: #2C3E50;")
+        layout.addWidget(title)
+
+        # Section
+        section_label = QLabel("Section:")
+        section_label.setFont(QFont("Segoe UI", 10, QFont.Weight.DemiBold))
+        self.section_combo = QComboBox()
+        self.section_combo.addItem("All Sections", None)
+        for section in self.sections:
+            self.section_combo.addItem(f"{section.strand} - {section.section_name}", section.id)
+        self.section_combo.setStyleSheet(self._combo_style())
+        self.section_combo.setMinimumHeight(40)
+        layout.addWidget(section_label)
+        layout.addWidget(self.section_combo)
+
+        # Enrollment date range
+        self.date_check = QCheckBox("Only students enrolled between:")
+        self.date_check.setFont(QFont("Segoe UI", 10, QFont.Weight.DemiBold))
+        layout.addWidget(self.date_check)
+
+        dates = QHBoxLayout()
+        dates.setSpacing(15)
+        self.start_date = QDateEdit(QDate.currentDate())
+        self.end_date = QDateEdit(QDate.currentDate())
+        for edit in (self.start_date, self.end_date):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("yyyy-MM-dd")
+            edit.setMinimumHeight(40)
+            edit.setEnabled(False)
+            self.date_check.toggled.connect(edit.setEnabled)
+        dates.addWidget(self.start_date)
+        dates.addWidget(QLabel("to"))
+        dates.addWidget(self.end_date)
+        layout.addLayout(dates)
+
+        layout.addStretch()
+
+        # Buttons
+        button_layout = QHBoxLayout()
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setMinimumHeight(45)
+        cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        cancel_btn.setStyleSheet(self._button_style("#6B7280", "#4B5563"))
+        cancel_btn.clicked.connect(self.reject)
+
+        self.print_btn = QPushButton("🖨 Print")
+        self.print_btn.setMinimumHeight(45)
+        self.print_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.print_btn.setStyleSheet(self._button_style("#3B82F6", "#2563EB"))
+        self.print_btn.clicked.connect(self.request_print)
+
+        button_layout.addWidget(cancel_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(self.print_btn)
+        layout.addLayout(button_layout)
+
+    def _combo_style(self):
+        return """
+            QComboBox {
+                background-color: white;
+                border: 2px solid #E5E7EB;
+                padding: 10px;
+                border-radius: 8px;
+                font-size: 13px;
+            }
+            QComboBox:focus { border: 2px solid #3B82F6; }
+        """
+
+    def _button_style(self, bg: str, hover: str):
+        return f"""
+            QPushButton {{
+                background-color: {bg};
+                color: white;
+                border: none;
+                padding: 12px 24px;
+                border-radius: 8px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{ background-color: {hover}; }}
+        """
+
+    def request_print(self):
+        """Emit the selection and close"""
+        selection = {'section_id': self.section_combo.currentData(),
+                     'start_date': None, 'end_date': None}
+        if self.date_check.isChecked():
+            start = self.start_date.date().toString("yyyy-MM-dd")
+            end = self.end_date.date().toString("yyyy-MM-dd")
+            selection['start_date'], selection['end_date'] = min(start, end), max(start, end)
+
+        self.print_requested.emit(selection)
+        self.accept()
\ No newline at end of file
@@ -8,6 +8,9 @@ from PyQt6.QtCore import Qt, pyqtSignal, QDate
 from PyQt6.QtGui import QFont
 from decimal import Decimal
 from datetime import date
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class RecordPaymentDialog(QDialog):
@@ -388,7 +391,5 @@ class RecordPaymentDialog(QDialog):
             self.accept()
 
         except Exception as e:
-            print(f"Error recording payment: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error recording payment: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to record payment:\n{str(e)}")
\ No newline at end of file
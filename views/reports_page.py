@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QFrame, QPushButton, QComboBox, QGridLayout, QScrollArea)
+                             QFrame, QPushButton, QComboBox, QGridLayout, QScrollArea,
+                             QProgressBar)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
@@ -73,6 +74,11 @@ class ReportsPageUI(QWidget):
 
         action_layout.addStretch()
 
+        self.loading_label = QLabel("Loading...")
+        self.loading_label.setStyleSheet("color: #7F8C8D; border: none;")
+        self.loading_label.setVisible(False)
+        action_layout.addWidget(self.loading_label)
+
         self.generate_btn = QPushButton("Generate Report")
         self.generate_btn.setStyleSheet(self._button_style("#365486"))
         self.generate_btn.setMinimumWidth(150)
@@ -84,8 +90,27 @@ class ReportsPageUI(QWidget):
         self.export_btn.setMinimumWidth(150)
         self.export_btn.setEnabled(False)
         action_layout.addWidget(self.export_btn)
+
+        self.roster_btn = QPushButton("Export Roster")
+        self.roster_btn.setToolTip("Save the full student master list as CSV or Excel")
+        self.roster_btn.setStyleSheet(self._button_style("#27AE60"))
+        self.roster_btn.setMinimumWidth(150)
+        action_layout.addWidget(self.roster_btn)
+
+        self.receipts_btn = QPushButton("Export Receipts")
+        self.receipts_btn.setToolTip("Save the receipts of the payments in the selected date range as one PDF")
+        self.receipts_btn.setStyleSheet(self._button_style("#8E44AD"))
+        self.receipts_btn.setMinimumWidth(150)
+        action_layout.addWidget(self.receipts_btn)
         self.main_layout.addLayout(action_layout)
 
+        # Roster and receipt export progress, shown while an export runs
+        self.export_progress = QProgressBar()
+        self.export_progress.setTextVisible(True)
+        self.export_progress.setMaximumHeight(18)
+        self.export_progress.setVisible(False)
+        self.main_layout.addWidget(self.export_progress)
+
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
@@ -107,6 +132,18 @@ class ReportsPageUI(QWidget):
         self.main_layout.addWidget(self.scroll, stretch=1)
 
 
+    def set_loading(self, loading: bool):
+        self.loading_label.setVisible(loading)
+
+    def set_export_progress(self, written: int, total: int, label: str = "Exporting roster"):
+        self.export_progress.setVisible(True)
+        self.export_progress.setMaximum(max(total, 1))
+        self.export_progress.setValue(min(written, max(total, 1)))
+        self.export_progress.setFormat(f"{label}... {written} / {total}")
+
+    def hide_export_progress(self):
+        self.export_progress.setVisible(False)
+
     def _create_placeholder(self) -> QWidget:
         placeholder = QWidget()
         layout = QVBoxLayout(placeholder)
@@ -225,6 +225,14 @@ class SidebarUI(QWidget):
         """)
         nav_layout.addWidget(self.users_btn)
 
+        # Diagnostics button - Admin only
+        self.diagnostics_btn = QPushButton("Diagnostics")
+        self.diagnostics_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.diagnostics_btn.setObjectName("diagnostics_btn")
+        self.diagnostics_btn.setVisible(False)
+        self.diagnostics_btn.setStyleSheet(self.users_btn.styleSheet())
+        nav_layout.addWidget(self.diagnostics_btn)
+
         nav_layout.addStretch()
         return nav_widget
 
@@ -273,5 +281,6 @@ class SidebarUI(QWidget):
     def show_admin_features(self, show: bool = True):
         #Show or hide admin-only features
         self.users_btn.setVisible(show)
+        self.diagnostics_btn.setVisible(show)
         self.admin_separator.setVisible(show)
         self.admin_label.setVisible(show)
\ No newline at end of file
@@ -7,6 +7,8 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QScrollArea, QWidget, QMessageBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
+from models import events
+from utils.qt_events import EventBridge
 
 class StudentDetailsDialog(QDialog):
     payment_updated = pyqtSignal(int, str)
@@ -17,12 +19,20 @@ class StudentDetailsDialog(QDialog):
     payment_updated = pyqtSignal(int, str)  # student_id, new_status
     student_updated = pyqtSignal(int, dict)  # student_id, updated_data
 
-    def __init__(self, student_data: dict, parent=None):
+    def __init__(self, student_data: dict, parent=None, profile=None):
         super().__init__(parent)
         self.student_data = student_data
+        self.profile = profile  # StudentProfile with payment totals and history, if loaded
         self.edit_mode = False
         self.setup_ui()
 
+        # Show payments posted or changed while the dialog is open
+        self.events = EventBridge([
+            events.PAYMENT_POSTED, events.PAYMENT_REVERSED, events.PAYMENT_STATUS_CHANGED
+        ], self)
+        self.events.received.connect(self._on_payment_event)
+        self.finished.connect(self.events.deleteLater)
+
     def setup_ui(self):
         """Setup the dialog UI"""
         self.setWindowTitle(f"Student Details - {self.student_data.get('full_name', 'Unknown')}")
@@ -342,6 +352,16 @@ class StudentDetailsDialog(QDialog):
         mode_label.setStyleSheet("color: #6B7280; font-size: 11px; background: transparent; border: none;")
         layout.addWidget(mode_label)
 
+        # Balance and payment count
+        self.balance_label = None
+        if self.profile:
+            summary = self.profile.payment_summary
+            self._payment_count = len(self.profile.payments)
+            self.balance_label = QLabel()
+            self.balance_label.setStyleSheet("color: #6B7280; font-size: 11px; background: transparent; border: none;")
+            self._show_balance(summary['balance'])
+            layout.addWidget(self.balance_label)
+
         # Add some spacing
         layout.addSpacing(20)
 
@@ -444,20 +464,46 @@ class StudentDetailsDialog(QDialog):
             self.payment_updated.emit(student_id, new_status)
 
             # Update display
-            self.student_data['payment_status'] = new_status
-            status_color = '#27AE60' if new_status == 'Paid' else '#F39C12'
-            self.status_display.setText(new_status)
-            self.status_display.setStyleSheet(f"""
-                background-color: {status_color};
-                color: white;
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                border: none;
-            """)
+            self._show_payment_status(new_status)
 
             QMessageBox.information(
                 self,
                 "✅ Success",
                 f"Payment status updated to '{new_status}' successfully!"
-            )
\ No newline at end of file
+            )
+
+    def _show_payment_status(self, payment_status: str):
+        """Show payment_status on the status badge"""
+        # student_data may be shared with the query cache, so copy it
+        self.student_data = {**self.student_data, 'payment_status': payment_status}
+        status_color = '#27AE60' if payment_status == 'Paid' else '#F39C12'
+        self.status_display.setText(payment_status)
+        self.status_display.setStyleSheet(f"""
+            background-color: {status_color};
+            color: white;
+            padding: 8px 20px;
+            border-radius: 6px;
+            font-weight: bold;
+            border: none;
+        """)
+
+    def _show_balance(self, balance: float):
+        """Show balance against the profile's total fees"""
+        total_fees = self.profile.payment_summary['total_fees']
+        self.balance_label.setText(
+            f"Balance: ₱{balance:,.2f} of ₱{total_fees:,.2f}  •  "
+            f"{self._payment_count} payment(s) recorded"
+        )
+
+    def _on_payment_event(self, topic: str, payload: dict):
+        """Apply a payment posted, reversed or changed for this student"""
+        if payload['student_id'] != self.student_data.get('id'):
+            return
+
+        if payload['payment_status']:
+            self._show_payment_status(payload['payment_status'])
+            self.payment_combo.setCurrentText(payload['payment_status'])
+
+        if self.balance_label is not None and topic != events.PAYMENT_STATUS_CHANGED:
+            self._payment_count += 1 if topic == events.PAYMENT_POSTED else -1
+            self._show_balance(payload['balance'])
\ No newline at end of file
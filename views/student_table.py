@@ -0,0 +1,215 @@
+"""
+Student Table - Model/view table for large student lists
+Rows are handed to the view in batches as the user scrolls, and the
+View/Edit/Delete buttons are painted by a delegate instead of being
+separate widgets, so memory stays flat however many rows are loaded.
+"""
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QEvent, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QFont
+
+from models.rows import Row
+
+
+class StudentTableModel(QAbstractTableModel):
+    """Name / Strand / Date / Actions rows backed by a list of student rows (Row objects or dicts)"""
+
+    HEADERS = ["Student Name", "Strand", "Status", "Actions"]
+    ACTIONS_COLUMN = 3
+    BATCH_SIZE = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._visible = 0  # rows handed to the view so far
+        self._next_page = None  # loads the next page from the database
+        self._requesting = False
+
+    def set_rows(self, rows: list, next_page=None):
+        """
+        Replace the table contents; rows without an id are skipped.
+        next_page, if given, is called once the view scrolls past the last
+        row and should hand the following page to append_rows().
+        """
+        self.beginResetModel()
+        self._rows = [row for row in rows if row.get('id')]
+        self._visible = min(self.BATCH_SIZE, len(self._rows))
+        self._next_page = next_page
+        self._requesting = False
+        self.endResetModel()
+
+    def append_rows(self, rows: list, next_page=None):
+        """Add a page loaded by next_page to the end of the table"""
+        rows = [row for row in rows if row.get('id')]
+        self._next_page = next_page
+        self._requesting = False
+        if not rows:
+            return
+
+        # Hidden rows from the previous batch are shown along with the new page
+        first = self._visible
+        self._rows.extend(rows)
+        self.beginInsertRows(QModelIndex(), first, len(self._rows) - 1)
+        self._visible = len(self._rows)
+        self.endInsertRows()
+
+    def prepend_row(self, row, limit: int = None):
+        """Insert row at the top, dropping rows past limit from the bottom"""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, row)
+        self._visible += 1
+        self.endInsertRows()
+
+        while limit is not None and len(self._rows) > limit:
+            self._remove_at(len(self._rows) - 1)
+
+    def update_row(self, student_id: int, changes: dict):
+        """Merge changes into the row of student_id, if it is in the table"""
+        row = self._find(student_id)
+        if row < 0:
+            return
+        # Rows may be shared with the query cache, so replace rather than mutate
+        current = self._rows[row]
+        self._rows[row] = current.replace(**changes) if isinstance(current, Row) else {**current, **changes}
+        if row < self._visible:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove_row(self, student_id: int):
+        """Remove the row of student_id, if it is in the table"""
+        row = self._find(student_id)
+        if row >= 0:
+            self._remove_at(row)
+
+    def _find(self, student_id: int) -> int:
+        for row, student in enumerate(self._rows):
+            if student.get('id') == student_id:
+                return row
+        return -1
+
+    def _remove_at(self, row: int):
+        if row >= self._visible:
+            del self._rows[row]
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._visible -= 1
+        self.endRemoveRows()
+
+    def has_more_pages(self) -> bool:
+        """Whether more rows can still be loaded from the database"""
+        return self._next_page is not None
+
+    def row_data(self, row: int) -> dict:
+        """The student dict shown at row"""
+        return self._rows[row]
+
+    def total_rows(self) -> int:
+        """Number of rows, including those not fetched by the view yet"""
+        return len(self._rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._visible
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        if self._visible < len(self._rows):
+            return True
+        return self._next_page is not None and not self._requesting
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, len(self._rows) - self._visible)
+        if count <= 0:
+            if self._next_page is not None and not self._requesting:
+                self._requesting = True
+                self._next_page()
+            return
+        self.beginInsertRows(QModelIndex(), self._visible, self._visible + count - 1)
+        self._visible += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._visible:
+            return None
+
+        student = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return student.get('full_name')
+            if column == 1:
+                return student.get('strand')
+            if column == 2:
+                return str(student['date']) if student.get('date') else 'N/A'
+        elif role == Qt.ItemDataRole.UserRole:
+            return student['id']
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column in (1, 2):
+            return Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """Paints View/Edit/Delete buttons and reports which one was clicked"""
+
+    # Emits (action, row) where action is "view", "edit" or "delete"
+    action_clicked = pyqtSignal(str, int)
+
+    BUTTONS = [
+        ("view", "View", "#16A085"),
+        ("edit", "Edit", "#3498DB"),
+        ("delete", "Delete", "#E74C3C"),
+    ]
+    BUTTON_WIDTH = 52
+    BUTTON_HEIGHT = 26
+    SPACING = 5
+
+    def _button_rects(self, cell: QRect) -> list:
+        """(action, label, color, rect) for each button inside cell"""
+        top = cell.top() + (cell.height() - self.BUTTON_HEIGHT) // 2
+        left = cell.left() + self.SPACING
+        rects = []
+        for action, label, color in self.BUTTONS:
+            rects.append((action, label, color, QRect(left, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)))
+            left += self.BUTTON_WIDTH + self.SPACING
+        return rects
+
+    def paint(self, painter: QPainter, option, index):
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(QFont("Segoe UI", 9))
+        for _, label, color, rect in self._button_rects(option.rect):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position().toPoint()
+            for action, _, _, rect in self._button_rects(option.rect):
+                if rect.contains(pos):
+                    self.action_clicked.emit(action, index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
\ No newline at end of file